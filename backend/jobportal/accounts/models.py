@@ -50,6 +50,23 @@ class CandidateProfile(models.Model):
     experience = models.IntegerField(default=0)
     resume = models.FileField(upload_to="resumes/", blank=True, null=True)
 
+    # 🔹 Notification emails: one per update, or a digest (jobs.digests)
+    EMAIL_FREQUENCY_CHOICES = (
+        ("immediate", "Immediately"),
+        ("daily", "Daily digest"),
+        ("weekly", "Weekly digest"),
+    )
+    email_frequency = models.CharField(
+        max_length=10, choices=EMAIL_FREQUENCY_CHOICES, default="immediate"
+    )
+    # notifications after this go into the next digest
+    digest_sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["email_frequency", "digest_sent_at"], name="candidate_digest_due_idx"),
+        ]
+
     def __str__(self):
         return self.user.username
 
@@ -1,3 +1,4 @@
+from django.utils import timezone
 from rest_framework import serializers
 from .models import User, Company, CandidateProfile, RecruiterProfile
 
@@ -94,12 +95,20 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
             "skills",
             "experience",
             "resume",
+            "email_frequency",  # "immediate" | "daily" | "weekly"
         ]
         read_only_fields = ["user", "username", "email"]
         extra_kwargs = {
             "resume": {"required": False, "allow_null": True},
         }
 
+    def update(self, instance, validated_data):
+        # switching to a digest: it starts with what arrives from now on
+        frequency = validated_data.get("email_frequency", instance.email_frequency)
+        if instance.email_frequency == "immediate" and frequency != "immediate":
+            validated_data["digest_sent_at"] = timezone.now()
+        return super().update(instance, validated_data)
+
 
 class RecruiterProfileSerializer(serializers.ModelSerializer):
     """
@@ -153,6 +153,76 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Job list / detail are rendered from .values() + orjson (jobs.fast_render);
+# the output is byte-identical to the serializers. False = always serializers.
+FAST_JSON_RENDERING = True
+
+# Keyset pagination for list endpoints (jobs.pagination.KeysetPagination)
+JOBS_PAGE_SIZE = 20        # default, ?page_size= overrides
+JOBS_MAX_PAGE_SIZE = 100
+
+# Background tasks (jobs.tasks) are run by `python manage.py run_tasks`.
+# Set to True to run them in-process right after commit instead.
+BACKGROUND_TASKS_EAGER = os.getenv("BACKGROUND_TASKS_EAGER", "False") == "True"
+
+# Shared pools of generated test questions (jobs.question_bank)
+QUESTION_BANK_TEST_SIZE = 25
+QUESTION_BANK_MIN_POOL = 50     # ask Groq for more below this
+QUESTION_BANK_MAX_POOL = 200
+QUESTION_BANK_MAX_BANKS = 1000  # least recently used banks dropped past this
+QUESTION_BANK_TTL_DAYS = 30
+
+# Anonymous job list / detail responses (jobs.response_cache), dropped by
+# Job / Company save + delete signals; TTL only bounds races with writes.
+# locmem is per process: invalidations reach the process that made the
+# change only. Use "file" (one host) or "redis" (RESPONSE_CACHE_LOCATION =
+# redis://...) to share the cache between workers.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "True") == "True"
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "locmem")
+_RESPONSE_CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "responses"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", "/tmp/jobportal-responses"),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/1"),
+}
+
+# Notification stream /api/alerts/stream/ (jobs.events), served under ASGI.
+# Each web process polls once per SSE_POLL_INTERVAL seconds for new
+# notifications and fans them out to its connections; a connection more
+# than SSE_QUEUE_SIZE events behind is closed (the client resumes).
+SSE_POLL_INTERVAL = 1.0
+SSE_QUEUE_SIZE = 100
+SSE_HEARTBEAT = 15
+
+# Notification retention (`python manage.py archive_notifications`, daily):
+# job alert notifications move to a compact archive table once read and this
+# old, or unread and MAX_AGE old. The inbox still lists archived ones.
+NOTIFICATION_READ_RETENTION_DAYS = 30
+NOTIFICATION_MAX_AGE_DAYS = 180
+NOTIFICATION_ARCHIVE_BATCH_SIZE = 1000
+
+# Per-candidate recommendation lists (jobs.recommendation_cache).
+# LocMemCache evicts least recently used entries past MAX_ENTRIES; it is
+# per-process, point this at Redis/Memcached to share it between workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "recommendations": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "recommendations",
+        "TIMEOUT": int(os.getenv("RECOMMENDATION_CACHE_TTL", 3600)),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("RECOMMENDATION_CACHE_SIZE", 10000))},
+    },
+    "responses": {
+        "BACKEND": _RESPONSE_CACHE_BACKENDS[RESPONSE_CACHE_BACKEND][0],
+        "LOCATION": os.getenv(
+            "RESPONSE_CACHE_LOCATION", _RESPONSE_CACHE_BACKENDS[RESPONSE_CACHE_BACKEND][1]
+        ),
+        "TIMEOUT": int(os.getenv("RESPONSE_CACHE_TTL", 300)),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("RESPONSE_CACHE_SIZE", 5000))},
+    },
+}
+
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -164,6 +234,22 @@ MEDIA_ROOT = BASE_DIR / "media"
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "no-reply@jobportal.com"
 
+# Emails are queued in the EmailOutbox table with the change they report and
+# sent by `python manage.py send_outbox`, BATCH_SIZE per backend connection.
+# Failures retry after RETRY_DELAY seconds, doubling; dead after MAX_ATTEMPTS.
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 60
+
+# Candidates can trade per-update emails for a daily / weekly digest
+# (CandidateProfile.email_frequency), queued by `python manage.py send_digests`.
+DIGEST_MAX_ITEMS = 20     # lines per section, the rest is "... and N more"
+DIGEST_CHUNK_SIZE = 500   # candidates rendered per transaction
+
+# POST /api/applications/bulk-status/ moves at most this many applications
+# per request (a filter that matches more is applied in several requests).
+BULK_STATUS_MAX_APPLICATIONS = 1000
+
 
 
 GROOK_API_KEY = os.getenv("GROOK_API_KEY")
@@ -18,9 +18,16 @@ from jobs.views import (
     RecruiterApplicationsView,
     InterviewViewSet,
     RecruiterAnalyticsView,
+    RecruiterAnalyticsSeriesView,
     # 🔹 NEW imports
     CandidateApplicationStatusNotificationListView,
     MarkApplicationStatusNotificationReadView,
+    UnreadNotificationCountView,
+    NotificationInboxView,
+    InboxMarkReadView,
+    notification_stream,
+    CacheStatsView,
+    EmailOutboxStatsView,
 )
 
 from accounts.views import (
@@ -48,6 +55,10 @@ urlpatterns = [
     path("api/auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/auth/me/", MeView.as_view()),
 
+    # cache metrics (staff)
+    path("api/admin/cache-stats/", CacheStatsView.as_view(), name="cache-stats"),
+    path("api/admin/email-outbox/", EmailOutboxStatsView.as_view(), name="email-outbox-stats"),
+
     # candidate profile
     path("api/candidate/profile/", CandidateProfileView.as_view()),
 
@@ -57,6 +68,11 @@ urlpatterns = [
     path("api/recruiter/applications/", RecruiterApplicationsView.as_view()),
     path("api/recruiter/company/", RecruiterCompanyView.as_view(), name="recruiter-company"),
     path("api/recruiter/analytics/", RecruiterAnalyticsView.as_view(), name="recruiter-analytics"),
+    path(
+        "api/recruiter/analytics/series/",
+        RecruiterAnalyticsSeriesView.as_view(),
+        name="recruiter-analytics-series",
+    ),
 
     # Saved jobs
     path("api/saved/", SavedJobListView.as_view(), name="saved-jobs"),
@@ -68,6 +84,10 @@ urlpatterns = [
     path("api/alerts/<int:pk>/", CandidateJobAlertDetailView.as_view(), name="job-alert-detail"),
     path("api/alerts/notifications/", CandidateNotificationListView.as_view(), name="job-alert-notifications"),
     path("api/alerts/notifications/<int:pk>/read/", MarkNotificationReadView.as_view(), name="job-alert-notification-read"),
+    path("api/alerts/unread-count/", UnreadNotificationCountView.as_view(), name="unread-notification-count"),
+    path("api/alerts/stream/", notification_stream, name="notification-stream"),
+    path("api/alerts/inbox/", NotificationInboxView.as_view(), name="notification-inbox"),
+    path("api/alerts/inbox/read/", InboxMarkReadView.as_view(), name="notification-inbox-read"),
 
     # 🔹 NEW: Application status notifications (backend mirror of the emails)
     path(
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Job, Application, JobTest, JobTestQuestion, JobTestAnswer
+from .models import (
+    Job, Application, JobTest, JobTestQuestion, JobTestAnswer, Skill, BackgroundTask,
+    QuestionBank,
+)
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
@@ -27,4 +30,26 @@ class JobTestQuestionAdmin(admin.ModelAdmin):
 
 @admin.register(JobTestAnswer)
 class JobTestAnswerAdmin(admin.ModelAdmin):
-    list_display = ("application", "question", "selected_option", "created_at")
\ No newline at end of file
+    list_display = ("application", "question", "selected_option", "created_at")
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+@admin.register(BackgroundTask)
+class BackgroundTaskAdmin(admin.ModelAdmin):
+    list_display = (
+        "name", "status", "progress_done", "progress_total",
+        "attempts", "run_after", "created_at", "finished_at",
+    )
+    list_filter = ("status", "name")
+
+
+@admin.register(QuestionBank)
+class QuestionBankAdmin(admin.ModelAdmin):
+    # deleting a bank forces fresh questions for that skill set
+    list_display = ("skills", "created_at", "refreshed_at", "last_used_at")
+    search_fields = ("skills",)
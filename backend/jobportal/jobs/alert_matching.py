@@ -0,0 +1,111 @@
+# jobportal/jobs/alert_matching.py
+
+from .models import JobAlert, JobAlertTerm
+from .text_utils import tokenize, split_terms, ngrams
+
+# Longest keyword phrase (in words) that can match, e.g. "rest api design".
+MAX_TERM_WORDS = 5
+
+# Keep IN (...) lists under SQLite's host-parameter limit.
+LOOKUP_CHUNK_SIZE = 500
+
+
+def alert_terms(alert):
+    """
+    Normalized keyword terms of an alert; [""] means "match every job".
+
+    Phrases longer than MAX_TERM_WORDS can never be found among a job's
+    n-grams, so they are left out of the index. An alert made only of such
+    phrases gets no terms (it matches nothing), never the match-all row.
+    """
+    terms = split_terms(alert.keywords)
+    if not terms:
+        return [""]
+    return [t for t in terms if len(t.split()) <= MAX_TERM_WORDS]
+
+
+def _term_rows(alert):
+    location = (alert.location or "").strip().lower()
+    job_type = (alert.job_type or "").strip().lower()
+    return [
+        JobAlertTerm(
+            alert_id=alert.pk,
+            candidate_id=alert.candidate_id,
+            term=term,
+            location=location,
+            job_type=job_type,
+        )
+        for term in alert_terms(alert)
+    ]
+
+
+# ===========================
+#   INDEX MAINTENANCE
+# ===========================
+
+def index_alert(alert):
+    """Replace the index rows of one alert (inactive alerts get none)."""
+    JobAlertTerm.objects.filter(alert_id=alert.pk).delete()
+    if alert.is_active:
+        JobAlertTerm.objects.bulk_create(_term_rows(alert))
+
+
+def rebuild_alert_index(batch_size=2000):
+    """Re-create the whole index from JobAlert (after bulk loads)."""
+    JobAlertTerm.objects.all().delete()
+    rows = []
+    total = 0
+    for alert in JobAlert.objects.filter(is_active=True).iterator(chunk_size=batch_size):
+        rows.extend(_term_rows(alert))
+        if len(rows) >= batch_size:
+            JobAlertTerm.objects.bulk_create(rows)
+            total += len(rows)
+            rows = []
+    if rows:
+        JobAlertTerm.objects.bulk_create(rows)
+        total += len(rows)
+    return total
+
+
+# ===========================
+#   MATCHING
+# ===========================
+
+def job_terms(job):
+    """
+    Every word n-gram (1..MAX_TERM_WORDS) of the job's title + description,
+    i.e. every keyword phrase that could appear in it.
+    """
+    tokens = tokenize(f"{job.title} {job.description}")
+    return set(ngrams(tokens, MAX_TERM_WORDS))
+
+
+def match_alerts(job):
+    """
+    Active alerts matching `job`, as a list of (alert_id, candidate_id).
+
+    A job matches an alert when one of the alert's keywords occurs in the
+    title/description as whole words, the alert location (if any) is part
+    of the job location and the alert job type (if any) equals it.
+
+    Cost: one indexed lookup per LOOKUP_CHUNK_SIZE distinct job n-grams,
+    plus the matched rows – independent of the total number of alerts.
+    """
+    job_location = (job.location or "").lower()
+    job_type = (job.job_type or "").strip().lower()
+
+    terms = [""] + sorted(job_terms(job))
+    matched = {}
+    for start in range(0, len(terms), LOOKUP_CHUNK_SIZE):
+        chunk = terms[start : start + LOOKUP_CHUNK_SIZE]
+        rows = JobAlertTerm.objects.filter(
+            term__in=chunk, job_type__in=["", job_type]
+        ).values_list("alert_id", "candidate_id", "location")
+        for alert_id, candidate_id, location in rows:
+            if alert_id in matched:
+                continue
+            if location and location not in job_location:
+                continue
+            matched[alert_id] = candidate_id
+
+    return list(matched.items())
@@ -0,0 +1,270 @@
+# jobportal/jobs/analytics_utils.py
+
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from accounts.models import Company
+from .models import Application, ApplicationDailyRollup, ApplicationPeriodRollup, Job
+
+BUILD_CHUNK_SIZE = 1000
+# rollup rows moved per UPDATE in add_many (one OR / CASE arm each)
+UPDATE_CHUNK_SIZE = 200
+
+INTERVALS = ("day", "week", "month")
+PERIOD_INTERVALS = ("week", "month")  # kept in ApplicationPeriodRollup
+
+
+def application_day(applied_at):
+    """Rollup day of an application: its applied_at date in TIME_ZONE."""
+    return timezone.localdate(applied_at)
+
+
+def bucket_start(day, interval):
+    if interval == "week":
+        return day - timedelta(days=day.weekday())  # ISO weeks, Monday first
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _add(model, job_id, lookup, delta):
+    """count += delta on the `lookup` row of `model`, creating it if needed."""
+    rows = model.objects.filter(job_id=job_id, **lookup)
+    if rows.update(count=F("count") + delta) or delta < 0:
+        return
+    company_id = Job.objects.filter(pk=job_id).values_list("company_id", flat=True).first()
+    if company_id is None:
+        return  # job deleted meanwhile
+    try:
+        with transaction.atomic():
+            model.objects.create(job_id=job_id, company_id=company_id, count=delta, **lookup)
+    except IntegrityError:  # created concurrently
+        rows.update(count=F("count") + delta)
+
+
+def add(job_id, day, status, delta):
+    """Count delta applications of `job_id` applied on `day` with `status`."""
+    _add(ApplicationDailyRollup, job_id, {"day": day, "status": status}, delta)
+    for interval in PERIOD_INTERVALS:
+        lookup = {"interval": interval, "period_start": bucket_start(day, interval), "status": status}
+        _add(ApplicationPeriodRollup, job_id, lookup, delta)
+
+
+def _add_many(model, fields, deltas, companies):
+    """_add() for {key: delta}, `key` being the values of `fields`."""
+    keys = [key for key, delta in deltas.items() if delta and key[0] in companies]
+    for start in range(0, len(keys), UPDATE_CHUNK_SIZE):
+        chunk = [(key, Q(**dict(zip(fields, key)))) for key in keys[start : start + UPDATE_CHUNK_SIZE]]
+        # missing rows start at 0 (never created for a decrement, like _add)
+        model.objects.bulk_create(
+            [
+                model(company_id=companies[key[0]], count=0, **dict(zip(fields, key)))
+                for key, _ in chunk
+                if deltas[key] > 0
+            ],
+            ignore_conflicts=True,
+        )
+        delta = Case(
+            *[When(lookup, then=Value(deltas[key])) for key, lookup in chunk],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        model.objects.filter(reduce(or_, (lookup for _, lookup in chunk))).update(
+            count=F("count") + delta
+        )
+
+
+def add_many(deltas):
+    """
+    add() for {(job_id, day, status): delta}, for bulk writes that send no
+    signals: per rollup table one INSERT of the missing rows and one CASE
+    UPDATE for each UPDATE_CHUNK_SIZE rows touched.
+    """
+    daily, periods = defaultdict(int), defaultdict(int)
+    for (job_id, day, status), delta in deltas.items():
+        daily[(job_id, day, status)] += delta
+        for interval in PERIOD_INTERVALS:
+            periods[(job_id, interval, bucket_start(day, interval), status)] += delta
+    if not any(daily.values()):
+        return
+    companies = dict(
+        Job.objects.filter(pk__in={job_id for job_id, _, _ in daily}).values_list("pk", "company_id")
+    )
+    _add_many(ApplicationDailyRollup, ("job_id", "day", "status"), daily, companies)
+    _add_many(
+        ApplicationPeriodRollup, ("job_id", "interval", "period_start", "status"), periods, companies
+    )
+
+
+def application_saved(application, created, old_status=None):
+    """post_save hook: count new applications, move status changes."""
+    if not created and (old_status is None or old_status == application.status):
+        return
+    day = application_day(application.applied_at)
+    if not created:
+        add(application.job_id, day, old_status, -1)
+    add(application.job_id, day, application.status, 1)
+
+
+def application_deleted(application):
+    add(application.job_id, application_day(application.applied_at), application.status, -1)
+
+
+def period_rows(daily_rows):
+    """ApplicationPeriodRollup kwargs from (job_id, company_id, day, status, count) rows."""
+    totals = defaultdict(int)
+    for job_id, company_id, day, status, count in daily_rows:
+        for interval in PERIOD_INTERVALS:
+            totals[(job_id, company_id, interval, bucket_start(day, interval), status)] += count
+    return [
+        {
+            "job_id": job_id, "company_id": company_id, "interval": interval,
+            "period_start": period_start, "status": status, "count": count,
+        }
+        for (job_id, company_id, interval, period_start, status), count in totals.items()
+    ]
+
+
+def rebuild():
+    """Recount every rollup row from the applications table. Returns the row count."""
+    rows = (
+        Application.objects.annotate(day=TruncDate("applied_at", tzinfo=timezone.get_current_timezone()))
+        .values_list("job_id", "job__company_id", "day", "status")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        ApplicationDailyRollup.objects.all().delete()
+        ApplicationPeriodRollup.objects.all().delete()
+        daily = list(rows)
+        ApplicationDailyRollup.objects.bulk_create(
+            [
+                ApplicationDailyRollup(
+                    job_id=job_id, company_id=company_id, day=day, status=status, count=n
+                )
+                for job_id, company_id, day, status, n in daily
+            ],
+            batch_size=BUILD_CHUNK_SIZE,
+        )
+        periods = [ApplicationPeriodRollup(**kwargs) for kwargs in period_rows(daily)]
+        ApplicationPeriodRollup.objects.bulk_create(periods, batch_size=BUILD_CHUNK_SIZE)
+    return len(daily) + len(periods)
+
+
+def recruiter_summary(user, now=None):
+    """
+    The /api/recruiter/analytics/ numbers from one jobs aggregate and one
+    read of the recruiter's rollup rows (O(days x jobs x statuses)).
+    "Today" and "last 7 days" are calendar days in TIME_ZONE, today included.
+    """
+    today = timezone.localdate(now or timezone.now())
+    week_start = today - timedelta(days=6)
+
+    jobs = Job.objects.filter(company__user=user).aggregate(
+        total=Count("id"), active=Count("id", filter=Q(is_active=True))
+    )
+
+    rows = (
+        ApplicationDailyRollup.objects.filter(company__user=user, count__gt=0)
+        .values_list("job_id", "job__title", "day", "status", "count")
+    )
+    total = in_today = in_week = 0
+    by_status, per_job, titles = {}, {}, {}
+    for job_id, title, day, status, count in rows:
+        total += count
+        if day >= today:
+            in_today += count
+        if day >= week_start:
+            in_week += count
+        by_status[status] = by_status.get(status, 0) + count
+        per_job[job_id] = per_job.get(job_id, 0) + count
+        titles[job_id] = title
+
+    return {
+        "total_jobs": jobs["total"],
+        "active_jobs": jobs["active"],
+        "total_applications": total,
+        "applications_today": in_today,
+        "applications_last_7_days": in_week,
+        "applications_by_status": by_status,
+        "applications_per_job": [
+            {"job_id": job_id, "job_title": titles[job_id], "applications_count": count}
+            for job_id, count in sorted(per_job.items(), key=lambda item: (-item[1], item[0]))
+        ],
+    }
+
+
+# ===========================
+#   TIME SERIES
+# ===========================
+
+def bucket_starts(start, end, interval):
+    """Every bucket touching [start, end], so empty periods chart as 0."""
+    buckets, current = [], bucket_start(start, interval)
+    while current <= end:
+        buckets.append(current)
+        if interval == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7 if interval == "week" else 1)
+    return buckets
+
+
+def application_series(user, interval, start, end, job_ids=None, statuses=None):
+    """
+    Applications per bucket from `start` to `end` (dates, inclusive), with
+    per job and per status breakdowns. Week / month buckets are whole
+    periods (start is rounded down) read from ApplicationPeriodRollup;
+    days come from ApplicationDailyRollup. Two GROUP BYs, no Application scan.
+    """
+    buckets = bucket_starts(start, end, interval)
+    series = {
+        "interval": interval,
+        "start": buckets[0],
+        "end": end,
+        "buckets": buckets,
+        "total": [0] * len(buckets),
+        "by_status": {},
+        "by_job": [],
+    }
+    company_id = Company.objects.filter(user=user).values_list("id", flat=True).first()
+    if company_id is None:
+        return series
+
+    if interval == "day":
+        rows = ApplicationDailyRollup.objects.filter(company_id=company_id, day__range=(start, end))
+        bucket = "day"
+    else:
+        rows = ApplicationPeriodRollup.objects.filter(
+            company_id=company_id, interval=interval, period_start__range=(buckets[0], end)
+        )
+        bucket = "period_start"
+    if job_ids:
+        rows = rows.filter(job_id__in=job_ids)
+    if statuses:
+        rows = rows.filter(status__in=statuses)
+
+    index = {day: i for i, day in enumerate(buckets)}
+    total, by_status = series["total"], series["by_status"]
+    for day, status, n in rows.values_list(bucket, "status").annotate(n=Sum("count")).order_by():
+        if n:
+            by_status.setdefault(status, [0] * len(buckets))[index[day]] += n
+            total[index[day]] += n
+
+    by_job = {}
+    for day, job_id, n in rows.values_list(bucket, "job_id").annotate(n=Sum("count")).order_by():
+        if n:
+            by_job.setdefault(job_id, [0] * len(buckets))[index[day]] += n
+    titles = dict(Job.objects.filter(pk__in=by_job).values_list("id", "title"))
+    series["by_job"] = [
+        {"job_id": job_id, "job_title": titles.get(job_id, ""), "counts": counts}
+        for job_id, counts in sorted(by_job.items(), key=lambda item: (-sum(item[1]), item[0]))
+    ]
+    return series
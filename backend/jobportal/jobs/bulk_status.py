@@ -0,0 +1,96 @@
+# jobportal/jobs/bulk_status.py
+
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+
+from .email_utils import status_email
+from .models import Application, ApplicationStatusNotification
+from . import analytics_utils, conditional, notification_counters, outbox
+
+# Applications moved per call (ids per request / filter matches per round).
+MAX_APPLICATIONS = getattr(settings, "BULK_STATUS_MAX_APPLICATIONS", 1000)
+
+
+def owned(recruiter):
+    """Applications to the jobs of `recruiter`'s company."""
+    return Application.objects.filter(job__company__user=recruiter)
+
+
+def matching(recruiter, ids=None, jobs=None, statuses=None, passed=None):
+    """owned() narrowed to `ids`, or to the `jobs` / current `statuses` / test result filter."""
+    qs = owned(recruiter)
+    if ids is not None:
+        qs = qs.filter(pk__in=ids)
+    if jobs:
+        qs = qs.filter(job_id__in=jobs)
+    if statuses:
+        qs = qs.filter(status__in=statuses)
+    if passed is not None:
+        qs = qs.filter(test__passed=passed)
+    return qs
+
+
+def change_status(queryset, new_status, limit=MAX_APPLICATIONS):
+    """
+    Move up to `limit` applications of `queryset` (oldest first) that are
+    not in `new_status` yet to it - what the status PATCH does for one,
+    in one transaction:
+
+      - one UPDATE of the applications (restricted to `queryset`, i.e. to
+        the recruiter's own applications)
+      - one INSERT of the status notifications + unread counters
+      - one INSERT of the emails into the outbox (immediate subscribers)
+      - the analytics rollups, moved per (job, day, status) at once
+
+    bulk writes send no signals, so everything the Application /
+    ApplicationStatusNotification receivers do is done here.
+    Returns (ids moved, whether more applications match).
+    """
+    with transaction.atomic():
+        rows = list(
+            queryset.exclude(status=new_status)
+            .select_for_update(of=("self",))
+            .order_by("pk")
+            .values_list(
+                "pk", "job_id", "applied_at", "status",
+                "candidate__user_id", "candidate__user__username", "candidate__user__email",
+                "candidate__email_frequency", "job__title", "job__company__name",
+            )[: limit + 1]
+        )
+        more = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
+            return [], False
+
+        ids = [row[0] for row in rows]
+        queryset.filter(pk__in=ids).update(status=new_status)
+
+        rollups = Counter()
+        notifications, emails, unread = [], [], Counter()
+        for (
+            pk, job_id, applied_at, old_status, user_id, username, email, frequency, title, company,
+        ) in rows:
+            day = analytics_utils.application_day(applied_at)
+            rollups[(job_id, day, old_status)] -= 1
+            rollups[(job_id, day, new_status)] += 1
+
+            if not email:
+                continue  # like send_application_status_email: no email, no notification
+            subject, message, body_extra = status_email(username, title, company, new_status)
+            notifications.append(
+                ApplicationStatusNotification(application_id=pk, status=new_status, message=body_extra)
+            )
+            unread[user_id] += 1
+            if frequency == "immediate":
+                emails.append((email, subject, message))
+
+        analytics_utils.add_many(rollups)
+        if notifications:
+            ApplicationStatusNotification.objects.bulk_create(notifications, batch_size=1000)
+            notification_counters.add(ApplicationStatusNotification, unread)
+            conditional.bump(ApplicationStatusNotification)
+        outbox.enqueue_many(emails)
+
+    return ids, more
@@ -0,0 +1,102 @@
+# jobportal/jobs/conditional.py
+
+import hashlib
+
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from .models import TableVersion
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def bump(*models):
+    """
+    Mark the tables of `models` as changed. Call it in the same transaction
+    as the write, so the new version and the new rows commit together.
+    """
+    now = timezone.now()
+    for model in models:
+        table = _label(model)
+        updated = TableVersion.objects.filter(table=table).update(
+            version=F("version") + 1, updated_at=now
+        )
+        if not updated:
+            TableVersion.objects.get_or_create(
+                table=table, defaults={"version": 1, "updated_at": now}
+            )
+
+
+def stamp(models):
+    """({table: version}, last change or None) for `models`, in one query."""
+    rows = TableVersion.objects.filter(table__in=[_label(m) for m in models]).values_list(
+        "table", "version", "updated_at"
+    )
+    versions, last_modified = {}, None
+    for table, version, updated_at in rows:
+        versions[table] = version
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    return versions, last_modified
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETag + Last-Modified on list / retrieve, derived from the
+    TableVersion counters of `conditional_models` plus the URL (query string,
+    cursor), the negotiated format and - for per-user lists - the user.
+    A matching If-None-Match / If-Modified-Since gets a 304 before the
+    queryset or the serializer is touched.
+
+    Every write to a table in `conditional_models` must bump() it (signals.py,
+    bulk paths), or clients keep getting 304s for stale data.
+    """
+
+    conditional_models = ()
+    conditional_per_user = False
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        # versions are read before the data: a write landing in between
+        # gives new data under the old ETag, never the other way round
+        versions, last_modified = stamp(self.conditional_models)
+        etag = self._etag(request, versions)
+        last_modified = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        elif response.status_code != 304:
+            return response  # 412 Precondition Failed
+
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+        # always revalidate; per-user responses stay out of shared caches
+        if self.conditional_per_user:
+            patch_cache_control(response, no_cache=True, private=True)
+            patch_vary_headers(response, ["Authorization"])
+        else:
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    def _etag(self, request, versions):
+        parts = [
+            request.build_absolute_uri(),
+            getattr(request, "accepted_media_type", ""),
+            ",".join(f"{table}={version}" for table, version in sorted(versions.items())),
+        ]
+        if self.conditional_per_user:
+            parts.append(str(request.user.pk))
+        return '"%s"' % hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
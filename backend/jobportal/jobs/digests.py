@@ -0,0 +1,146 @@
+# jobportal/jobs/digests.py
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from accounts.models import CandidateProfile
+from .models import Application, ApplicationStatusNotification, JobAlertNotification
+from . import outbox
+
+PERIODS = {"daily": timedelta(days=1), "weekly": timedelta(days=7)}
+# A digest is due this much before its period is over, so an hourly or
+# daily cron that drifts by a few minutes doesn't skip a whole period.
+EARLY = timedelta(hours=1)
+# Lines per section; the rest is summed up as "... and N more".
+MAX_ITEMS = getattr(settings, "DIGEST_MAX_ITEMS", 20)
+# Candidates rendered per transaction.
+CHUNK_SIZE = getattr(settings, "DIGEST_CHUNK_SIZE", 500)
+
+STATUS_LABELS = dict(Application.STATUS_CHOICES)
+
+
+def due(frequency, now):
+    """Subscribers of `frequency` whose next digest is due (never sent: start the clock)."""
+    return CandidateProfile.objects.filter(email_frequency=frequency).filter(
+        Q(digest_sent_at__isnull=True) | Q(digest_sent_at__lte=now - PERIODS[frequency] + EARLY)
+    )
+
+
+def _pending(profiles, now):
+    """
+    {candidate id: ([status update], [job match])}, newest first: the unread
+    notifications each candidate got since their last digest. Two queries
+    for the whole chunk. Several updates of one application keep the latest.
+    """
+    since = {pk: sent_at for pk, _, _, _, sent_at in profiles}
+    oldest = min(since.values())
+    window = {"is_read": False, "created_at__gt": oldest, "created_at__lte": now}
+    updates, matches = defaultdict(list), defaultdict(list)
+
+    seen = set()
+    rows = (
+        ApplicationStatusNotification.objects.filter(application__candidate_id__in=since, **window)
+        .order_by("-created_at", "-id")
+        .values_list(
+            "application__candidate_id", "application_id", "created_at", "status",
+            "application__job__title", "application__job__company__name",
+        )
+    )
+    for candidate_id, application_id, created_at, status, title, company in rows:
+        if created_at > since[candidate_id] and application_id not in seen:
+            seen.add(application_id)
+            updates[candidate_id].append((title, company, STATUS_LABELS.get(status, status)))
+
+    rows = (
+        JobAlertNotification.objects.filter(candidate_id__in=since, **window)
+        .order_by("-created_at", "-id")
+        .values_list("candidate_id", "created_at", "job__title", "job__company__name", "job__location")
+    )
+    for candidate_id, created_at, title, company, location in rows:
+        if created_at > since[candidate_id]:
+            matches[candidate_id].append((title, company, location))
+
+    return {pk: (updates[pk], matches[pk]) for pk in since if updates[pk] or matches[pk]}
+
+
+def _section(heading, lines):
+    shown = [f"- {line}" for line in lines[:MAX_ITEMS]]
+    if len(lines) > MAX_ITEMS:
+        shown.append(f"... and {len(lines) - MAX_ITEMS} more.")
+    return f"{heading} ({len(lines)}):\n" + "\n".join(shown)
+
+
+def render(username, frequency, updates, matches):
+    """(subject, body) of one digest email."""
+    counts = []
+    if updates:
+        counts.append(f"{len(updates)} application update{'s' if len(updates) != 1 else ''}")
+    if matches:
+        counts.append(f"{len(matches)} new job{'s' if len(matches) != 1 else ''} for your alerts")
+    subject = f"Your {frequency} JobPortal digest: {', '.join(counts)}"
+
+    sections = []
+    if updates:
+        sections.append(_section(
+            "Application updates",
+            [f"{title} at {company}: {status}" for title, company, status in updates],
+        ))
+    if matches:
+        sections.append(_section(
+            "New jobs matching your alerts",
+            [f"{title} at {company}" + (f" ({location})" if location else "") for title, company, location in matches],
+        ))
+    body = (
+        f"Hi {username},\n\n"
+        f"Here is what happened since your last digest.\n\n"
+        + "\n\n".join(sections)
+        + "\n\nBest regards,\nJobPortal Team"
+    )
+    return subject, body
+
+
+def send_digests(frequency, now=None, chunk_size=CHUNK_SIZE):
+    """
+    Queue one digest email per due `frequency` subscriber with news, and
+    move everyone's digest_sent_at to `now`. Each chunk of candidates is
+    locked, rendered, queued in the outbox and stamped in one transaction,
+    so a re-run (or a second runner) never sends a digest twice.
+    Returns {"candidates": n, "emails": n, "notifications": n}.
+    """
+    now = now or timezone.now()
+    totals = {"candidates": 0, "emails": 0, "notifications": 0}
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            profiles = list(
+                due(frequency, now).filter(pk__gt=last_pk)
+                .select_for_update(skip_locked=True, of=("self",))
+                .order_by("pk")
+                .values_list("pk", "user_id", "user__username", "user__email", "digest_sent_at")[:chunk_size]
+            )
+            if not profiles:
+                break
+            last_pk = profiles[-1][0]
+
+            started = [p for p in profiles if p[4] is not None]
+            pending = _pending(started, now) if started else {}
+            emails = []
+            for pk, _, username, email, _ in started:
+                if pk in pending and email:
+                    updates, matches = pending[pk]
+                    subject, body = render(username, frequency, updates, matches)
+                    emails.append((email, subject, body))
+                    totals["notifications"] += len(updates) + len(matches)
+            outbox.enqueue_many(emails)
+            CandidateProfile.objects.filter(pk__in=[p[0] for p in profiles]).update(digest_sent_at=now)
+
+        totals["candidates"] += len(profiles)
+        totals["emails"] += len(emails)
+        if len(profiles) < chunk_size:
+            break
+    return totals
@@ -1,25 +1,13 @@
-from django.core.mail import send_mail
-from django.conf import settings
 from .models import ApplicationStatusNotification
+from . import outbox
 
 
-def send_application_status_email(application):
-    """
-    Sends an email to the candidate when the application status changes
-    AND stores a notification in the database.
-    """
-    user = application.candidate.user
-    email = user.email
-    if not email:
-        return  # no email, nothing to do
-
-    job = application.job
-    status = application.status
-
-    subject = f"Update on your application for {job.title}"
-    base_message = f"Hi {user.username},\n\n"
+def status_email(username, job_title, company_name, status):
+    """(subject, message, status paragraph) of an application status email."""
+    subject = f"Update on your application for {job_title}"
+    base_message = f"Hi {username},\n\n"
     base_message += (
-        f"Your application for the job '{job.title}' at {job.company.name} "
+        f"Your application for the job '{job_title}' at {company_name} "
         f"has been updated.\n\n"
     )
 
@@ -47,15 +35,30 @@ def send_application_status_email(application):
         body_extra = f"Status: {status}."
 
     message = base_message + body_extra + "\n\nBest regards,\nJobPortal Team"
+    return subject, message, body_extra
 
-    # 🔔 send email
-    send_mail(
-        subject,
-        message,
-        getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@jobportal.com"),
-        [email],
-        fail_silently=True,
-    )
+
+def send_application_status_email(application):
+    """
+    Queues an email to the candidate when the application status changes
+    AND stores a notification in the database.
+    Call it in the transaction that changes the status: both rows commit
+    with it, and `manage.py send_outbox` does the sending.
+    (jobs.bulk_status does the same for many applications at once.)
+    """
+    user = application.candidate.user
+    email = user.email
+    if not email:
+        return  # no email, nothing to do
+
+    job = application.job
+    status = application.status
+    subject, message, body_extra = status_email(user.username, job.title, job.company.name, status)
+
+    # 🔔 queue email (sent by the outbox worker) – digest subscribers get
+    # it in their next digest instead (jobs.digests)
+    if application.candidate.email_frequency == "immediate":
+        outbox.enqueue(email, subject, message)
 
     # 🔔 also store for frontend alerts
     ApplicationStatusNotification.objects.create(
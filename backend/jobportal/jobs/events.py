@@ -0,0 +1,362 @@
+# jobportal/jobs/events.py
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from .models import ApplicationStatusNotification, JobAlertNotification
+from . import notification_counters
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per connection; a client that falls further behind is
+# disconnected and catches up from the DB when it reconnects.
+QUEUE_SIZE = getattr(settings, "SSE_QUEUE_SIZE", 100)
+# Seconds between the per-process polls for new notification rows
+# (<= 0 disables polling, e.g. in tests).
+POLL_INTERVAL = getattr(settings, "SSE_POLL_INTERVAL", 1.0)
+# Idle connections get a comment line this often (proxies, dead peers).
+HEARTBEAT = getattr(settings, "SSE_HEARTBEAT", 15)
+# EventSource reconnect delay, sent as "retry:".
+RETRY_MS = getattr(settings, "SSE_RETRY_MS", 3000)
+
+POLL_BATCH = 1000
+REPLAY_BATCH = 500
+
+OVERFLOW = object()
+
+
+class _Source:
+    def __init__(self, model, user_path, serializer_name, related, only, user_of):
+        self.model = model
+        self.user_path = user_path
+        self.serializer_name = serializer_name
+        self.related = related
+        self.only = only  # columns the serializer and user_of read
+        self.user_of = user_of
+
+    @property
+    def serializer_class(self):
+        # imported late: serializers reads KINDS from this module
+        from . import serializers
+        return getattr(serializers, self.serializer_name)
+
+    def rows(self, pks):
+        return self.model.objects.filter(pk__in=pks).select_related(*self.related).only(*self.only)
+
+
+# cursor order: "<job alert pk>-<status pk>"
+SOURCES = {
+    "job_alert": _Source(
+        JobAlertNotification,
+        "candidate__user_id",
+        "JobAlertNotificationSerializer",
+        ("job__company", "candidate"),
+        ("is_read", "created_at", "job__title", "job__company__name", "candidate__user_id"),
+        lambda n: n.candidate.user_id,
+    ),
+    "application_status": _Source(
+        ApplicationStatusNotification,
+        "application__candidate__user_id",
+        "ApplicationStatusNotificationSerializer",
+        ("application__job__company", "application__candidate"),
+        (
+            "status", "message", "is_read", "created_at", "application__job__title",
+            "application__job__company__name", "application__candidate__user_id",
+        ),
+        lambda n: n.application.candidate.user_id,
+    ),
+}
+KINDS = tuple(SOURCES)
+
+
+# ===========================
+#   CURSORS (SSE event ids)
+# ===========================
+
+def encode_cursor(cursor):
+    return "-".join(str(cursor[kind]) for kind in KINDS)
+
+
+def parse_cursor(value):
+    """{kind: last pk seen} from a Last-Event-ID, or None if absent / malformed."""
+    try:
+        pks = [int(part) for part in (value or "").split("-")]
+    except ValueError:
+        return None
+    if len(pks) != len(KINDS) or min(pks) < 0:
+        return None
+    return dict(zip(KINDS, pks))
+
+
+def latest_cursor():
+    return {
+        kind: source.model.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+        for kind, source in SOURCES.items()
+    }
+
+
+# ===========================
+#   READING NOTIFICATIONS
+# ===========================
+
+def _events(kind, pks):
+    source = SOURCES[kind]
+    rows = source.rows(pks).order_by("pk")
+    return [
+        {
+            "kind": kind,
+            "id": row.pk,
+            "user_id": source.user_of(row),
+            "created_at": row.created_at,
+            "data": source.serializer_class(row).data,
+        }
+        for row in rows
+    ]
+
+
+def fetch_new(kind, after_pk, user_ids, limit=POLL_BATCH):
+    """
+    (events for `user_ids`, highest pk scanned) among rows after `after_pk`.
+    Only the rows of `user_ids` are loaded and serialized.
+    """
+    source = SOURCES[kind]
+    rows = list(
+        source.model.objects.filter(pk__gt=after_pk)
+        .order_by("pk")
+        .values_list("pk", source.user_path)[:limit]
+    )
+    if not rows:
+        return [], after_pk, False
+    wanted = [pk for pk, user_id in rows if user_id in user_ids]
+    return (_events(kind, wanted) if wanted else []), rows[-1][0], len(rows) == limit
+
+
+def replay(user_id, cursor):
+    """A user's notifications after `cursor`, oldest first (missed while disconnected)."""
+    events = []
+    for kind, source in SOURCES.items():
+        after = cursor[kind]
+        while True:
+            pks = list(
+                source.model.objects.filter(pk__gt=after, **{source.user_path: user_id})
+                .order_by("pk")
+                .values_list("pk", flat=True)[:REPLAY_BATCH]
+            )
+            events.extend(_events(kind, pks))
+            if len(pks) < REPLAY_BATCH:
+                break
+            after = pks[-1]
+    events.sort(key=lambda event: (event["created_at"], KINDS.index(event["kind"]), event["id"]))
+    return events
+
+
+# ===========================
+#   IN-PROCESS PUB/SUB
+# ===========================
+
+class Subscription:
+    """One SSE connection: a bounded queue on the connection's event loop."""
+
+    def __init__(self, user_id, loop=None):
+        self.user_id = user_id
+        self.loop = loop or asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False
+
+    def offer(self, event):
+        # runs on self.loop (call_soon_threadsafe)
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # too slow: end the stream instead of buffering without bound
+            self.overflowed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+
+class Broker:
+    """
+    Fans notification events out to the connections of this process.
+
+    Notifications are written by other processes too (the task worker, other
+    web workers), so one poller thread per process reads new rows - a single
+    indexed query per table per POLL_INTERVAL, however many connections are
+    open - and hands each event to its user's subscriptions.
+    """
+
+    def __init__(self, poll_interval=POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+        self._poller = None
+        self._published = None  # cursor of the last event handed out
+
+    def subscribe(self, user_id, loop=None):
+        """
+        Register a connection (`loop`: its event loop, when called from a
+        worker thread). Starting the poller reads the DB: call it from sync
+        code. The poller's start cursor is read here, under the lock, and
+        becomes published_cursor(), so new streams start exactly where the
+        poller does.
+        """
+        subscription = Subscription(user_id, loop)
+        with self._lock:
+            if self.poll_interval > 0 and self._poller is None:
+                self._published = latest_cursor()
+                self._poller = threading.Thread(
+                    target=self._poll, args=(dict(self._published),), name="sse-poller", daemon=True
+                )
+                self._poller.start()
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def published_cursor(self):
+        """
+        Everything up to this cursor has been published; later rows will
+        be. A stream subscribed before reading it misses nothing.
+        """
+        with self._lock:
+            return dict(self._published) if self._published else None
+
+    def connections(self):
+        with self._lock:
+            return sum(len(subs) for subs in self._subscriptions.values())
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:  # loop closed, connection is going away
+                pass
+
+    def _poll(self, cursor):
+        while True:
+            with self._lock:
+                user_ids = set(self._subscriptions)
+                if not user_ids:
+                    # the next subscribe() reads a fresh start cursor
+                    self._poller = None
+                    self._published = None
+                    return
+            try:
+                self.poll_once(cursor, user_ids)
+            except Exception:
+                logger.exception("Notification poller failed")
+            finally:
+                close_old_connections()
+            time.sleep(self.poll_interval)
+
+    def poll_once(self, cursor, user_ids):
+        """Publish the events of `user_ids` after `cursor` (advanced in place)."""
+        for kind in KINDS:
+            more = True
+            while more:
+                events, cursor[kind], more = fetch_new(kind, cursor[kind], user_ids)
+                for event in events:
+                    self.publish(event["user_id"], event)
+        with self._lock:
+            self._published = dict(cursor)
+
+
+broker = Broker()
+
+
+# ===========================
+#   SSE STREAM
+# ===========================
+
+def format_message(event_type, cursor, data):
+    return (
+        f"id: {encode_cursor(cursor)}\n"
+        f"event: {event_type}\n"
+        f"data: {json.dumps(data, separators=(',', ':'))}\n\n"
+    )
+
+
+def authenticate(token):
+    """User for a JWT access token (EventSource can't send headers), or None."""
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+    if not token:
+        return None
+    auth = JWTAuthentication()
+    try:
+        return auth.get_user(auth.get_validated_token(token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+async def stream(user_id, cursor=None):
+    """
+    text/event-stream of a candidate's new notifications:
+      event: notification  data: {"kind": ..., "notification": {...}}
+      event: ready         data: unread counts, once caught up
+    Event ids are cursors, so a reconnect with Last-Event-ID replays what
+    was missed. Ends when the client falls QUEUE_SIZE events behind.
+    """
+    # subscribe first: nothing committed during the replay is lost
+    subscription = await sync_to_async(broker.subscribe)(user_id, asyncio.get_running_loop())
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        cursor, missed, counts = await sync_to_async(_catch_up)(user_id, cursor)
+        for event in missed:
+            cursor[event["kind"]] = max(cursor[event["kind"]], event["id"])
+            yield _notification(event, cursor)
+        yield format_message("ready", cursor, counts)
+
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is OVERFLOW:
+                return
+            if event["id"] <= cursor[event["kind"]]:
+                continue  # already replayed
+            cursor[event["kind"]] = event["id"]
+            yield _notification(event, cursor)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _catch_up(user_id, cursor):
+    """(start cursor, missed events, unread counts) in one thread hop."""
+    try:
+        if cursor is None:
+            return broker.published_cursor() or latest_cursor(), [], \
+                notification_counters.unread_counts(user_id)
+        return cursor, replay(user_id, cursor), notification_counters.unread_counts(user_id)
+    finally:
+        # connections are per request context: an idle stream must not
+        # keep one open for its whole lifetime
+        for conn in connections.all(initialized_only=True):
+            if not conn.in_atomic_block:
+                conn.close()
+
+
+def _notification(event, cursor):
+    return format_message(
+        "notification", cursor, {"kind": event["kind"], "notification": event["data"]}
+    )
@@ -0,0 +1,190 @@
+# jobportal/jobs/fast_render.py
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.http import Http404, HttpResponse
+from rest_framework import serializers
+from rest_framework.permissions import BasePermission
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see requirements.txt
+    orjson = None
+
+
+# Serializer fields whose output we can reproduce from a .values() column:
+# identity for these ...
+_PASSTHROUGH_FIELDS = (
+    serializers.CharField,  # incl. URLField, EmailField, ...
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.ReadOnlyField,
+    serializers.PrimaryKeyRelatedField,  # the column holds the pk
+)
+# ... and DRF's own to_representation for these (exact same strings)
+_CONVERTED_FIELDS = (
+    serializers.DecimalField,
+    serializers.DateTimeField,
+    serializers.DateField,
+)
+
+
+def dumps(data):
+    """
+    Encode to the exact bytes DRF's JSONRenderer produces (compact, UTF-8,
+    \\u2028 / \\u2029 escaped) – with orjson when installed.
+
+    Only for data made of dicts, lists, str, int, bool and None: orjson
+    formats floats differently from json.dumps.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(data)
+        except TypeError:  # orjson.JSONEncodeError, e.g. lone surrogates
+            body = None
+        if body is not None:
+            return body.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return JSONRenderer().render(data)
+
+
+class RowBuilder:
+    """
+    Serializer-equivalent rows from `.values()` dicts.
+    RowBuilder.for_serializer() returns None when the serializer has fields
+    we can't reproduce (nested serializers, method fields, nullable
+    relations, ...) – callers then use the serializer.
+    """
+
+    def __init__(self, specs):
+        # [(output name, values() key, converter or None)]
+        self.specs = specs
+        self.sources = [source for _, source, _ in specs]
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        model = serializer.Meta.model
+        specs = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, _CONVERTED_FIELDS):
+                convert = field.to_representation
+            elif isinstance(field, _PASSTHROUGH_FIELDS):
+                convert = None
+                if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field:
+                    return None
+            else:
+                return None
+            source = cls._values_key(model, field.source)
+            if source is None:
+                return None
+            specs.append((name, source, convert))
+        return cls(specs)
+
+    @staticmethod
+    def _values_key(model, source):
+        """'company.name' -> 'company__name', following non-null FKs only."""
+        if source == "*":
+            return None
+        parts = source.split(".")
+        for part in parts[:-1]:
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None
+            if not field.many_to_one or field.null:
+                return None
+            model = field.related_model
+        try:
+            field = model._meta.get_field(parts[-1])
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many or field.one_to_many or field.one_to_one and not field.concrete:
+            return None
+        return "__".join(parts)
+
+    def row(self, values):
+        out = {}
+        for name, source, convert in self.specs:
+            value = values[source]
+            out[name] = value if value is None or convert is None else convert(value)
+        return out
+
+    def rows(self, values_list):
+        return [self.row(values) for values in values_list]
+
+
+class FastReadMixin:
+    """
+    list / retrieve for read-heavy ViewSets without model instances or
+    field-by-field serialization: the queryset is read with .values(),
+    rows are built by RowBuilder and encoded by dumps(). The bytes are
+    identical to the regular serializer + JSONRenderer response.
+
+    Used only when the client negotiated JSON, the serializer is flat
+    enough for RowBuilder, and no permission checks objects; otherwise
+    the regular DRF path runs. settings.FAST_JSON_RENDERING = False turns
+    it off.
+    """
+
+    def list(self, request, *args, **kwargs):
+        builder = self._fast_row_builder()
+        if builder is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*self._values_keys(queryset, builder))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            data = self.paginator.get_paginated_data(builder.rows(page))
+        else:
+            data = builder.rows(queryset)
+        return HttpResponse(dumps(data), content_type="application/json")
+
+    def retrieve(self, request, *args, **kwargs):
+        builder = self._fast_row_builder()
+        if builder is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            values = (
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+                .values(*builder.sources)
+                .first()
+            )
+        except (TypeError, ValueError, ValidationError):
+            raise Http404  # malformed lookup, like DRF's get_object_or_404
+        if values is None:
+            # same message as get_object_or_404
+            raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+        return HttpResponse(dumps(builder.row(values)), content_type="application/json")
+
+    def _fast_row_builder(self):
+        if not getattr(settings, "FAST_JSON_RENDERING", True):
+            return None
+        if not isinstance(getattr(self.request, "accepted_renderer", None), JSONRenderer):
+            return None
+        # object permissions need instances
+        for permission in self.get_permissions():
+            if type(permission).has_object_permission is not BasePermission.has_object_permission:
+                return None
+        return RowBuilder.for_serializer(self.get_serializer())
+
+    def _values_keys(self, queryset, builder):
+        # the paginator also reads the ordering columns (keyset cursor)
+        keys = list(builder.sources)
+        for item in queryset.query.order_by or queryset.model._meta.ordering:
+            name = item.lstrip("-")
+            if name == "pk":
+                name = queryset.model._meta.pk.name
+            if name not in keys:
+                keys.append(name)
+        pk_name = queryset.model._meta.pk.name
+        if pk_name not in keys:
+            keys.append(pk_name)
+        return keys
@@ -0,0 +1,175 @@
+# jobportal/jobs/inbox.py
+
+import base64
+import heapq
+import json
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from .events import KINDS, SOURCES
+from .models import ArchivedJobAlertNotification
+from .serializers import ArchivedJobAlertNotificationSerializer
+from . import conditional, notification_counters
+
+
+# Inbox order: newest first on (created_at, kind rank, id) - a total order
+# across both notification tables, so a position is a valid cursor.
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(position):
+    created_at, rank, pk = position
+    raw = json.dumps([created_at.isoformat(), rank, pk])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(value):
+    try:
+        raw = base64.urlsafe_b64decode(value.encode("ascii")).decode("utf-8")
+        created_at, rank, pk = json.loads(raw)
+        created_at = parse_datetime(created_at)
+        if created_at is None or rank not in range(len(KINDS)) or not isinstance(pk, int):
+            raise ValueError
+    except (ValueError, TypeError, UnicodeError):
+        raise InvalidCursor(value)
+    return created_at, rank, pk
+
+
+def _after(kind, position, inclusive=False):
+    """Q for the rows of `kind` that come after `position` in inbox order."""
+    created_at, rank, pk = position
+    own = KINDS.index(kind)
+    if own < rank:
+        return Q(created_at__lte=created_at)
+    if own > rank:
+        return Q(created_at__lt=created_at)
+    same = Q(created_at=created_at, pk__lte=pk) if inclusive else Q(created_at=created_at, pk__lt=pk)
+    return Q(created_at__lt=created_at) | same
+
+
+# The job alert feed continues in the archive (jobs.retention): same ids
+# and created_at, always read.
+ARCHIVES = {
+    "job_alert": ArchivedJobAlertNotification,
+}
+
+
+def _owned(kind, user_id):
+    source = SOURCES[kind]
+    return source.model.objects.filter(**{source.user_path: user_id})
+
+
+def _archived(kind, user_id):
+    return ARCHIVES[kind].objects.filter(candidate__user_id=user_id)
+
+
+def _tables(kind, user_id, unread_only):
+    yield _owned(kind, user_id)
+    if kind in ARCHIVES and not unread_only:
+        yield _archived(kind, user_id)
+
+
+def _archived_rows(kind, pks):
+    return (
+        ARCHIVES[kind].objects.filter(pk__in=pks)
+        .select_related("job__company")
+        .only("created_at", "job__title", "job__company__name")
+    )
+
+
+def page(user_id, cursor=None, limit=20, kinds=KINDS, unread_only=False):
+    """
+    (items, next cursor or None): the user's notifications of `kinds` after
+    `cursor`, newest first. Each item is the notification's serializer
+    data plus its "kind".
+
+    Every table (the archive included) is read on its own
+    (candidate, created_at, id) keyset - limit + 1 positions each - the
+    positions are merged, and only the winners are loaded and serialized:
+    2 queries per table per page, whatever the depth.
+    """
+    streams = []
+    for kind in kinds:
+        rank = KINDS.index(kind)
+        for qs in _tables(kind, user_id, unread_only):
+            if cursor is not None:
+                qs = qs.filter(_after(kind, cursor))
+            if unread_only:
+                qs = qs.filter(is_read=False)
+            streams.append([
+                (created_at, rank, pk)
+                for created_at, pk in qs.order_by("-created_at", "-pk").values_list("created_at", "pk")[: limit + 1]
+            ])
+
+    positions = []
+    for position in heapq.merge(*streams, reverse=True):
+        if positions and positions[-1] == position:
+            continue  # archived between the two reads: seen in both tables
+        positions.append(position)
+        if len(positions) > limit:
+            break
+    has_more = len(positions) > limit
+    positions = positions[:limit]
+
+    rows = {}
+    for rank, kind in enumerate(KINDS):
+        pks = [pk for _, r, pk in positions if r == rank]
+        if not pks:
+            continue
+        source = SOURCES[kind]
+        for row in source.rows(pks):
+            rows[rank, row.pk] = (kind, source.serializer_class(row).data)
+        missing = [pk for pk in pks if (rank, pk) not in rows]
+        if missing and kind in ARCHIVES:
+            for row in _archived_rows(kind, missing):
+                rows[rank, row.pk] = (kind, ArchivedJobAlertNotificationSerializer(row).data)
+
+    items = []
+    for _, rank, pk in positions:
+        if (rank, pk) in rows:  # deleted since the positions were read
+            kind, data = rows[rank, pk]
+            items.append({"kind": kind, **data})
+    return items, (positions[-1] if has_more else None)
+
+
+def mark_read(user_id, items=(), up_to=None):
+    """
+    Mark notifications read: `items` [(kind, id)], or the notification
+    `up_to` (kind, id) and every older one. One UPDATE per table, with the
+    unread counters and ETag versions moved in the same transaction.
+
+    Returns the number of notifications flipped to read, or None when
+    `up_to` isn't one of the user's notifications.
+    """
+    conditions = {}
+    if up_to is not None:
+        kind, pk = up_to
+        created_at = _owned(kind, user_id).filter(pk=pk).values_list("created_at", flat=True).first()
+        if created_at is None and kind in ARCHIVES:
+            created_at = _archived(kind, user_id).filter(pk=pk).values_list("created_at", flat=True).first()
+        if created_at is None:
+            return None
+        position = (created_at, KINDS.index(kind), pk)
+        conditions = {k: _after(k, position, inclusive=True) for k in KINDS}
+    else:
+        pks = {}
+        for kind, pk in items:
+            pks.setdefault(kind, set()).add(pk)
+        conditions = {kind: Q(pk__in=ids) for kind, ids in pks.items()}
+
+    marked = 0
+    with transaction.atomic():
+        for kind, condition in conditions.items():
+            model = SOURCES[kind].model
+            n = _owned(kind, user_id).filter(condition, is_read=False).update(is_read=True)
+            if n:
+                # update() sends no signals
+                notification_counters.add(model, {user_id: -n})
+                conditional.bump(model)
+                marked += n
+    return marked
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from jobs import retention
+
+
+class Command(BaseCommand):
+    help = (
+        "Move read job alert notifications older than NOTIFICATION_READ_RETENTION_DAYS, "
+        "and all older than NOTIFICATION_MAX_AGE_DAYS, to the archive table. "
+        "Run it daily (cron); safe to interrupt and re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=retention.BATCH_SIZE)
+        parser.add_argument("--pause", type=float, default=0, help="Seconds to sleep between batches.")
+        parser.add_argument("--limit", type=int, default=None, help="Stop after this many rows.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the rows due.")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            count = retention.archivable().count()
+            self.stdout.write(f"{count} notifications due for the archive.")
+            return
+        moved = retention.archive(
+            batch_size=options["batch_size"], pause=options["pause"], limit=options["limit"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} notifications."))
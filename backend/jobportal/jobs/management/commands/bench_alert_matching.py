@@ -0,0 +1,146 @@
+import random
+import re
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import User, Company, CandidateProfile
+from jobs.models import Job, JobAlert
+from jobs import alert_matching
+
+
+VOCAB = (
+    "python django react node.js java spring golang rust kotlin swift sql "
+    "postgres redis kafka docker kubernetes aws azure gcp terraform linux "
+    "backend frontend fullstack mobile android ios flutter angular vue "
+    "typescript graphql devops security testing pandas spark airflow"
+).split()
+PHRASES = ["machine learning", "rest api", "data engineering", "site reliability"]
+LOCATIONS = ["", "", "bangalore", "remote", "pune", "hyderabad"]
+JOB_TYPES = ["", "", "full-time", "internship", "contract"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark job-alert matching for a new job: inverted index vs the "
+        "old per-alert keyword scan. Runs inside a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--alerts", type=int, default=100000)
+        parser.add_argument("--candidates", type=int, default=2000)
+        parser.add_argument("--jobs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, options):
+        rng = random.Random(7)
+
+        self.stdout.write(f"Creating {options['alerts']} alerts ...")
+        users = User.objects.bulk_create(
+            [
+                User(username=f"bench-alert-{i}", password="!", role="candidate")
+                for i in range(options["candidates"])
+            ],
+            batch_size=1000,
+        )
+        profiles = CandidateProfile.objects.bulk_create(
+            [CandidateProfile(user=u) for u in users], batch_size=1000
+        )
+        alerts = []
+        for i in range(options["alerts"]):
+            words = rng.sample(VOCAB, rng.randint(1, 3))
+            if rng.random() < 0.2:
+                words.append(rng.choice(PHRASES))
+            alerts.append(JobAlert(
+                candidate=profiles[i % len(profiles)],
+                keywords=", ".join(words),
+                location=rng.choice(LOCATIONS),
+                job_type=rng.choice(JOB_TYPES),
+            ))
+        JobAlert.objects.bulk_create(alerts, batch_size=2000)
+
+        start = time.perf_counter()
+        rows = alert_matching.rebuild_alert_index()
+        self.stdout.write(
+            f"Indexed {rows} alert terms in {(time.perf_counter() - start):.1f}s"
+        )
+
+        user = User.objects.create_user(
+            username="bench-alert-recruiter", password="x", role="recruiter"
+        )
+        company = Company.objects.create(user=user, name="Bench Corp")
+
+        self.stdout.write(
+            f"{'job':>4} {'old ms':>10} {'old hits':>9} {'index ms':>10} {'index hits':>11}"
+        )
+        old_times, new_times = [], []
+        for i in range(options["jobs"]):
+            words = rng.sample(VOCAB, 6) + [rng.choice(PHRASES)]
+            job = Job.objects.create(
+                company=company,
+                title=" ".join(words[:2]).title() + " Engineer",
+                description=" ".join(words * 10),
+                location=rng.choice(LOCATIONS[2:]).title(),
+                job_type=rng.choice(JOB_TYPES[2:]).title(),
+            )
+
+            start = time.perf_counter()
+            old_hits = self._legacy_match(job)
+            old_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            new_hits = alert_matching.match_alerts(job)
+            new_ms = (time.perf_counter() - start) * 1000
+
+            old_times.append(old_ms)
+            new_times.append(new_ms)
+            self.stdout.write(
+                f"{i:>4} {old_ms:>10.1f} {len(old_hits):>9} {new_ms:>10.1f} {len(new_hits):>11}"
+            )
+
+        self.stdout.write(
+            f"median: old {statistics.median(old_times):.1f} ms, "
+            f"index {statistics.median(new_times):.1f} ms"
+        )
+        self.stdout.write(
+            "Hit counts can differ slightly: the index matches keywords as "
+            "whole words, the old scan as raw substrings."
+        )
+
+    def _legacy_match(self, job):
+        """The matching loop JobViewSet.perform_create used before the index."""
+        text = f"{job.title} {job.description}".lower()
+        job_location = (job.location or "").lower()
+        job_type = (job.job_type or "").lower()
+        hits = []
+        for alert in JobAlert.objects.filter(is_active=True).select_related(
+            "candidate__user"
+        ):
+            keywords = [
+                k.strip().lower()
+                for k in re.split(r"[,\n]", alert.keywords or "")
+                if k.strip()
+            ]
+            if keywords and not any(kw in text for kw in keywords):
+                continue
+            alert_location = (alert.location or "").lower()
+            if alert_location and alert_location not in job_location:
+                continue
+            alert_job_type = (alert.job_type or "").lower()
+            if alert_job_type and alert_job_type != job_type:
+                continue
+            hits.append((alert.pk, alert.candidate_id))
+        return hits
@@ -0,0 +1,87 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import User, Company
+from jobs.fast_render import RowBuilder, dumps
+from jobs.models import Job
+from jobs.serializers import JobCardSerializer, JobSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark rendering job rows: serializer + JSONRenderer vs "
+        ".values() + RowBuilder + orjson. Runs inside a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, options):
+        recruiter = User.objects.create_user(
+            username="bench-render-recruiter", password="x", role="recruiter"
+        )
+        company = Company.objects.create(user=recruiter, name="Bench Corp – Zürich")
+        Job.objects.bulk_create(
+            [
+                Job(
+                    company=company,
+                    title=f"Engineer {i} – ünïcode",
+                    description="Python, Django and SQL. " * 20,
+                    description_excerpt=("Python, Django and SQL. " * 10)[:200],
+                    location="Remote",
+                    job_type="Full-time",
+                    salary_min=Decimal("50000.00") if i % 2 else None,
+                    salary_max=Decimal("90000.50") if i % 2 else None,
+                    skills="python, django",
+                )
+                for i in range(options["rows"])
+            ]
+        )
+        queryset = Job.objects.filter(company=company).order_by("-created_at", "-id")
+
+        self.stdout.write(f"{options['rows']} rows, median of {options['runs']} runs")
+        self.stdout.write(f"{'serializer':>18} {'path':>10} {'ms':>8} {'rows/s':>10} {'bytes':>8}")
+        for serializer_class in (JobCardSerializer, JobSerializer):
+            builder = RowBuilder.for_serializer(serializer_class())
+            outputs = {}
+            for label, render in (
+                ("drf", lambda: self._drf(serializer_class, queryset)),
+                ("fast", lambda: self._fast(builder, queryset)),
+            ):
+                times = []
+                for _ in range(options["runs"]):
+                    start = time.perf_counter()
+                    outputs[label] = render()
+                    times.append(time.perf_counter() - start)
+                median = statistics.median(times)
+                self.stdout.write(
+                    f"{serializer_class.__name__:>18} {label:>10} {median * 1000:>8.1f} "
+                    f"{options['rows'] / median:>10.0f} {len(outputs[label]):>8}"
+                )
+            if outputs["drf"] != outputs["fast"]:
+                self.stderr.write(f"{serializer_class.__name__}: output differs!")
+
+    def _drf(self, serializer_class, queryset):
+        queryset = queryset.select_related("company")
+        return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+    def _fast(self, builder, queryset):
+        return dumps(builder.rows(queryset.values(*builder.sources)))
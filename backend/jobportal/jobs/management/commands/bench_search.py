@@ -0,0 +1,116 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import User, Company
+from jobs.models import Job
+from jobs import search_utils
+
+
+WORDS = (
+    "python django react node java spring golang rust kotlin swift sql "
+    "postgres redis kafka docker kubernetes aws azure gcp terraform linux "
+    "backend frontend fullstack mobile data machine learning analytics "
+    "api rest graphql testing security devops cloud design product"
+).split()
+
+QUERIES = ["django", "react developer", "kuber", "machine learning", "zzzz"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the public job search: FTS5 index vs the old icontains "
+        "scan. Synthetic jobs are created inside a transaction that is "
+        "rolled back at the end, so the database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default="1000,10000,100000",
+            help="Comma-separated active-job table sizes to measure.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if not search_utils.fts_enabled():
+            raise CommandError("FTS5 index not available (SQLite only, run migrate).")
+
+        sizes = sorted(int(s) for s in options["sizes"].split(",") if s.strip())
+        self.repeat = options["repeat"]
+        self.page_size = options["page_size"]
+
+        try:
+            with transaction.atomic():
+                self._run(sizes)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, sizes):
+        user = User.objects.create_user(
+            username="bench-search-recruiter", password="x", role="recruiter"
+        )
+        company = Company.objects.create(user=user, name="Bench Corp")
+        rng = random.Random(42)
+
+        self.stdout.write(
+            f"{'jobs':>8} {'query':<18} {'icontains ms':>13} {'fts ms':>9} {'speedup':>8}"
+        )
+
+        created = 0
+        for size in sizes:
+            batch = []
+            for i in range(created, size):
+                words = rng.sample(WORDS, 12)
+                batch.append(Job(
+                    company=company,
+                    title=" ".join(words[:3]).title(),
+                    description=" ".join(words * 4),
+                    location="Remote",
+                    job_type="Full-time",
+                    skills=", ".join(words[3:6]),
+                ))
+            Job.objects.bulk_create(batch, batch_size=2000)
+            created = size
+            # bulk_create skips signals – refresh the shadow index in one go
+            search_utils.rebuild_index()
+
+            for query in QUERIES:
+                old = self._time(lambda: self._icontains(query))
+                new = self._time(lambda: self._fts(query))
+                speedup = old / new if new else float("inf")
+                self.stdout.write(
+                    f"{size:>8} {query:<18} {old:>13.2f} {new:>9.2f} {speedup:>7.1f}x"
+                )
+
+    def _base_qs(self):
+        return Job.objects.filter(is_active=True).order_by("-created_at")
+
+    def _icontains(self, query):
+        qs = self._base_qs().filter(
+            Q(title__icontains=query)
+            | Q(description__icontains=query)
+            | Q(company__name__icontains=query)
+        )
+        return list(qs[: self.page_size])
+
+    def _fts(self, query):
+        qs = search_utils.apply_search(self._base_qs(), query)
+        return list(qs[: self.page_size])
+
+    def _time(self, fn):
+        samples = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
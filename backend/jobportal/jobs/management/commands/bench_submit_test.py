@@ -0,0 +1,127 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User, Company, CandidateProfile
+from jobs.models import Job, Application, JobTest, JobTestQuestion, JobTestAnswer
+from jobs.serializers import JobTestAnswerInputSerializer
+from jobs.test_utils import grade_submission
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark grading a submit-test request: batched grading vs the old "
+        "per-answer loop. Runs inside a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, default=25)
+        parser.add_argument("--runs", type=int, default=50)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, options):
+        rng = random.Random(7)
+
+        recruiter = User.objects.create_user(
+            username="bench-grade-recruiter", password="x", role="recruiter"
+        )
+        company = Company.objects.create(user=recruiter, name="Bench Corp")
+        job = Job.objects.create(
+            company=company, title="Bench Engineer", description="python", skills="python"
+        )
+        candidate = User.objects.create_user(
+            username="bench-grade-candidate", password="x", role="candidate"
+        )
+        profile = CandidateProfile.objects.create(user=candidate)
+        application = Application.objects.create(job=job, candidate=profile)
+        test = JobTest.objects.create(
+            application=application,
+            generation_status="ready",
+            total_marks=options["questions"] * 2,
+        )
+        questions = JobTestQuestion.objects.bulk_create(
+            [
+                JobTestQuestion(
+                    test=test,
+                    text=f"Question {i}",
+                    option_a="a", option_b="b", option_c="c", option_d="d",
+                    correct_option=rng.choice("ABCD"),
+                )
+                for i in range(options["questions"])
+            ]
+        )
+        answers = [
+            {"question_id": q.pk, "selected_option": rng.choice("ABCD")}
+            for q in questions
+        ]
+
+        results = {}
+        for label, grade in (("old", self._legacy_grade), ("batched", self._batched_grade)):
+            times, queries, scores = [], None, set()
+            for _ in range(options["runs"]):
+                JobTestAnswer.objects.filter(application=application).delete()
+                JobTest.objects.filter(pk=test.pk).update(completed_at=None, score=None)
+                test.refresh_from_db()
+                connection.queries_log.clear()  # keep CaptureQueriesContext under its cap
+
+                start = time.perf_counter()
+                with CaptureQueriesContext(connection) as ctx:
+                    scores.add(grade(test, application, answers))
+                times.append((time.perf_counter() - start) * 1000)
+                queries = len(ctx.captured_queries)
+            results[label] = (statistics.median(times), queries, scores)
+
+        self.stdout.write(f"{'path':>8} {'median ms':>10} {'queries':>8} {'score':>6}")
+        for label, (ms, queries, scores) in results.items():
+            self.stdout.write(f"{label:>8} {ms:>10.2f} {queries:>8} {sorted(scores)!s:>6}")
+
+    def _batched_grade(self, test, application, answers):
+        ser = JobTestAnswerInputSerializer(data=answers, many=True)
+        ser.is_valid(raise_exception=True)
+        return grade_submission(test, application, ser.validated_data).score
+
+    def _legacy_grade(self, test, application, answers):
+        """The grading loop ApplicationViewSet.submit_test used before."""
+        total_score = 0
+        for ans in answers:
+            ser = JobTestAnswerInputSerializer(data=ans)
+            ser.is_valid(raise_exception=True)
+
+            q_id = ser.validated_data["question_id"]
+            selected = ser.validated_data["selected_option"]
+
+            try:
+                question = JobTestQuestion.objects.get(id=q_id, test=test)
+            except JobTestQuestion.DoesNotExist:
+                continue
+
+            JobTestAnswer.objects.update_or_create(
+                question=question,
+                application=application,
+                defaults={"selected_option": selected},
+            )
+
+            if question.correct_option == selected:
+                total_score += 2
+
+        test.score = total_score
+        test.passed = total_score > 30
+        test.completed_at = timezone.now()
+        test.save()
+        return total_score
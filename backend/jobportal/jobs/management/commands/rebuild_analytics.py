@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs import analytics_utils
+
+
+class Command(BaseCommand):
+    help = "Recount the recruiter analytics rollups (daily, weekly, monthly) from the applications."
+
+    def handle(self, *args, **options):
+        count = analytics_utils.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} rollup rows."))
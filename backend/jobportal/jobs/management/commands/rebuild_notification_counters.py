@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs import notification_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the unread notification counters (NotificationCounter) from the notifications."
+
+    def handle(self, *args, **options):
+        count = notification_counters.recount()
+        self.stdout.write(self.style.SUCCESS(f"Counted unread notifications for {count} users."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs import recommendation_utils
+
+
+class Command(BaseCommand):
+    help = "Rebuild the TF-IDF job vectors used by /api/jobs/recommended/ from scratch."
+
+    def handle(self, *args, **options):
+        count = recommendation_utils.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} active jobs."))
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs import tasks
+
+
+class Command(BaseCommand):
+    help = "Background task worker: runs queued BackgroundTask rows (alert fan-out, ...)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--burst", action="store_true",
+            help="Exit once the queue is empty instead of polling forever.",
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=1.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+        parser.add_argument("--max-tasks", type=int, default=0, help="Stop after N tasks (0 = no limit).")
+        parser.add_argument("--worker", default="", help="Worker name stored on claimed tasks.")
+
+    def handle(self, *args, **options):
+        worker = options["worker"] or tasks.default_worker_name()
+        processed = 0
+        self.stdout.write(f"Worker {worker} started.")
+
+        try:
+            while True:
+                task_obj = tasks.claim_next(worker)
+                if task_obj is None:
+                    if options["burst"]:
+                        break
+                    time.sleep(options["sleep"])
+                    continue
+
+                start = time.perf_counter()
+                status = tasks.execute(task_obj)
+                elapsed = (time.perf_counter() - start) * 1000
+                total = task_obj.progress_total
+                progress = f" {task_obj.progress_done}/{total}" if total is not None else ""
+                self.stdout.write(
+                    f"{task_obj.name} #{task_obj.pk}: {status}{progress} in {elapsed:.0f} ms"
+                )
+
+                processed += 1
+                if options["max_tasks"] and processed >= options["max_tasks"]:
+                    break
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(f"Worker {worker} stopped after {processed} task(s).")
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs import digests
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue the notification digest emails that are due (candidates with "
+        "email_frequency daily / weekly). Run it hourly from cron; the outbox "
+        "worker (send_outbox) sends them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--frequency", choices=sorted(digests.PERIODS), action="append",
+            help="Only this frequency (repeatable). Default: all.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=digests.CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        for frequency in options["frequency"] or sorted(digests.PERIODS):
+            start = time.perf_counter()
+            totals = digests.send_digests(frequency, chunk_size=options["chunk_size"])
+            elapsed = (time.perf_counter() - start) * 1000
+            self.stdout.write(
+                f"{frequency}: {totals['emails']} digests for {totals['candidates']} candidates "
+                f"({totals['notifications']} notifications) in {elapsed:.0f} ms"
+            )
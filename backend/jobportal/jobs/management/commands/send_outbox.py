@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs import outbox, tasks
+
+
+class Command(BaseCommand):
+    help = "Email sender: delivers queued EmailOutbox rows in batches over one backend connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--burst", action="store_true",
+            help="Exit once nothing is due instead of polling forever.",
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=1.0,
+            help="Seconds to wait between polls when nothing is due.",
+        )
+        parser.add_argument("--batch-size", type=int, default=outbox.BATCH_SIZE)
+        parser.add_argument("--worker", default="", help="Sender name stored on claimed emails.")
+
+    def handle(self, *args, **options):
+        worker = options["worker"] or tasks.default_worker_name()
+        totals = {"sent": 0, "retried": 0, "dead": 0}
+        self.stdout.write(f"Sender {worker} started.")
+
+        try:
+            while True:
+                batch = outbox.claim_batch(worker, options["batch_size"])
+                if not batch:
+                    if options["burst"]:
+                        break
+                    time.sleep(options["sleep"])
+                    continue
+
+                start = time.perf_counter()
+                result = outbox.deliver(batch)
+                elapsed = time.perf_counter() - start
+                for key, value in result.items():
+                    totals[key] += value
+                self.stdout.write(
+                    f"{len(batch)} emails: {result['sent']} sent, {result['retried']} retried, "
+                    f"{result['dead']} dead in {elapsed * 1000:.0f} ms "
+                    f"({len(batch) / elapsed:.0f}/s)"
+                )
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            f"Sender {worker} stopped: {totals['sent']} sent, "
+            f"{totals['retried']} retried, {totals['dead']} dead."
+        )
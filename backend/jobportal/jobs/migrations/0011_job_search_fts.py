@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:19
+
+from django.db import migrations
+
+
+def create_fts_index(apps, schema_editor):
+    # FTS5 is SQLite-only; other backends keep the icontains search path.
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_job_fts USING fts5("
+        "title, description, skills, company_name, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    # Default ranking: bm25 weighted title, description, skills, company_name
+    schema_editor.execute(
+        "INSERT INTO jobs_job_fts (jobs_job_fts, rank) "
+        "VALUES ('rank', 'bm25(10.0, 1.0, 5.0, 3.0)')"
+    )
+    schema_editor.execute(
+        "INSERT INTO jobs_job_fts (rowid, title, description, skills, company_name) "
+        "SELECT j.id, j.title, j.description, COALESCE(j.skills, ''), c.name "
+        "FROM jobs_job j JOIN accounts_company c ON c.id = j.company_id"
+    )
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS jobs_job_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0010_applicationstatusnotification'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
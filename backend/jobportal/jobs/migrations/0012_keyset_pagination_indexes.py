@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0011_job_search_fts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-applied_at', '-id'], name='application_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicationstatusnotification',
+            index=models.Index(fields=['-created_at', '-id'], name='statusnotif_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['-scheduled_at', '-id'], name='interview_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['is_active', '-created_at', '-id'], name='job_active_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobalertnotification',
+            index=models.Index(fields=['candidate', '-created_at', '-id'], name='jobalertnotif_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedjob',
+            index=models.Index(fields=['candidate', '-saved_at', '-id'], name='savedjob_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:26
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of jobs.text_utils helpers as of this migration: later
+# changes to the live code must not change what this migration does.
+_LIST_SPLIT_RE = re.compile(r"[,\n;]")
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def split_terms(text):
+    terms = []
+    seen = set()
+    for part in _LIST_SPLIT_RE.split(text or ""):
+        term = " ".join(tok.rstrip(".") for tok in _TOKEN_RE.findall(part.lower()))
+        if term and term not in seen:
+            seen.add(term)
+            terms.append(term)
+    return terms
+
+
+def populate_skill_index(apps, schema_editor):
+    Skill = apps.get_model("jobs", "Skill")
+    JobSkill = apps.get_model("jobs", "JobSkill")
+    CandidateSkill = apps.get_model("jobs", "CandidateSkill")
+    Job = apps.get_model("jobs", "Job")
+    CandidateProfile = apps.get_model("accounts", "CandidateProfile")
+
+    jobs = {pk: split_terms(text) for pk, text in Job.objects.values_list("id", "skills")}
+    candidates = {
+        pk: split_terms(text)
+        for pk, text in CandidateProfile.objects.values_list("id", "skills")
+    }
+
+    names = {n for terms in [*jobs.values(), *candidates.values()] for n in terms}
+    names = [n for n in names if len(n) <= 100]
+    Skill.objects.bulk_create([Skill(name=n) for n in names], ignore_conflicts=True)
+    ids = dict(Skill.objects.values_list("name", "id"))
+
+    JobSkill.objects.bulk_create(
+        [JobSkill(job_id=pk, skill_id=ids[n]) for pk, terms in jobs.items() for n in terms if n in ids],
+        ignore_conflicts=True,
+    )
+    CandidateSkill.objects.bulk_create(
+        [CandidateSkill(candidate_id=pk, skill_id=ids[n]) for pk, terms in candidates.items() for n in terms if n in ids],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0012_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.job')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.skill')),
+            ],
+            options={
+                'unique_together': {('skill', 'job')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CandidateSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='accounts.candidateprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_links', to='jobs.skill')),
+            ],
+            options={
+                'unique_together': {('skill', 'candidate')},
+            },
+        ),
+        migrations.RunPython(populate_skill_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:27
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# split_terms as it was in jobs.text_utils when this index was added
+_LIST_SPLIT_RE = re.compile(r"[,\n;]")
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def split_terms(text):
+    terms = []
+    seen = set()
+    for part in _LIST_SPLIT_RE.split(text or ""):
+        term = " ".join(tok.rstrip(".") for tok in _TOKEN_RE.findall(part.lower()))
+        if term and term not in seen:
+            seen.add(term)
+            terms.append(term)
+    return terms
+
+
+def populate_alert_index(apps, schema_editor):
+    JobAlert = apps.get_model("jobs", "JobAlert")
+    JobAlertTerm = apps.get_model("jobs", "JobAlertTerm")
+
+    rows = []
+    for alert in JobAlert.objects.filter(is_active=True):
+        terms = [t for t in split_terms(alert.keywords) if len(t.split()) <= 5] or [""]
+        rows.extend(
+            JobAlertTerm(
+                alert_id=alert.id,
+                candidate_id=alert.candidate_id,
+                term=term,
+                location=(alert.location or "").strip().lower(),
+                job_type=(alert.job_type or "").strip().lower(),
+            )
+            for term in terms
+        )
+    JobAlertTerm.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0013_skill_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobAlertTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=200)),
+                ('location', models.CharField(blank=True, max_length=100)),
+                ('job_type', models.CharField(blank=True, max_length=50)),
+                ('alert', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='jobs.jobalert')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='accounts.candidateprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'job_type'], name='jobalertterm_lookup_idx')],
+            },
+        ),
+        migrations.RunPython(populate_alert_index, migrations.RunPython.noop),
+    ]
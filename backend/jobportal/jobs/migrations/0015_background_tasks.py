@@ -0,0 +1,61 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def drop_duplicate_alert_notifications(apps, schema_editor):
+    # keep the oldest row per (job, alert) before adding the unique constraint
+    JobAlertNotification = apps.get_model("jobs", "JobAlertNotification")
+    seen = set()
+    duplicates = []
+    for pk, job_id, alert_id in (
+        JobAlertNotification.objects.exclude(alert=None)
+        .order_by("id")
+        .values_list("id", "job_id", "alert_id")
+    ):
+        if (job_id, alert_id) in seen:
+            duplicates.append(pk)
+        else:
+            seen.add((job_id, alert_id))
+    JobAlertNotification.objects.filter(id__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0014_job_alert_term_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('dedupe_key', models.CharField(blank=True, max_length=200, null=True, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=5)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('progress_done', models.PositiveIntegerField(default=0)),
+                ('progress_total', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(drop_duplicate_alert_notifications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='jobalertnotification',
+            constraint=models.UniqueConstraint(fields=('job', 'alert'), name='unique_job_alert_notification'),
+        ),
+        migrations.AddIndex(
+            model_name='backgroundtask',
+            index=models.Index(fields=['status', 'run_after'], name='task_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:31
+
+import math
+import re
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of the jobs.text_utils / jobs.recommendation_utils helpers
+# as of this migration: later changes to the live code must not change
+# what this migration does.
+MAX_TERM_WORDS = 5
+DOC_TERM = ""
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text):
+    return [tok.rstrip(".") for tok in _TOKEN_RE.findall((text or "").lower())]
+
+
+def ngrams(tokens, max_n):
+    for i in range(len(tokens)):
+        for n in range(1, max_n + 1):
+            if i + n > len(tokens):
+                break
+            yield " ".join(tokens[i : i + n])
+
+
+def term_weights(tokens, vocabulary):
+    if not tokens:
+        return {}
+    counts = Counter(g for g in ngrams(tokens, MAX_TERM_WORDS) if g in vocabulary)
+    norm = math.sqrt(len(tokens))
+    return {term: (1 + math.log(tf)) / norm for term, tf in counts.items()}
+
+
+def populate_recommendation_index(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Skill = apps.get_model("jobs", "Skill")
+    JobTermWeight = apps.get_model("jobs", "JobTermWeight")
+    TermStat = apps.get_model("jobs", "TermStat")
+
+    vocabulary = set(Skill.objects.values_list("name", flat=True))
+    rows = []
+    df = Counter()
+    jobs = Job.objects.filter(is_active=True).only("id", "title", "description", "skills")
+    for job in jobs.iterator(chunk_size=500):
+        weights = term_weights(
+            tokenize(f"{job.title} {job.description} {job.skills or ''}"), vocabulary
+        )
+        weights[DOC_TERM] = 0.0
+        df.update(weights.keys())
+        rows.extend(JobTermWeight(job_id=job.id, term=t, weight=w) for t, w in weights.items())
+        if len(rows) >= 2000:
+            JobTermWeight.objects.bulk_create(rows)
+            rows = []
+    JobTermWeight.objects.bulk_create(rows)
+    TermStat.objects.bulk_create([TermStat(term=t, df=n) for t, n in df.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0015_background_tasks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TermStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, unique=True)),
+                ('df', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobTermWeight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='term_weights', to='jobs.job')),
+            ],
+            options={
+                'unique_together': {('term', 'job')},
+            },
+        ),
+        migrations.RunPython(populate_recommendation_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0016_recommendation_index"),
+    ]
+
+    operations = [
+        # tests created before this migration already have their questions
+        migrations.AddField(
+            model_name="jobtest",
+            name="generation_status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("ready", "Ready"), ("failed", "Failed")],
+                default="ready",
+                max_length=10,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="jobtest",
+            name="generation_status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("ready", "Ready"), ("failed", "Failed")],
+                default="pending",
+                max_length=10,
+            ),
+        ),
+    ]
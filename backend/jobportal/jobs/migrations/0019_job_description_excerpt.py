@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:45
+
+from django.db import migrations, models
+
+# Job.description_excerpt length at the time of this migration
+DESCRIPTION_EXCERPT_LENGTH = 200
+
+
+def excerpt(text, length):
+    # frozen copy of jobs.text_utils.excerpt as of this migration
+    text = " ".join((text or "").split())
+    if len(text) <= length:
+        return text
+    cut = text[: length - 1]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def populate_description_excerpts(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    batch = []
+    for job in Job.objects.only("id", "description").iterator(chunk_size=500):
+        job.description_excerpt = excerpt(job.description, DESCRIPTION_EXCERPT_LENGTH)
+        batch.append(job)
+        if len(batch) >= 500:
+            Job.objects.bulk_update(batch, ["description_excerpt"])
+            batch = []
+    Job.objects.bulk_update(batch, ["description_excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0018_question_bank'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='description_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(populate_description_excerpts, migrations.RunPython.noop),
+    ]
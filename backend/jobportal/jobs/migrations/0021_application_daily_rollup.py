@@ -0,0 +1,55 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def populate_rollups(apps, schema_editor):
+    Application = apps.get_model("jobs", "Application")
+    ApplicationDailyRollup = apps.get_model("jobs", "ApplicationDailyRollup")
+    rows = (
+        Application.objects.annotate(day=TruncDate("applied_at", tzinfo=timezone.get_current_timezone()))
+        .values("job_id", "job__company_id", "day", "status")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    ApplicationDailyRollup.objects.bulk_create(
+        [
+            ApplicationDailyRollup(
+                job_id=row["job_id"], company_id=row["job__company_id"],
+                day=row["day"], status=row["status"], count=row["n"],
+            )
+            for row in rows.iterator(chunk_size=1000)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0020_table_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='accounts.company')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'day'], name='application_rollup_company_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'day', 'status'), name='unique_application_rollup')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
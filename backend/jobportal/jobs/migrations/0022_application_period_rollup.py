@@ -0,0 +1,56 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:58
+
+import django.db.models.deletion
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def populate_period_rollups(apps, schema_editor):
+    ApplicationDailyRollup = apps.get_model("jobs", "ApplicationDailyRollup")
+    ApplicationPeriodRollup = apps.get_model("jobs", "ApplicationPeriodRollup")
+    totals = defaultdict(int)
+    rows = ApplicationDailyRollup.objects.values_list("job_id", "company_id", "day", "status", "count")
+    for job_id, company_id, day, status, count in rows.iterator(chunk_size=1000):
+        week = day - timedelta(days=day.weekday())
+        totals[(job_id, company_id, "week", week, status)] += count
+        totals[(job_id, company_id, "month", day.replace(day=1), status)] += count
+    ApplicationPeriodRollup.objects.bulk_create(
+        [
+            ApplicationPeriodRollup(
+                job_id=job_id, company_id=company_id, interval=interval,
+                period_start=period_start, status=status, count=count,
+            )
+            for (job_id, company_id, interval, period_start, status), count in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0021_application_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationPeriodRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interval', models.CharField(choices=[('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('period_start', models.DateField()),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='accounts.company')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'interval', 'period_start'], name='application_period_company_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'interval', 'period_start', 'status'), name='unique_application_period_rollup')],
+            },
+        ),
+        migrations.RunPython(populate_period_rollups, migrations.RunPython.noop),
+    ]
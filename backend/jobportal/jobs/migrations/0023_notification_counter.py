@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    NotificationCounter = apps.get_model("jobs", "NotificationCounter")
+    totals = {}
+    sources = [
+        ("JobAlertNotification", "candidate__user_id", "job_alerts_unread"),
+        ("ApplicationStatusNotification", "application__candidate__user_id", "application_status_unread"),
+    ]
+    for model_name, user_path, field in sources:
+        rows = (
+            apps.get_model("jobs", model_name).objects.filter(is_read=False)
+            .values_list(user_path).annotate(n=Count("id")).order_by()
+        )
+        for user_id, n in rows:
+            totals.setdefault(user_id, {})[field] = n
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, **fields) for user_id, fields in totals.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0022_application_period_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('job_alerts_unread', models.PositiveIntegerField(default=0)),
+                ('application_status_unread', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_recruiterprofile'),
+        ('jobs', '0023_notification_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJobAlertNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='jobalertnotification',
+            index=models.Index(fields=['created_at', 'id'], name='jobalertnotif_age_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedjobalertnotification',
+            name='candidate',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_job_notifications', to='accounts.candidateprofile'),
+        ),
+        migrations.AddField(
+            model_name='archivedjobalertnotification',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedjobalertnotification',
+            index=models.Index(fields=['candidate', '-created_at', '-id'], name='archivednotif_keyset_idx'),
+        ),
+    ]
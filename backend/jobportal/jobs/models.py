@@ -3,6 +3,11 @@ from accounts.models import Company, CandidateProfile
 from decimal import Decimal
 from django.utils import timezone
 
+from .text_utils import excerpt
+
+# Length of Job.description_excerpt (list cards)
+DESCRIPTION_EXCERPT_LENGTH = 200
+
 
 class Job(models.Model):
     company = models.ForeignKey(Company, on_delete=models.CASCADE)
@@ -37,9 +42,25 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # 🔹 Short plain-text preview for list cards, kept in sync on save()
+    description_excerpt = models.CharField(max_length=255, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # keyset pagination of the public list: active, newest first
+            models.Index(fields=["is_active", "-created_at", "-id"], name="job_active_keyset_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.description_excerpt = excerpt(self.description, DESCRIPTION_EXCERPT_LENGTH)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "description" in update_fields:
+            kwargs["update_fields"] = set(update_fields) | {"description_excerpt"}
+        super().save(*args, **kwargs)
+
 
 
 class Application(models.Model):
@@ -64,11 +85,75 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ("job", "candidate")
+        indexes = [
+            models.Index(fields=["-applied_at", "-id"], name="application_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"{self.candidate.user.username} → {self.job.title}"
 
 
+class ApplicationDailyRollup(models.Model):
+    """
+    Number of applications per (job, day applied, current status), kept up
+    to date by the Application signals (analytics_utils) and rebuilt by
+    `manage.py rebuild_analytics`. Recruiter analytics read these rows
+    instead of scanning applications.
+    """
+    company = models.ForeignKey(Company, on_delete=models.CASCADE)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE)
+    day = models.DateField()
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["job", "day", "status"], name="unique_application_rollup"),
+        ]
+        indexes = [
+            models.Index(fields=["company", "day"], name="application_rollup_company_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.day} {self.status}: {self.count}"
+
+
+class ApplicationPeriodRollup(models.Model):
+    """
+    ApplicationDailyRollup summed per ISO week / calendar month, maintained
+    alongside it, so long-range analytics series read one row per period
+    instead of one per day.
+    """
+    INTERVAL_CHOICES = (
+        ("week", "Week"),
+        ("month", "Month"),
+    )
+
+    company = models.ForeignKey(Company, on_delete=models.CASCADE)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE)
+    interval = models.CharField(max_length=5, choices=INTERVAL_CHOICES)
+    period_start = models.DateField()  # Monday / first of the month
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "interval", "period_start", "status"],
+                name="unique_application_period_rollup",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["company", "interval", "period_start"],
+                name="application_period_company_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.interval} {self.period_start} {self.status}: {self.count}"
+
+
 class SavedJob(models.Model):
     candidate = models.ForeignKey("accounts.CandidateProfile", on_delete=models.CASCADE)
     job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE)
@@ -76,6 +161,9 @@ class SavedJob(models.Model):
 
     class Meta:
         unique_together = ("candidate", "job")  # prevent duplicates
+        indexes = [
+            models.Index(fields=["candidate", "-saved_at", "-id"], name="savedjob_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"{self.candidate.user.username} saved {self.job.title}"
@@ -98,6 +186,30 @@ class JobAlert(models.Model):
         return f"Alert for {self.candidate.user.username}: {self.keywords}"
 
 
+class JobAlertTerm(models.Model):
+    """
+    Inverted index of active job alerts: one row per (alert, keyword).
+    Alerts without keywords get a single row with term="" (match all).
+    location / job_type are copied lower-cased so a new job is matched
+    with one indexed lookup (see alert_matching).
+    """
+    alert = models.ForeignKey(JobAlert, on_delete=models.CASCADE, related_name="terms")
+    candidate = models.ForeignKey(
+        "accounts.CandidateProfile", on_delete=models.CASCADE, related_name="+"
+    )
+    term = models.CharField(max_length=200)
+    location = models.CharField(max_length=100, blank=True)
+    job_type = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["term", "job_type"], name="jobalertterm_lookup_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.term!r} → alert {self.alert_id}"
+
+
 class JobAlertNotification(models.Model):
     candidate = models.ForeignKey(
         "accounts.CandidateProfile",
@@ -113,11 +225,45 @@ class JobAlertNotification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["candidate", "-created_at", "-id"], name="jobalertnotif_keyset_idx"),
+            # retention scans (jobs.retention)
+            models.Index(fields=["created_at", "id"], name="jobalertnotif_age_idx"),
+        ]
+        constraints = [
+            # one notification per (job, alert): makes alert fan-out idempotent
+            models.UniqueConstraint(fields=["job", "alert"], name="unique_job_alert_notification"),
+        ]
 
     def __str__(self):
         return f"Notification for {self.candidate.user.username} - {self.job.title}"
 
 
+class ArchivedJobAlertNotification(models.Model):
+    """
+    Cold copy of a JobAlertNotification moved out of the hot table by
+    jobs.retention: same id and created_at (inbox order and cursors don't
+    change), read by definition, no alert link.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    candidate = models.ForeignKey(
+        "accounts.CandidateProfile",
+        on_delete=models.CASCADE,
+        related_name="archived_job_notifications",
+    )
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["candidate", "-created_at", "-id"], name="archivednotif_keyset_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived notification {self.pk} (job {self.job_id})"
+
+
 class ApplicationStatusNotification(models.Model):
     application = models.ForeignKey(
         Application,
@@ -131,11 +277,33 @@ class ApplicationStatusNotification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="statusnotif_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"Status notification: {self.application.candidate.user.username} - {self.status}"
 
 
+class NotificationCounter(models.Model):
+    """
+    Unread notifications of a candidate, per kind, for the navbar badge
+    (GET /api/alerts/unread-count/). Keyed by user so the endpoint is one
+    primary key read; maintained by notification_counters.py.
+    """
+    user = models.OneToOneField(
+        "accounts.User",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_counter",
+    )
+    job_alerts_unread = models.PositiveIntegerField(default=0)
+    application_status_unread = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.job_alerts_unread} + {self.application_status_unread} unread"
+
+
 class Interview(models.Model):
     STATUS_CHOICES = (
         ("scheduled", "Scheduled"),
@@ -167,6 +335,11 @@ class Interview(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-scheduled_at", "-id"], name="interview_keyset_idx"),
+        ]
+
     def __str__(self):
         return (
             f"Interview for {self.application.candidate.user.username} - "
@@ -175,11 +348,21 @@ class Interview(models.Model):
 
 
 class JobTest(models.Model):
+    GENERATION_STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    )
+
     application = models.OneToOneField(
         Application,
         on_delete=models.CASCADE,
         related_name="test",
     )
+    # questions are generated by the "generate_test" background task
+    generation_status = models.CharField(
+        max_length=10, choices=GENERATION_STATUS_CHOICES, default="pending"
+    )
     total_marks = models.IntegerField(default=50)
     score = models.IntegerField(null=True, blank=True)
     passed = models.BooleanField(default=False)
@@ -232,4 +415,210 @@ class JobTestAnswer(models.Model):
         unique_together = ("question", "application")
 
     def __str__(self):
-        return f"Answer for Q{self.question_id} - App {self.application_id}"
\ No newline at end of file
+        return f"Answer for Q{self.question_id} - App {self.application_id}"
+
+
+# ===========================
+#   QUESTION BANK (generated MCQ cache)
+# ===========================
+
+class QuestionBank(models.Model):
+    """
+    Pool of generated questions for one normalized skill set, shared by all
+    applications to jobs with those skills (question_bank.py).
+    """
+    skill_key = models.CharField(max_length=64, unique=True)  # sha256 of the skill set
+    skills = models.TextField(blank=True)  # normalized, sorted, ", "-joined
+    created_at = models.DateTimeField(auto_now_add=True)
+    refreshed_at = models.DateTimeField(auto_now_add=True)  # TTL counts from here
+    last_used_at = models.DateTimeField(auto_now_add=True, db_index=True)  # LRU
+
+    def __str__(self):
+        return self.skills or "(no skills)"
+
+
+class QuestionBankItem(models.Model):
+    bank = models.ForeignKey(
+        QuestionBank,
+        on_delete=models.CASCADE,
+        related_name="items",
+    )
+    text = models.TextField()
+    option_a = models.CharField(max_length=255)
+    option_b = models.CharField(max_length=255)
+    option_c = models.CharField(max_length=255)
+    option_d = models.CharField(max_length=255)
+    correct_option = models.CharField(max_length=1, choices=OPTION_CHOICES)
+
+    def __str__(self):
+        return f"Q{self.id} - Bank {self.bank_id}"
+
+# ===========================
+#   NORMALIZED SKILL INDEX
+# ===========================
+
+class Skill(models.Model):
+    """
+    One row per normalized skill name ("rest api", "node.js").
+    Filled from Job.skills / CandidateProfile.skills on save (skill_utils).
+    """
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class JobSkill(models.Model):
+    # (skill, job) unique index doubles as the posting list: skill -> jobs
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="job_links")
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="skill_links")
+
+    class Meta:
+        unique_together = ("skill", "job")
+
+    def __str__(self):
+        return f"{self.job_id} → {self.skill_id}"
+
+
+class CandidateSkill(models.Model):
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="candidate_links")
+    candidate = models.ForeignKey(
+        "accounts.CandidateProfile", on_delete=models.CASCADE, related_name="skill_links"
+    )
+
+    class Meta:
+        unique_together = ("skill", "candidate")
+
+    def __str__(self):
+        return f"{self.candidate_id} → {self.skill_id}"
+
+
+# ===========================
+#   RECOMMENDATION INDEX
+# ===========================
+
+class JobTermWeight(models.Model):
+    """
+    Sparse TF vector of an active job over the Skill vocabulary: one row per
+    (job, skill term) found in its text, plus a term="" row marking the job
+    as indexed. Scored against candidate skills in recommendation_utils.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="term_weights")
+    term = models.CharField(max_length=100)
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ("term", "job")  # term -> jobs posting list
+
+    def __str__(self):
+        return f"{self.term!r} in job {self.job_id}: {self.weight:.3f}"
+
+
+class TermStat(models.Model):
+    """
+    Document frequency of a term over indexed (active) jobs.
+    term="" holds the number of indexed jobs (N for the IDF).
+    """
+    term = models.CharField(max_length=100, unique=True)
+    df = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.term!r}: {self.df}"
+
+
+# ===========================
+#   BACKGROUND TASK QUEUE
+# ===========================
+
+class BackgroundTask(models.Model):
+    """
+    DB-backed task queue row, executed by `manage.py run_tasks`
+    (see tasks.py for the handlers).
+    """
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    )
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    # enqueueing twice with the same key is a no-op
+    dedupe_key = models.CharField(max_length=200, unique=True, null=True, blank=True)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="task_queue_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class EmailOutbox(models.Model):
+    """
+    An email to send, written in the transaction of the change it reports
+    and delivered by `manage.py send_outbox` (see outbox.py).
+    """
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("dead", "Dead"),  # gave up after max_attempts
+    )
+
+    to = models.EmailField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    send_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "send_after", "id"], name="email_outbox_queue_idx"),
+        ]
+
+    def __str__(self):
+        return f"Email #{self.pk} to {self.to} ({self.status})"
+
+
+# ===========================
+#   CONDITIONAL GET
+# ===========================
+
+class TableVersion(models.Model):
+    """
+    Change counter per table, bumped by every write that can change an API
+    response (see conditional.py). ETags / Last-Modified are derived from it.
+    """
+    table = models.CharField(max_length=100, unique=True)  # model label, e.g. "jobs.job"
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.table} v{self.version}"
@@ -0,0 +1,113 @@
+# jobportal/jobs/notification_counters.py
+
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from accounts.models import CandidateProfile
+from .models import ApplicationStatusNotification, JobAlertNotification, NotificationCounter
+from . import conditional
+
+# counter column per notification model
+FIELDS = {
+    JobAlertNotification: "job_alerts_unread",
+    ApplicationStatusNotification: "application_status_unread",
+}
+# unread rows of each model -> owning user
+USER_PATHS = {
+    JobAlertNotification: "candidate__user_id",
+    ApplicationStatusNotification: "application__candidate__user_id",
+}
+
+
+def add(model, deltas):
+    """
+    Apply {user_id: delta} to the `model` unread counters: one INSERT
+    (missing rows) + one atomic F() UPDATE per distinct delta.
+    Counters never go below 0.
+    """
+    field = FIELDS[model]
+    by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(user_id)
+    for delta, user_ids in by_delta.items():
+        if delta > 0:
+            NotificationCounter.objects.bulk_create(
+                [NotificationCounter(user_id=user_id) for user_id in user_ids],
+                ignore_conflicts=True,
+            )
+            value = F(field) + delta
+        else:
+            value = Greatest(F(field) + delta, 0)
+        NotificationCounter.objects.filter(user_id__in=user_ids).update(**{field: value})
+
+
+def user_ids_for_candidates(candidate_ids):
+    return dict(
+        CandidateProfile.objects.filter(pk__in=set(candidate_ids)).values_list("pk", "user_id")
+    )
+
+
+def notifications_created(model, candidate_ids):
+    """Bulk paths (bulk_create sends no post_save): one +1 per new unread notification."""
+    users = user_ids_for_candidates(candidate_ids)
+    add(model, Counter(users[c] for c in candidate_ids if c in users))
+
+
+def unread_removed(model, queryset):
+    """Call before deleting `queryset` (e.g. pre_delete of the parent whose cascade removes it)."""
+    rows = (
+        queryset.filter(is_read=False)
+        .values_list(USER_PATHS[model])
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    add(model, {user_id: -n for user_id, n in rows})
+
+
+def mark_read(notification, user_id):
+    """
+    Mark one notification read; the counter only moves if this call
+    flipped it (conditional UPDATE), so double clicks count once.
+    """
+    model = type(notification)
+    with transaction.atomic():
+        if model.objects.filter(pk=notification.pk, is_read=False).update(is_read=True):
+            add(model, {user_id: -1})
+            conditional.bump(model)  # update() sends no post_save
+    notification.is_read = True
+    return notification
+
+
+def unread_counts(user_id):
+    """{"job_alerts", "application_status", "total"} from one primary key read."""
+    row = (
+        NotificationCounter.objects.filter(pk=user_id)
+        .values_list("job_alerts_unread", "application_status_unread")
+        .first()
+    ) or (0, 0)
+    return {"job_alerts": row[0], "application_status": row[1], "total": row[0] + row[1]}
+
+
+def recount():
+    """Recompute every counter from the notification tables. Returns the row count."""
+    totals = defaultdict(dict)
+    for model, field in FIELDS.items():
+        rows = (
+            model.objects.filter(is_read=False)
+            .values_list(USER_PATHS[model])
+            .annotate(n=Count("id"))
+            .order_by()
+        )
+        for user_id, n in rows:
+            totals[user_id][field] = n
+    with transaction.atomic():
+        NotificationCounter.objects.all().delete()
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, **fields) for user_id, fields in totals.items()],
+            batch_size=1000,
+        )
+    return len(totals)
@@ -0,0 +1,209 @@
+# jobportal/jobs/outbox.py
+
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# Emails claimed and sent per round trip of the sender.
+BATCH_SIZE = getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 100)
+MAX_ATTEMPTS = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+# Seconds before the first retry, doubled on every further attempt.
+RETRY_DELAY = getattr(settings, "EMAIL_OUTBOX_RETRY_DELAY", 60)
+# A "sending" email whose sender died is picked up again after this long
+# (delivery is at-least-once).
+LOCK_TIMEOUT = timedelta(seconds=getattr(settings, "EMAIL_OUTBOX_LOCK_TIMEOUT", 300))
+
+
+def _from_email(from_email):
+    return from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@jobportal.com")
+
+
+def enqueue(to, subject, body, from_email=None):
+    """
+    Queue one email. Call it inside the transaction of the change the email
+    reports: it is sent only if that commits, and the request never waits
+    on the mail server.
+    """
+    return EmailOutbox.objects.create(
+        to=to, subject=subject, body=body, from_email=_from_email(from_email),
+        max_attempts=MAX_ATTEMPTS,
+    )
+
+
+def enqueue_many(emails):
+    """Bulk enqueue() of (to, subject, body) triples - one INSERT per 1000."""
+    from_email = _from_email(None)
+    return EmailOutbox.objects.bulk_create(
+        [
+            EmailOutbox(to=to, subject=subject, body=body, from_email=from_email, max_attempts=MAX_ATTEMPTS)
+            for to, subject, body in emails
+        ],
+        batch_size=1000,
+    )
+
+
+# ===========================
+#   SENDER SIDE
+# ===========================
+
+def claim_batch(worker, size=BATCH_SIZE):
+    """
+    Move up to `size` due pending emails to "sending" for `worker`; the
+    conditional UPDATE keeps two senders off the same rows.
+    """
+    now = timezone.now()
+
+    # release emails whose sender vanished mid-batch
+    EmailOutbox.objects.filter(status="sending", locked_at__lt=now - LOCK_TIMEOUT).update(
+        status="pending", locked_by="", locked_at=None
+    )
+
+    ids = list(
+        EmailOutbox.objects.filter(status="pending", send_after__lte=now)
+        .order_by("send_after", "id")
+        .values_list("id", flat=True)[:size]
+    )
+    if not ids:
+        return []
+    EmailOutbox.objects.filter(id__in=ids, status="pending").update(
+        status="sending", locked_by=worker, locked_at=now
+    )
+    return list(
+        EmailOutbox.objects.filter(id__in=ids, status="sending", locked_by=worker, locked_at=now)
+        .order_by("id")
+    )
+
+
+def deliver(emails, connection=None):
+    """
+    Send claimed `emails` over one backend connection and record the
+    outcome: sent, back to pending with exponential backoff, or dead after
+    max_attempts. Returns {"sent": n, "retried": n, "dead": n}.
+
+    Messages go out one send_messages() call each on the open connection,
+    so a failure is pinned to its message and nothing is sent twice; after
+    a failure the connection is reopened for the rest.
+    """
+    connection = connection or get_connection()
+    sent, failed = [], []
+    remaining = list(emails)
+    try:
+        connection.open()
+    except Exception as e:
+        failed, remaining = [(email, e) for email in remaining], []
+
+    while remaining:
+        email = remaining.pop(0)
+        message = EmailMessage(
+            email.subject, email.body, email.from_email, [email.to], connection=connection
+        )
+        try:
+            if connection.send_messages([message]) != 1:
+                raise RuntimeError("Backend did not send the message.")
+        except Exception as e:
+            failed.append((email, e))
+            # the connection may be broken: the rest go on a fresh one
+            try:
+                connection.close()
+                connection.open()
+            except Exception as e:
+                failed += [(email, e) for email in remaining]
+                remaining = []
+        else:
+            sent.append(email)
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+    return _record(sent, failed)
+
+
+def _record(sent, failed):
+    now = timezone.now()
+    if sent:
+        EmailOutbox.objects.filter(id__in=[email.id for email in sent]).update(
+            status="sent", sent_at=now, attempts=F("attempts") + 1,
+            locked_by="", locked_at=None, last_error="",
+        )
+
+    dead = 0
+    for email, error in failed:
+        logger.warning("Email #%s to %s failed (attempt %s): %s", email.pk, email.to, email.attempts + 1, error)
+        email.attempts += 1
+        email.last_error = f"{type(error).__name__}: {error}"
+        email.locked_by = ""
+        email.locked_at = None
+        if email.attempts >= email.max_attempts:
+            email.status = "dead"
+            dead += 1
+        else:
+            email.status = "pending"
+            email.send_after = now + timedelta(seconds=RETRY_DELAY * 2 ** (email.attempts - 1))
+    if failed:
+        EmailOutbox.objects.bulk_update(
+            [email for email, _ in failed],
+            ["status", "attempts", "send_after", "last_error", "locked_by", "locked_at"],
+        )
+
+    result = {"sent": len(sent), "retried": len(failed) - dead, "dead": dead}
+    with _lock:
+        for key, value in result.items():
+            _metrics[key] += value
+    return result
+
+
+def drain(worker, batch_size=BATCH_SIZE, connection=None):
+    """
+    Send batches until nothing is due. Returns the totals plus "seconds"
+    (wall time) and "per_second" (emails attempted per second).
+    """
+    totals = {"sent": 0, "retried": 0, "dead": 0, "batches": 0}
+    start = time.perf_counter()
+    while True:
+        batch = claim_batch(worker, batch_size)
+        if not batch:
+            break
+        for key, value in deliver(batch, connection).items():
+            totals[key] += value
+        totals["batches"] += 1
+    totals["seconds"] = round(time.perf_counter() - start, 3)
+    attempted = totals["sent"] + totals["retried"] + totals["dead"]
+    totals["per_second"] = round(attempted / totals["seconds"], 1) if totals["seconds"] else None
+    return totals
+
+
+# ===========================
+#   METRICS
+# ===========================
+
+_lock = threading.Lock()
+_metrics = {"sent": 0, "retried": 0, "dead": 0}
+_started = time.monotonic()
+
+
+def stats():
+    """Queue depth per status and oldest due email (DB), plus this process's send counters."""
+    by_status = dict(EmailOutbox.objects.values_list("status").annotate(n=Count("id")).order_by())
+    oldest = EmailOutbox.objects.filter(status="pending", send_after__lte=timezone.now()).aggregate(
+        oldest=Min("created_at")
+    )["oldest"]
+    with _lock:
+        process = dict(_metrics)
+    uptime = time.monotonic() - _started
+    process["sent_per_minute"] = round(process["sent"] * 60 / uptime, 1) if uptime else 0.0
+    return {
+        "queue": {status: by_status.get(status, 0) for status, _ in EmailOutbox.STATUS_CHOICES},
+        "oldest_due_seconds": round((timezone.now() - oldest).total_seconds(), 1) if oldest else None,
+        "this_process": process,
+    }
@@ -0,0 +1,242 @@
+# jobportal/jobs/pagination.py
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor (keyset) pagination on the queryset's own ordering.
+
+    The cursor is the ordering values of the last row on the page, e.g.
+    (created_at, id). The next page is fetched with
+        WHERE (created_at, id) < (:created_at, :id) ORDER BY ... LIMIT n
+    so every page costs the same index range scan, no matter how deep.
+
+    - Ordering comes from the queryset (`order_by(...)` or Meta.ordering).
+      The primary key is appended as a tie-breaker if missing.
+    - Ordering on `.extra(select=...)` columns (e.g. the search rank) works
+      too, since the keyset condition is built as SQL.
+    - ?page_size=<n> (capped at max_page_size), ?cursor=<opaque token>
+
+    Response:
+        { "next": url|null, "previous": url|null, "results": [...] }
+    """
+
+    page_size = getattr(settings, "JOBS_PAGE_SIZE", 20)
+    max_page_size = getattr(settings, "JOBS_MAX_PAGE_SIZE", 100)
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["d"] == "p")
+
+        if reverse:
+            queryset = queryset.order_by(*self._order_by(invert=True))
+        else:
+            queryset = queryset.order_by(*self._order_by())
+
+        if cursor:
+            where, params = self._keyset_where(queryset, cursor["v"], reverse)
+            queryset = queryset.extra(where=[where], params=params)
+
+        # fetch one extra row to know whether there is another page
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # ---------------------------
+    #   page size / ordering
+    # ---------------------------
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """
+        List of (name, descending) pairs, always ending with the pk so the
+        order is total and the cursor is unambiguous.
+        """
+        order_by = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not order_by:
+            order_by = ["-pk"]
+
+        ordering = []
+        pk_name = queryset.model._meta.pk.name
+        for item in order_by:
+            if not isinstance(item, str):
+                raise ImproperlyConfigured(
+                    "KeysetPagination only supports plain field orderings."
+                )
+            desc = item.startswith("-")
+            name = item.lstrip("-")
+            if name == "pk":
+                name = pk_name
+            if "__" in name:
+                raise ImproperlyConfigured(
+                    f"KeysetPagination cannot order across relations ({item})."
+                )
+            ordering.append((name, desc))
+
+        if pk_name not in [name for name, _ in ordering]:
+            ordering.append((pk_name, ordering[0][1]))
+        return ordering
+
+    def _order_by(self, invert=False):
+        return [
+            ("-" if desc != invert else "") + name for name, desc in self.ordering
+        ]
+
+    # ---------------------------
+    #   keyset condition
+    # ---------------------------
+
+    def _keyset_where(self, queryset, values, reverse):
+        """
+        Lexicographic "row after cursor" condition:
+            a < :a OR (a = :a AND b < :b) OR (a = :a AND b = :b AND c < :c)
+        with < / > picked per column direction (flipped for previous pages).
+        """
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        columns = []
+        for (name, desc), value in zip(self.ordering, values):
+            sql, params, value = self._column(queryset, name, value)
+            op = "<" if desc != reverse else ">"
+            columns.append((sql, params, op, value))
+
+        clauses, params = [], []
+        for i, (sql, col_params, op, value) in enumerate(columns):
+            parts = []
+            for prev_sql, prev_params, _, prev_value in columns[:i]:
+                parts.append(f"({prev_sql}) = %s")
+                params.extend(prev_params + [prev_value])
+            parts.append(f"({sql}) {op} %s")
+            params.extend(col_params + [value])
+            clauses.append("(" + " AND ".join(parts) + ")")
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def _column(self, queryset, name, value):
+        """SQL + params for an ordering column, and the DB-ready cursor value."""
+        extra = queryset.query.extra_select
+        if name in extra:
+            # .extra() columns (the search rank) are numbers
+            if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+                raise NotFound(self.invalid_cursor_message)
+            try:
+                value = float(value)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            sql, params = extra[name]
+            return sql, list(params), value
+
+        opts = queryset.model._meta
+        try:
+            field = opts.get_field(name)
+        except Exception:
+            raise ImproperlyConfigured(
+                f"KeysetPagination cannot order by '{name}'."
+            )
+        qn = connection.ops.quote_name
+        sql = f"{qn(opts.db_table)}.{qn(field.column)}"
+        try:
+            value = field.get_db_prep_value(field.to_python(value), connection)
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return sql, [], value
+
+    # ---------------------------
+    #   cursor encoding
+    # ---------------------------
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            cursor = json.loads(raw)
+            if cursor["d"] not in ("n", "p") or not isinstance(cursor["v"], list):
+                raise ValueError
+        except (ValueError, KeyError, TypeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, row, direction):
+        # rows are model instances, or dicts from .values()
+        if isinstance(row, dict):
+            values = [row[name] for name, _ in self.ordering]
+        else:
+            values = [getattr(row, name) for name, _ in self.ordering]
+        raw = json.dumps({"d": direction, "v": values}, default=str)
+        encoded = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], "n")
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], "p")
@@ -0,0 +1,148 @@
+# jobportal/jobs/question_bank.py
+
+import hashlib
+import random
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+from .models import QuestionBank, QuestionBankItem
+from .text_utils import split_terms
+
+# Questions per test, sampled from the bank of the job's skill set.
+TEST_SIZE = getattr(settings, "QUESTION_BANK_TEST_SIZE", 25)
+
+# Below MIN_POOL questions the generator is asked for more; a bank never
+# grows past MAX_POOL. More questions than TEST_SIZE means candidates for
+# the same job don't all get the same test.
+MIN_POOL = getattr(settings, "QUESTION_BANK_MIN_POOL", 50)
+MAX_POOL = getattr(settings, "QUESTION_BANK_MAX_POOL", 200)
+
+# Least recently used banks are dropped past MAX_BANKS; a bank older than
+# TTL is emptied and regenerated.
+MAX_BANKS = getattr(settings, "QUESTION_BANK_MAX_BANKS", 1000)
+TTL = timedelta(days=getattr(settings, "QUESTION_BANK_TTL_DAYS", 30))
+
+VALID_OPTIONS = {0: "A", 1: "B", 2: "C", 3: "D"}
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "generated": 0}
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def skill_key(skills_text):
+    """
+    (sha256 hex, normalized skill list) of a free-text skills string.
+    "Django, Python" and "python,django" share a bank.
+    """
+    skills = ", ".join(sorted(set(split_terms(skills_text))))
+    return hashlib.sha256(skills.encode("utf-8")).hexdigest(), skills
+
+
+def get_bank(skills_text):
+    key, skills = skill_key(skills_text)
+    try:
+        # the create runs in its own savepoint
+        bank, created = QuestionBank.objects.get_or_create(
+            skill_key=key, defaults={"skills": skills}
+        )
+    except IntegrityError:
+        # a concurrent first request for the same skill set created it
+        bank, created = QuestionBank.objects.get(skill_key=key), False
+    now = timezone.now()
+    if created:
+        evict_lru()
+    elif bank.refreshed_at < now - TTL:
+        # only the request whose UPDATE moves refreshed_at empties the bank
+        refreshed = QuestionBank.objects.filter(
+            pk=bank.pk, refreshed_at=bank.refreshed_at
+        ).update(refreshed_at=now)
+        if refreshed:
+            bank.items.all().delete()
+        bank.refreshed_at = now
+    return bank
+
+
+def evict_lru():
+    excess = QuestionBank.objects.count() - MAX_BANKS
+    if excess <= 0:
+        return 0
+    ids = list(
+        QuestionBank.objects.order_by("last_used_at", "id").values_list("id", flat=True)[:excess]
+    )
+    QuestionBank.objects.filter(id__in=ids).delete()
+    return len(ids)
+
+
+def _to_item(bank, q):
+    """QuestionBankItem from a generated question dict, or None if malformed."""
+    opts = q.get("options") if isinstance(q, dict) else None
+    if not isinstance(opts, list) or len(opts) != 4:
+        return None
+    text = str(q.get("question") or "").strip()
+    if not text:
+        return None
+    return QuestionBankItem(
+        bank=bank,
+        text=text,
+        option_a=str(opts[0]),
+        option_b=str(opts[1]),
+        option_c=str(opts[2]),
+        option_d=str(opts[3]),
+        correct_option=VALID_OPTIONS.get(q.get("correct_option", 0), "A"),
+    )
+
+
+def top_up(bank, generate, pool):
+    """
+    Ask `generate(skills_text)` for more questions and add the new ones
+    (by text) to the bank, up to MAX_POOL. Returns the number added.
+    """
+    generated = generate(bank.skills) or []
+    _count("generated")
+
+    seen = {item.text for item in pool}
+    rows = []
+    for q in generated:
+        item = _to_item(bank, q)
+        if item is None or item.text in seen:
+            continue
+        seen.add(item.text)
+        rows.append(item)
+    rows = rows[: max(MAX_POOL - len(pool), 0)]
+    QuestionBankItem.objects.bulk_create(rows)
+    return len(rows)
+
+
+def sample_questions(skills_text, generate, k=TEST_SIZE):
+    """
+    Up to k random QuestionBankItems for a skill set. `generate` is only
+    called when the bank is missing, expired or below MIN_POOL; it may
+    return None (e.g. API down), then fewer than k items come back.
+    """
+    bank = get_bank(skills_text)
+    pool = list(bank.items.all())
+    if len(pool) < MIN_POOL:
+        _count("misses")
+        if top_up(bank, generate, pool):
+            pool = list(bank.items.all())
+    else:
+        _count("hits")
+
+    QuestionBank.objects.filter(pk=bank.pk).update(last_used_at=timezone.now())
+    return random.sample(pool, min(k, len(pool)))
+
+
+def stats():
+    with _stats_lock:
+        data = dict(_stats)
+    lookups = data["hits"] + data["misses"]
+    data["hit_ratio"] = round(data["hits"] / lookups, 4) if lookups else None
+    return data
@@ -0,0 +1,87 @@
+# jobportal/jobs/recommendation_cache.py
+
+import threading
+
+from django.core.cache import caches
+
+from .models import CandidateSkill
+
+# settings.CACHES["recommendations"]: a LocMemCache evicts least recently
+# used entries once MAX_ENTRIES is reached.
+CACHE_ALIAS = "recommendations"
+
+INVALIDATE_CHUNK_SIZE = 1000
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _key(user_id):
+    return f"recommended:{user_id}"
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def get(user_id, limit):
+    """
+    Cached response data for this candidate + limit, or None.
+    One entry per candidate ({limit: data}), so a warm request is exactly
+    one cache read.
+    """
+    entry = _cache().get(_key(user_id))
+    data = entry.get(limit) if entry else None
+    _count("hits" if data is not None else "misses")
+    return data
+
+
+def store(user_id, limit, data):
+    cache = _cache()
+    entry = cache.get(_key(user_id)) or {}
+    entry[limit] = data
+    cache.set(_key(user_id), entry)
+
+
+# ===========================
+#   INVALIDATION
+# ===========================
+
+def invalidate_users(user_ids):
+    keys = [_key(uid) for uid in user_ids]
+    for start in range(0, len(keys), INVALIDATE_CHUNK_SIZE):
+        _cache().delete_many(keys[start : start + INVALIDATE_CHUNK_SIZE])
+    _count("invalidations", len(keys))
+
+
+def invalidate_for_terms(terms):
+    """
+    Drop the lists of candidates having any of `terms` as a skill – the
+    only candidates whose ranking a new / changed / removed job can move.
+    """
+    terms = [t for t in terms if t]
+    if not terms:
+        return
+    user_ids = (
+        CandidateSkill.objects.filter(skill__name__in=terms)
+        .values_list("candidate__user_id", flat=True)
+        .distinct()
+    )
+    invalidate_users(list(user_ids))
+
+
+def clear():
+    _cache().clear()
+
+
+def stats():
+    with _stats_lock:
+        data = dict(_stats)
+    lookups = data["hits"] + data["misses"]
+    data["hit_ratio"] = round(data["hits"] / lookups, 4) if lookups else None
+    return data
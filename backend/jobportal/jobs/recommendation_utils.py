@@ -0,0 +1,235 @@
+# jobportal/jobs/recommendation_utils.py
+
+import math
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, Q, Sum, Value, When
+
+from .models import Application, CandidateSkill, Job, JobTermWeight, Skill, TermStat
+from .text_utils import tokenize, ngrams
+from . import search_utils, recommendation_cache
+
+# Longest skill phrase (in words) looked up in job text, e.g. "rest api design".
+MAX_TERM_WORDS = 5
+
+# Marker term: every indexed job has it, so TermStat("") is the job count.
+DOC_TERM = ""
+
+LOOKUP_CHUNK_SIZE = 500
+
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 50
+
+
+def job_text(job):
+    return f"{job.title} {job.description} {job.skills or ''}"
+
+
+def term_weights(tokens, vocabulary):
+    """
+    Length-normalized, log-scaled term frequencies of the job text, limited
+    to the terms in `vocabulary` (a set of skill names):
+        weight = (1 + ln tf) / sqrt(number of tokens)
+    """
+    if not tokens:
+        return {}
+    counts = Counter(g for g in ngrams(tokens, MAX_TERM_WORDS) if g in vocabulary)
+    norm = math.sqrt(len(tokens))
+    return {term: (1 + math.log(tf)) / norm for term, tf in counts.items()}
+
+
+def _known_skills(terms):
+    terms = list(terms)
+    known = set()
+    for start in range(0, len(terms), LOOKUP_CHUNK_SIZE):
+        chunk = terms[start : start + LOOKUP_CHUNK_SIZE]
+        known.update(Skill.objects.filter(name__in=chunk).values_list("name", flat=True))
+    return known
+
+
+def _bump_df(terms, delta):
+    if not terms:
+        return
+    TermStat.objects.bulk_create(
+        [TermStat(term=t, df=0) for t in terms], ignore_conflicts=True
+    )
+    TermStat.objects.filter(term__in=terms).update(df=F("df") + delta)
+
+
+def _invalidate_cached_lists(terms):
+    # after commit, so a concurrent request can't re-cache the old ranking
+    terms = list(terms)
+    transaction.on_commit(lambda: recommendation_cache.invalidate_for_terms(terms))
+
+
+# ===========================
+#   INDEX MAINTENANCE
+# ===========================
+
+def index_job(job):
+    """
+    (Re)build the sparse vector of one job and keep document frequencies in
+    step. Inactive jobs are removed from the index.
+    """
+    if not job.is_active:
+        unindex_job(job.pk)
+        return
+
+    tokens = tokenize(job_text(job))
+    vocabulary = _known_skills(set(ngrams(tokens, MAX_TERM_WORDS)))
+    weights = term_weights(tokens, vocabulary)
+    weights[DOC_TERM] = 0.0
+
+    with transaction.atomic():
+        old_weights = dict(
+            JobTermWeight.objects.filter(job_id=job.pk).values_list("term", "weight")
+        )
+        if old_weights == weights:
+            # e.g. only the salary changed: the ranking holds, but the
+            # cached lists carry the serialized job
+            _invalidate_cached_lists(weights)
+            return
+        old_terms = set(old_weights)
+        JobTermWeight.objects.filter(job_id=job.pk).delete()
+        JobTermWeight.objects.bulk_create(
+            [JobTermWeight(job_id=job.pk, term=t, weight=w) for t, w in weights.items()]
+        )
+        _bump_df(list(set(weights) - old_terms), +1)
+        _bump_df(list(old_terms - set(weights)), -1)
+        _invalidate_cached_lists(old_terms | set(weights))
+
+
+def unindex_job(job_id):
+    with transaction.atomic():
+        old_terms = list(
+            JobTermWeight.objects.filter(job_id=job_id).values_list("term", flat=True)
+        )
+        if not old_terms:
+            return
+        JobTermWeight.objects.filter(job_id=job_id).delete()
+        _bump_df(old_terms, -1)
+        _invalidate_cached_lists(old_terms)
+
+
+def invalidate_company(company):
+    """The company name is part of every cached job, refresh their lists."""
+    terms = (
+        JobTermWeight.objects.filter(job__company_id=company.pk)
+        .values_list("term", flat=True)
+        .distinct()
+    )
+    _invalidate_cached_lists(terms)
+
+
+def _jobs_possibly_containing(term):
+    """Indexed jobs whose text may contain `term` (superset, verified later)."""
+    qs = Job.objects.filter(is_active=True, term_weights__term=DOC_TERM)
+    if not search_utils.fts_enabled():
+        return qs.filter(
+            Q(title__icontains=term) | Q(description__icontains=term) | Q(skills__icontains=term)
+        )
+
+    # every word of the term must be present: '"rest" "api"'
+    words = search_utils.build_match_query(term).replace("*", "")
+    if not words:
+        return qs.none()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid FROM {search_utils.FTS_TABLE} "
+            f"WHERE {search_utils.FTS_TABLE} MATCH %s",
+            [words],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+    return qs.filter(id__in=ids)
+
+
+def index_new_term(term):
+    """
+    Add postings for a skill that just entered the vocabulary, so jobs
+    posted before anyone had that skill still get recommended for it.
+    """
+    rows = []
+    for job in _jobs_possibly_containing(term).iterator(chunk_size=500):
+        weight = term_weights(tokenize(job_text(job)), {term}).get(term)
+        if weight:
+            rows.append(JobTermWeight(job_id=job.pk, term=term, weight=weight))
+
+    with transaction.atomic():
+        JobTermWeight.objects.bulk_create(rows, ignore_conflicts=True)
+        # ignore_conflicts doesn't report skipped rows, so recount the df
+        TermStat.objects.update_or_create(
+            term=term,
+            defaults={"df": JobTermWeight.objects.filter(term=term).count()},
+        )
+        if rows:
+            _invalidate_cached_lists([term])
+    return len(rows)
+
+
+def rebuild_index():
+    """Re-index every active job from scratch (management / recovery)."""
+    vocabulary = set(Skill.objects.values_list("name", flat=True))
+    with transaction.atomic():
+        JobTermWeight.objects.all().delete()
+        TermStat.objects.all().delete()
+        rows = []
+        df = Counter()
+        for job in Job.objects.filter(is_active=True).iterator(chunk_size=500):
+            weights = term_weights(tokenize(job_text(job)), vocabulary)
+            weights[DOC_TERM] = 0.0
+            df.update(weights.keys())
+            rows.extend(JobTermWeight(job_id=job.pk, term=t, weight=w) for t, w in weights.items())
+            if len(rows) >= 5000:
+                JobTermWeight.objects.bulk_create(rows)
+                rows = []
+        JobTermWeight.objects.bulk_create(rows)
+        TermStat.objects.bulk_create([TermStat(term=t, df=n) for t, n in df.items()])
+        transaction.on_commit(recommendation_cache.clear)
+    return df[DOC_TERM]
+
+
+# ===========================
+#   SCORING
+# ===========================
+
+def recommend_job_ids(profile, k=DEFAULT_TOP_K):
+    """
+    Top-k (job_id, score) for a candidate, best first, excluding jobs they
+    applied to. Scores are TF-IDF dot products of the candidate's skill
+    vector with each job's sparse vector:
+        score(job) = sum over the candidate's skills t of idf(t) * weight(t, job)
+        idf(t)     = ln(1 + N / df(t))
+    computed in one grouped SQL aggregate over the skills' posting lists.
+    """
+    terms = list(
+        CandidateSkill.objects.filter(candidate=profile).values_list("skill__name", flat=True)
+    )
+    if not terms:
+        return []
+
+    stats = dict(
+        TermStat.objects.filter(term__in=terms + [DOC_TERM]).values_list("term", "df")
+    )
+    n_jobs = stats.get(DOC_TERM, 0)
+    idf = {
+        t: math.log(1 + n_jobs / stats[t])
+        for t in terms
+        if stats.get(t, 0) > 0
+    }
+    if not idf:
+        return []
+
+    idf_case = Case(
+        *[When(term=t, then=Value(w)) for t, w in idf.items()],
+        output_field=FloatField(),
+    )
+    applied = Application.objects.filter(candidate=profile).values("job_id")
+    rows = (
+        JobTermWeight.objects.filter(term__in=list(idf))
+        .exclude(job_id__in=applied)
+        .values("job_id")
+        .annotate(score=Sum(F("weight") * idf_case))
+        .order_by("-score", "-job_id")[:k]
+    )
+    return [(row["job_id"], row["score"]) for row in rows]
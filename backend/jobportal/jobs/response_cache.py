@@ -0,0 +1,203 @@
+# jobportal/jobs/response_cache.py
+
+import hashlib
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .models import Job
+
+# settings.CACHES["responses"]: locmem, file or redis, see settings.py
+CACHE_ALIAS = "responses"
+
+# Query parameters JobViewSet list / retrieve read; anything else (cache
+# busters, tracking params) is not part of the key.
+KEY_PARAMS = ("search", "location", "job_type", "skills", "skills_match",
+              "fields", "omit", "cursor", "page_size")
+# free-text filters: case / whitespace don't change the result
+FOLDED_PARAMS = ("search", "location", "job_type", "skills", "skills_match")
+
+# headers replayed on a hit
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Vary")
+
+_LIST_GENERATION_KEY = "jobs:list:generation"
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def enabled():
+    return getattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+
+def cacheable(request):
+    """Only anonymous GETs: per-user responses must never be shared."""
+    return (
+        enabled()
+        and request.method == "GET"
+        and request.auth is None
+        and not request.user.is_authenticated
+    )
+
+
+def normalized_params(query_params):
+    items = []
+    for name in KEY_PARAMS:
+        value = query_params.get(name, "").strip()
+        if name in FOLDED_PARAMS:
+            value = " ".join(value.lower().split())
+        if value:
+            items.append(f"{name}={value}")
+    return "&".join(items)
+
+
+def _variant(request):
+    # host: pagination links are absolute; media type: ?format= / Accept
+    raw = "|".join([
+        request.get_host(),
+        getattr(request, "accepted_media_type", ""),
+        normalized_params(request.query_params),
+    ])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _list_generation(cache):
+    generation = cache.get(_LIST_GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(_LIST_GENERATION_KEY, generation, timeout=None):
+            generation = cache.get(_LIST_GENERATION_KEY, generation)
+    return generation
+
+
+def key_for(request, pk=None):
+    """
+    Lists: one key per (list generation, variant) - a new generation
+    drops every cached page at once.
+    Details: one key per job holding {variant: entry}, deleted on change.
+    """
+    cache = _cache()
+    if pk is None:
+        return f"jobs:list:{_list_generation(cache)}:{_variant(request)}", None
+    return f"jobs:detail:{pk}", _variant(request)
+
+
+def get(request, key):
+    """The cached HttpResponse (or 304) for this request, or None."""
+    key, variant = key
+    entry = _cache().get(key)
+    if entry is not None and variant is not None:
+        entry = entry.get(variant)
+    if entry is None:
+        _count("misses")
+        return None
+    _count("hits")
+
+    status, content, headers = entry
+    response = HttpResponse(content, status=status)
+    for name, value in headers.items():
+        response.headers[name] = value
+    response.headers["X-Cache"] = "HIT"
+
+    not_modified = get_conditional_response(
+        request,
+        etag=headers.get("ETag"),
+        last_modified=parse_http_date_safe(headers.get("Last-Modified") or ""),
+        response=response,
+    )
+    return not_modified
+
+
+def store(key, response):
+    key, variant = key
+    headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+    entry = (response.status_code, response.content, headers)
+    cache = _cache()
+    if variant is not None:
+        variants = cache.get(key) or {}
+        variants[variant] = entry
+        entry = variants
+    cache.set(key, entry)
+    _count("stores")
+
+
+# ===========================
+#   INVALIDATION
+# ===========================
+
+def invalidate_jobs(job_ids):
+    """Drop the detail entries of `job_ids` and every cached list page."""
+    cache = _cache()
+    cache.delete_many([f"jobs:detail:{pk}" for pk in job_ids])
+    cache.set(_LIST_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    _count("invalidations")
+
+
+def invalidate_company(company_id):
+    # company_name is part of every job of the company
+    invalidate_jobs(list(Job.objects.filter(company_id=company_id).values_list("id", flat=True)))
+
+
+def clear():
+    _cache().clear()
+
+
+def stats():
+    with _stats_lock:
+        data = dict(_stats)
+    lookups = data["hits"] + data["misses"]
+    data["hit_ratio"] = round(data["hits"] / lookups, 4) if lookups else None
+    return data
+
+
+class AnonymousResponseCacheMixin:
+    """
+    Serve list / retrieve to anonymous clients from response_cache.
+    Misses are stored after rendering (finalize_response); the conditional
+    headers are stored with the body, so revalidations are answered from
+    the cache as well. Authenticated requests bypass it entirely.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._from_cache(super().list, None, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = str(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field))
+        if not lookup.isdigit() or lookup != str(int(lookup)):
+            # "07" would get an entry invalidate_jobs([7]) doesn't know about
+            return super().retrieve(request, *args, **kwargs)
+        return self._from_cache(super().retrieve, lookup, request, *args, **kwargs)
+
+    def _from_cache(self, handler, lookup, request, *args, **kwargs):
+        if not cacheable(request):
+            return handler(request, *args, **kwargs)
+        key = key_for(request, lookup)
+        response = get(request, key)
+        if response is not None:
+            return response
+        self._response_cache_key = key
+        return handler(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "_response_cache_key", None)
+        if key is not None and response.status_code == 200:
+            if hasattr(response, "render"):
+                response.render()
+            store(key, response)
+            response.headers["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,89 @@
+# jobportal/jobs/retention.py
+
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import ArchivedJobAlertNotification, JobAlertNotification
+from . import conditional, notification_counters
+
+# Read job alert notifications leave the hot table after this many days ...
+READ_RETENTION_DAYS = getattr(settings, "NOTIFICATION_READ_RETENTION_DAYS", 30)
+# ... unread ones after this many (they are archived as read).
+MAX_AGE_DAYS = getattr(settings, "NOTIFICATION_MAX_AGE_DAYS", 180)
+# Rows moved per transaction: keeps each batch's locks short.
+BATCH_SIZE = getattr(settings, "NOTIFICATION_ARCHIVE_BATCH_SIZE", 1000)
+
+
+def archivable(now=None):
+    """Hot rows due for the archive, oldest first (on jobalertnotif_age_idx)."""
+    now = now or timezone.now()
+    read_cutoff = now - timedelta(days=READ_RETENTION_DAYS)
+    age_cutoff = now - timedelta(days=MAX_AGE_DAYS)
+    return (
+        JobAlertNotification.objects.filter(created_at__lt=max(read_cutoff, age_cutoff))
+        .filter(Q(is_read=True) | Q(created_at__lt=age_cutoff))
+        .order_by("created_at", "id")
+    )
+
+
+def archive_batch(queryset, after=None, batch_size=BATCH_SIZE):
+    """
+    Move up to `batch_size` rows of `queryset` following the (created_at, id)
+    position `after` into ArchivedJobAlertNotification, in one short
+    transaction: copy, delete, uncount the unread ones.
+    Returns (rows moved, position of the last one or None).
+    """
+    if after is not None:
+        created_at, pk = after
+        queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+
+    with transaction.atomic():
+        # rows locked by another writer (e.g. a mark-read) wait for the next run
+        rows = list(
+            queryset.select_for_update(skip_locked=True, of=("self",)).values_list(
+                "id", "candidate_id", "job_id", "created_at", "is_read", "candidate__user_id"
+            )[:batch_size]
+        )
+        if not rows:
+            return 0, None
+        ArchivedJobAlertNotification.objects.bulk_create(
+            [
+                ArchivedJobAlertNotification(
+                    id=pk, candidate_id=candidate_id, job_id=job_id, created_at=created_at
+                )
+                for pk, candidate_id, job_id, created_at, _, _ in rows
+            ]
+        )
+        JobAlertNotification.objects.filter(id__in=[row[0] for row in rows]).delete()
+        unread = Counter(user_id for *_, is_read, user_id in rows if not is_read)
+        notification_counters.add(JobAlertNotification, {user_id: -n for user_id, n in unread.items()})
+        conditional.bump(JobAlertNotification)
+
+    last = rows[-1]
+    return len(rows), (last[3], last[0])
+
+
+def archive(now=None, batch_size=BATCH_SIZE, pause=0, limit=None):
+    """
+    Archive everything due, batch by batch. Each batch resumes from the
+    last position, so rows skipped by the filter are not rescanned.
+    `pause` seconds between batches give other writers room.
+    Returns the number of rows moved.
+    """
+    queryset = archivable(now)
+    moved, after = 0, None
+    while limit is None or moved < limit:
+        size = batch_size if limit is None else min(batch_size, limit - moved)
+        count, after = archive_batch(queryset, after, size)
+        if after is None:
+            break
+        moved += count
+        if pause:
+            time.sleep(pause)
+    return moved
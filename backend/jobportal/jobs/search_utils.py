@@ -0,0 +1,136 @@
+# jobportal/jobs/search_utils.py
+
+import re
+from django.db import connection
+from django.db.models import Q
+
+# SQLite FTS5 shadow index over Job text (created in migration 0011).
+# rowid of the FTS row == Job.id
+FTS_TABLE = "jobs_job_fts"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts_available = None
+
+
+def fts_enabled():
+    """
+    True when the default DB is SQLite and the FTS5 table exists.
+    Other backends fall back to the old icontains search.
+    """
+    global _fts_available
+    if connection.vendor != "sqlite":
+        return False
+    if _fts_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            _fts_available = cursor.fetchone() is not None
+    return _fts_available
+
+
+def build_match_query(text):
+    """
+    Turn free user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term and all terms must match:
+        "reac dja"  ->  "reac"* "dja"*
+    Quoting keeps FTS operators (AND, NEAR, :, -) in user input literal.
+    """
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    if not tokens:
+        return ""
+    return " ".join(f'"{tok}"*' for tok in tokens)
+
+
+def apply_search(qs, search):
+    """
+    Filter + rank a Job queryset by `search`.
+
+    With FTS5: joined against the index, annotated with the bm25 rank
+    (lower is better) as `search_rank`, ordered by relevance then newest
+    first.
+    Without FTS5: the previous title/description/company icontains filter.
+    """
+    search = (search or "").strip()
+    if not search:
+        return qs
+
+    if not fts_enabled():
+        return qs.filter(
+            Q(title__icontains=search)
+            | Q(description__icontains=search)
+            | Q(company__name__icontains=search)
+        )
+
+    match = build_match_query(search)
+    if not match:
+        return qs.none()
+
+    # Join the FTS table on rowid = Job.id so SQLite drives the query from
+    # the index and computes each match's rank exactly once. The bm25 column
+    # weights (title > skills > company > description) are stored as the
+    # table's default `rank` function in migration 0011.
+    return qs.extra(
+        tables=[FTS_TABLE],
+        where=[
+            f"{FTS_TABLE}.rowid = jobs_job.id",
+            f"{FTS_TABLE} MATCH %s",
+        ],
+        params=[match],
+        select={"search_rank": f"{FTS_TABLE}.rank"},
+    ).order_by("search_rank", "-created_at", "-id")
+
+
+# ===========================
+#   INDEX MAINTENANCE
+# ===========================
+
+def index_job(job):
+    """Insert or refresh the FTS row for a single job."""
+    if not fts_enabled():
+        return
+    company_name = job.company.name if job.company_id else ""
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description, skills, company_name) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [job.pk, job.title or "", job.description or "", job.skills or "", company_name],
+        )
+
+
+def unindex_job(job_id):
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_id])
+
+
+def reindex_company(company):
+    """Company name is part of the index, so refresh it on all its jobs."""
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {FTS_TABLE} SET company_name = %s "
+            "WHERE rowid IN (SELECT id FROM jobs_job WHERE company_id = %s)",
+            [company.name or "", company.pk],
+        )
+
+
+def rebuild_index():
+    """Drop every FTS row and re-populate from the jobs table."""
+    if not fts_enabled():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description, skills, company_name) "
+            "SELECT j.id, j.title, j.description, COALESCE(j.skills, ''), c.name "
+            "FROM jobs_job j JOIN accounts_company c ON c.id = j.company_id"
+        )
+        cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0]
@@ -1,3 +1,7 @@
+from datetime import timedelta
+
+from django.db.models import Prefetch
+from django.utils import timezone
 from rest_framework import serializers
 from .models import (
     Job,
@@ -5,15 +9,81 @@ from .models import (
     SavedJob,
     JobAlert,
     JobAlertNotification,
+    ArchivedJobAlertNotification,
     Interview,
     JobTest,
     JobTestAnswer,
     JobTestQuestion,
     ApplicationStatusNotification, 
 )
+from .events import KINDS
+
 
+# ===========================
+#   SPARSE FIELDSETS
+# ===========================
 
-class JobSerializer(serializers.ModelSerializer):
+def parse_field_paths(value):
+    """
+    "id,title,job.title,job.company_name" ->
+        {"id": {}, "title": {}, "job": {"title": {}, "company_name": {}}}
+    An empty dict means "the whole field".
+    """
+    tree = {}
+    for path in (value or "").split(","):
+        parts = [p for p in path.strip().split(".") if p]
+        if not parts:
+            continue
+        node = tree
+        for i, part in enumerate(parts):
+            if part in node and not node[part] and i < len(parts) - 1:
+                break  # "job" already asked for the whole nested object
+            node = node.setdefault(part, {})
+        else:
+            node.clear()  # "job" after "job.title": whole object
+    return tree
+
+
+class SparseFieldsMixin:
+    """
+    Read-only sparse fieldsets from the query string:
+        ?fields=id,title,company_name   only these fields
+        ?omit=description                everything but these
+    Dotted paths reach into nested serializers (?fields=id,status,job.title).
+    Unknown names are ignored. Writes (POST/PUT/PATCH) are never affected.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        include, omit = self._sparse_spec()
+        if include:
+            fields = {name: f for name, f in fields.items() if name in include}
+        for name, field in list(fields.items()):
+            sub_include = (include or {}).get(name) or None
+            sub_omit = (omit or {}).get(name)
+            if sub_omit == {}:
+                del fields[name]
+                continue
+            target = getattr(field, "child", field)
+            if isinstance(target, SparseFieldsMixin) and (sub_include or sub_omit):
+                target._sparse = (sub_include, sub_omit)
+        return fields
+
+    def _sparse_spec(self):
+        if hasattr(self, "_sparse"):
+            return self._sparse
+        # only the top-level serializer reads the request
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get("request")
+        if parent is not None or request is None or request.method not in ("GET", "HEAD"):
+            return None, None
+        params = request.query_params
+        return parse_field_paths(params.get("fields")), parse_field_paths(params.get("omit"))
+
+
+class JobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     company_name = serializers.CharField(source="company.name", read_only=True)
 
     class Meta:
@@ -22,6 +92,37 @@ class JobSerializer(serializers.ModelSerializer):
         read_only_fields = ["company"]
 
 
+class JobCardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact job for list views (JobCard): no full description, just the
+    precomputed excerpt. Pair with JOB_CARD_ONLY to skip the other columns.
+    """
+    company_name = serializers.CharField(source="company.name", read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "title",
+            "company",
+            "company_name",
+            "location",
+            "job_type",
+            "salary_min",
+            "salary_max",
+            "description_excerpt",
+            "is_active",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+# columns JobCardSerializer reads, for .only() (with select_related("company"))
+JOB_CARD_ONLY = [
+    name for name in JobCardSerializer.Meta.fields if name != "company_name"
+] + ["company__name"]
+
+
 # ===========================
 #   JOB TEST SERIALIZERS
 # ===========================
@@ -39,7 +140,7 @@ class JobTestQuestionSerializer(serializers.ModelSerializer):
         ]  # no correct_option for candidate side
 
 
-class JobTestSerializer(serializers.ModelSerializer):
+class JobTestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     questions = JobTestQuestionSerializer(many=True, read_only=True)
 
     class Meta:
@@ -51,9 +152,29 @@ class JobTestSerializer(serializers.ModelSerializer):
             "score",
             "passed",
             "completed_at",  # ✅ used to disable Take Test button
+            "generation_status",  # "pending" until a worker adds the questions
             "questions",
         ]
-        read_only_fields = ["score", "passed", "application", "completed_at"]
+        read_only_fields = [
+            "score", "passed", "application", "completed_at", "generation_status",
+        ]
+
+
+class JobTestSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Test status for application lists – no questions."""
+
+    class Meta:
+        model = JobTest
+        fields = [
+            "id",
+            "application",
+            "total_marks",
+            "score",
+            "passed",
+            "completed_at",
+            "generation_status",
+        ]
+        read_only_fields = fields
 
 
 class JobTestAnswerInputSerializer(serializers.Serializer):
@@ -78,9 +199,12 @@ class JobTestQuestionResultSerializer(serializers.ModelSerializer):
         ]
 
     def get_candidate_answer(self, obj):
-        application = self.context["application"]
-        ans = obj.answers.filter(application=application).first()
-        return ans.selected_option if ans else None
+        # prefetched by JobTestResultSerializer (one query for all questions)
+        answers = getattr(obj, "candidate_answers", None)
+        if answers is None:
+            application = self.context["application"]
+            answers = obj.answers.filter(application=application)[:1]
+        return answers[0].selected_option if answers else None
 
 
 class JobTestResultSerializer(serializers.ModelSerializer):
@@ -99,7 +223,14 @@ class JobTestResultSerializer(serializers.ModelSerializer):
 
     def get_questions(self, obj):
         application = self.context["application"]
-        qs = obj.questions.all()
+        # questions + this candidate's answers: two queries in total
+        qs = obj.questions.prefetch_related(
+            Prefetch(
+                "answers",
+                queryset=JobTestAnswer.objects.filter(application=application),
+                to_attr="candidate_answers",
+            )
+        )
         return JobTestQuestionResultSerializer(
             qs, many=True, context={"application": application}
         ).data
@@ -109,7 +240,7 @@ class JobTestResultSerializer(serializers.ModelSerializer):
 #   APPLICATION / INTERVIEW
 # ===========================
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     job = JobSerializer(read_only=True)
     job_id = serializers.PrimaryKeyRelatedField(
         queryset=Job.objects.all(),
@@ -130,6 +261,50 @@ class ApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = ["applied_at"]
 
 
+class ApplicationListSerializer(ApplicationSerializer):
+    """
+    Applicant lists: the job as a card and the test without its questions.
+    Use with APPLICATION_LIST_RELATED so a page costs a constant number of
+    queries.
+    """
+    job = JobCardSerializer(read_only=True)
+    test = JobTestSummarySerializer(read_only=True)
+
+
+# everything ApplicationListSerializer reads, in one JOIN
+APPLICATION_LIST_RELATED = ("job__company", "candidate__user", "test")
+
+
+class BulkStatusFilterSerializer(serializers.Serializer):
+    job = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    status = serializers.ListField(
+        child=serializers.ChoiceField(choices=Application.STATUS_CHOICES), required=False
+    )
+    passed = serializers.BooleanField(required=False, allow_null=True, default=None)  # test result
+
+
+class BulkStatusSerializer(serializers.Serializer):
+    """
+    Body of POST /api/applications/bulk-status/ - the new `status` and
+    exactly one of:
+      ids      [12, 15, ...]
+      filter   {"job": [3], "status": ["applied"], "passed": true}: every
+               matching application to the recruiter's jobs
+    """
+    MAX_IDS = 1000
+
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=MAX_IDS
+    )
+    filter = BulkStatusFilterSerializer(required=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Send either ids or filter.")
+        return attrs
+
+
 class InterviewSerializer(serializers.ModelSerializer):
     application_id = serializers.IntegerField(source="application.id", read_only=True)
     candidate_username = serializers.CharField(
@@ -149,8 +324,8 @@ class InterviewSerializer(serializers.ModelSerializer):
 #   SAVED JOBS & ALERTS
 # ===========================
 
-class SavedJobSerializer(serializers.ModelSerializer):
-    job = JobSerializer(read_only=True)
+class SavedJobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    job = JobCardSerializer(read_only=True)
 
     class Meta:
         model = SavedJob
@@ -181,6 +356,20 @@ class JobAlertNotificationSerializer(serializers.ModelSerializer):
         ]
 
 
+class ArchivedJobAlertNotificationSerializer(serializers.ModelSerializer):
+    """Same shape as JobAlertNotificationSerializer; archived ones are read."""
+    job_title = serializers.CharField(source="job.title", read_only=True)
+    company_name = serializers.CharField(source="job.company.name", read_only=True)
+    job_id = serializers.IntegerField(read_only=True)
+    is_read = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedJobAlertNotification
+        fields = ["id", "job_title", "company_name", "job_id", "is_read", "created_at"]
+
+    def get_is_read(self, obj):
+        return True
+
 
 # ===========================
 #   APPLICATION STATUS NOTIFICATIONS
@@ -203,3 +392,73 @@ class ApplicationStatusNotificationSerializer(serializers.ModelSerializer):
             "is_read",
             "created_at",
         ]
+
+
+# ===========================
+#   NOTIFICATION INBOX
+# ===========================
+
+class NotificationRefSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=KINDS)
+    id = serializers.IntegerField(min_value=1)
+
+
+class InboxReadSerializer(serializers.Serializer):
+    """
+    Body of POST /api/alerts/inbox/read/ - exactly one of:
+      items   [{"kind": "job_alert", "id": 3}, ...]
+      up_to   {"kind": ..., "id": ...}: that notification and every older one
+    """
+    MAX_ITEMS = 500
+
+    items = NotificationRefSerializer(many=True, required=False, allow_empty=False, max_length=MAX_ITEMS)
+    up_to = NotificationRefSerializer(required=False)
+
+    def validate(self, attrs):
+        if ("items" in attrs) == ("up_to" in attrs):
+            raise serializers.ValidationError("Send either items or up_to.")
+        return attrs
+
+
+# ===========================
+#   RECRUITER ANALYTICS
+# ===========================
+
+class AnalyticsSeriesQuerySerializer(serializers.Serializer):
+    """Query string of GET /api/recruiter/analytics/series/."""
+    # default range per interval, in days
+    DEFAULT_SPAN = {"day": 30, "week": 7 * 12, "month": 365}
+    MAX_BUCKETS = 800
+
+    interval = serializers.ChoiceField(choices=["day", "week", "month"], default="day")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    job = serializers.CharField(required=False)  # "12,15"
+    status = serializers.CharField(required=False)  # "applied,shortlisted"
+
+    def validate_job(self, value):
+        try:
+            return [int(v) for v in value.split(",") if v.strip()]
+        except ValueError:
+            raise serializers.ValidationError("Comma-separated job ids expected.")
+
+    def validate_status(self, value):
+        valid = {choice for choice, _ in Application.STATUS_CHOICES}
+        statuses = [v.strip() for v in value.split(",") if v.strip()]
+        unknown = set(statuses) - valid
+        if unknown:
+            raise serializers.ValidationError(f"Unknown status: {', '.join(sorted(unknown))}.")
+        return statuses
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.localdate()
+        start = attrs.get("start") or end - timedelta(days=self.DEFAULT_SPAN[attrs["interval"]] - 1)
+        if start > end:
+            raise serializers.ValidationError({"start": "Must not be after end."})
+        per_bucket = {"day": 1, "week": 7, "month": 28}[attrs["interval"]]
+        if (end - start).days // per_bucket + 1 > self.MAX_BUCKETS:
+            raise serializers.ValidationError(
+                f"Range too long for interval '{attrs['interval']}' (max {self.MAX_BUCKETS} buckets)."
+            )
+        attrs["start"], attrs["end"] = start, end
+        return attrs
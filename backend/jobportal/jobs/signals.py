@@ -0,0 +1,213 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from accounts.models import Company, CandidateProfile
+from .models import (
+    Job, JobAlert, Application, JobAlertNotification, ApplicationStatusNotification,
+)
+from . import (
+    search_utils, skill_utils, alert_matching, recommendation_utils, recommendation_cache,
+    conditional, response_cache, analytics_utils, notification_counters,
+)
+
+
+# ===========================
+#   JOB SEARCH INDEX
+# ===========================
+
+@receiver(post_save, sender=Job)
+def job_saved_update_search_index(sender, instance, **kwargs):
+    search_utils.index_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted_update_search_index(sender, instance, **kwargs):
+    search_utils.unindex_job(instance.pk)
+
+
+@receiver(post_save, sender=Company)
+def company_saved_update_search_index(sender, instance, created, **kwargs):
+    if not created:
+        search_utils.reindex_company(instance)
+
+
+# ===========================
+#   SKILL INDEX
+# ===========================
+
+@receiver(post_save, sender=Job)
+def job_saved_sync_skills(sender, instance, **kwargs):
+    skill_utils.sync_job_skills(instance)
+
+
+@receiver(post_save, sender=CandidateProfile)
+def candidate_profile_saved_sync_skills(sender, instance, **kwargs):
+    if skill_utils.sync_candidate_skills(instance):
+        recommendation_cache.invalidate_users([instance.user_id])
+
+
+# ===========================
+#   RECOMMENDATION INDEX
+# ===========================
+
+# registered after job_saved_sync_skills: the job's own skills must already
+# be in the Skill vocabulary when its vector is built
+@receiver(post_save, sender=Job)
+def job_saved_update_recommendation_index(sender, instance, **kwargs):
+    recommendation_utils.index_job(instance)
+
+
+@receiver(pre_delete, sender=Job)
+def job_deleted_update_recommendation_index(sender, instance, **kwargs):
+    # before the cascade, so document frequencies can be decremented
+    recommendation_utils.unindex_job(instance.pk)
+
+
+@receiver(post_save, sender=Company)
+def company_saved_invalidate_recommendations(sender, instance, created, **kwargs):
+    if not created:
+        recommendation_utils.invalidate_company(instance)
+
+
+@receiver(post_save, sender=Application)
+def application_created_invalidate_recommendations(sender, instance, created, **kwargs):
+    # applied jobs drop out of the candidate's list
+    if created:
+        recommendation_cache.invalidate_users([instance.candidate.user_id])
+
+
+# ===========================
+#   JOB ALERT INDEX
+# ===========================
+
+@receiver(post_save, sender=JobAlert)
+def job_alert_saved_update_index(sender, instance, **kwargs):
+    # deletes cascade to JobAlertTerm, only saves need handling
+    alert_matching.index_alert(instance)
+
+
+# ===========================
+#   CONDITIONAL GET VERSIONS
+# ===========================
+# Deletes are bumped via the parent whose cascade removes the rows: a
+# post_delete receiver on the notification models themselves would turn
+# the cascade's single DELETE into one query + signal per row.
+
+@receiver(post_save, sender=Job)
+def job_saved_bump_version(sender, instance, **kwargs):
+    conditional.bump(Job)
+
+
+@receiver(post_save, sender=Company)
+def company_saved_bump_version(sender, instance, created, **kwargs):
+    # company_name is part of every job / notification row
+    if not created:
+        conditional.bump(Job)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted_bump_versions(sender, instance, **kwargs):
+    conditional.bump(Job, JobAlertNotification, ApplicationStatusNotification)
+
+
+@receiver(post_delete, sender=Application)
+def application_deleted_bump_version(sender, instance, **kwargs):
+    conditional.bump(ApplicationStatusNotification)
+
+
+@receiver(post_delete, sender=CandidateProfile)
+def candidate_deleted_bump_versions(sender, instance, **kwargs):
+    conditional.bump(JobAlertNotification, ApplicationStatusNotification)
+
+
+@receiver(post_save, sender=JobAlertNotification)
+@receiver(post_save, sender=ApplicationStatusNotification)
+def notification_saved_bump_version(sender, instance, **kwargs):
+    conditional.bump(sender)
+
+
+# ===========================
+#   ANONYMOUS RESPONSE CACHE
+# ===========================
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_changed_invalidate_response_cache(sender, instance, **kwargs):
+    job_id = instance.pk
+    transaction.on_commit(lambda: response_cache.invalidate_jobs([job_id]))
+
+
+@receiver(post_save, sender=Company)
+def company_saved_invalidate_response_cache(sender, instance, created, **kwargs):
+    # deletes cascade to the jobs (job_changed_invalidate_response_cache)
+    if not created:
+        company_id = instance.pk
+        transaction.on_commit(lambda: response_cache.invalidate_company(company_id))
+
+
+# ===========================
+#   RECRUITER ANALYTICS ROLLUPS
+# ===========================
+
+@receiver(pre_save, sender=Application)
+def application_saving_remember_status(sender, instance, update_fields=None, **kwargs):
+    # the stored status, so post_save can move the count between statuses
+    instance._rollup_old_status = None
+    if instance.pk and (update_fields is None or "status" in update_fields):
+        instance._rollup_old_status = (
+            Application.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Application)
+def application_saved_update_rollup(sender, instance, created, **kwargs):
+    analytics_utils.application_saved(
+        instance, created, getattr(instance, "_rollup_old_status", None)
+    )
+
+
+@receiver(post_delete, sender=Application)
+def application_deleted_update_rollup(sender, instance, **kwargs):
+    analytics_utils.application_deleted(instance)
+
+
+# ===========================
+#   UNREAD NOTIFICATION COUNTERS
+# ===========================
+
+@receiver(post_save, sender=JobAlertNotification)
+def job_alert_notification_created_count_unread(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        notification_counters.notifications_created(JobAlertNotification, [instance.candidate_id])
+
+
+@receiver(post_save, sender=ApplicationStatusNotification)
+def status_notification_created_count_unread(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        user_id = instance.application.candidate.user_id
+        notification_counters.add(ApplicationStatusNotification, {user_id: 1})
+
+
+# cascades delete notifications without signals: uncount them up front
+
+@receiver(pre_delete, sender=Job)
+def job_deleting_uncount_notifications(sender, instance, **kwargs):
+    notification_counters.unread_removed(
+        JobAlertNotification, JobAlertNotification.objects.filter(job_id=instance.pk)
+    )
+
+
+@receiver(pre_delete, sender=Application)
+def application_deleting_uncount_notifications(sender, instance, **kwargs):
+    notification_counters.unread_removed(
+        ApplicationStatusNotification,
+        ApplicationStatusNotification.objects.filter(application_id=instance.pk),
+    )
+
+
+@receiver(pre_delete, sender=CandidateProfile)
+def candidate_deleting_uncount_notifications(sender, instance, **kwargs):
+    notification_counters.unread_removed(
+        JobAlertNotification, JobAlertNotification.objects.filter(candidate_id=instance.pk)
+    )
@@ -0,0 +1,113 @@
+# jobportal/jobs/skill_utils.py
+
+from django.db.models import Count
+
+from .models import Skill, JobSkill, CandidateSkill
+from .text_utils import split_terms
+from .tasks import enqueue
+
+MAX_SKILL_LENGTH = Skill._meta.get_field("name").max_length
+
+
+def parse_skills(text):
+    """Normalized skill names from a free-text comma list."""
+    return [s for s in split_terms(text) if len(s) <= MAX_SKILL_LENGTH]
+
+
+def get_or_create_skill_ids(names):
+    """
+    {name: skill_id} for `names`, creating missing Skill rows in bulk.
+    Brand-new skills are queued for back-filling into the recommendation
+    index (existing jobs may mention them).
+    """
+    if not names:
+        return {}
+    ids = dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+    new_names = [n for n in names if n not in ids]
+    if new_names:
+        Skill.objects.bulk_create(
+            [Skill(name=n) for n in new_names], ignore_conflicts=True
+        )
+        ids = dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+        for name in new_names:
+            enqueue(
+                "index_new_skill_term",
+                {"term": name},
+                dedupe_key=f"index_new_skill_term:{name}",
+            )
+    return ids
+
+
+def _sync_links(link_model, owner_field, owner_id, names):
+    """
+    Make the owner's link rows match `names`: delete stale links, bulk insert
+    new ones. No writes at all when nothing changed.
+    Returns True if the owner's skill set changed.
+    """
+    current = dict(
+        link_model.objects.filter(**{owner_field: owner_id}).values_list(
+            "skill__name", "skill_id"
+        )
+    )
+    wanted = set(names)
+
+    stale = [sid for name, sid in current.items() if name not in wanted]
+    if stale:
+        link_model.objects.filter(**{owner_field: owner_id}, skill_id__in=stale).delete()
+
+    missing = [n for n in names if n not in current]
+    if missing:
+        ids = get_or_create_skill_ids(missing)
+        link_model.objects.bulk_create(
+            [link_model(**{owner_field: owner_id}, skill_id=ids[n]) for n in missing],
+            ignore_conflicts=True,
+        )
+    return bool(stale or missing)
+
+
+def sync_job_skills(job):
+    return _sync_links(JobSkill, "job_id", job.pk, parse_skills(job.skills))
+
+
+def sync_candidate_skills(profile):
+    return _sync_links(CandidateSkill, "candidate_id", profile.pk, parse_skills(profile.skills))
+
+
+def candidate_skill_names(profile):
+    """The candidate's normalized skills, read from the index."""
+    return list(
+        CandidateSkill.objects.filter(candidate=profile).values_list(
+            "skill__name", flat=True
+        )
+    )
+
+
+def filter_jobs_by_skills(qs, skills_text, match="all"):
+    """
+    Restrict a Job queryset to jobs having all (default) or any of the
+    given skills, answered from the JobSkill posting lists.
+    """
+    names = parse_skills(skills_text)
+    if not names:
+        return qs
+
+    skill_ids = list(Skill.objects.filter(name__in=names).values_list("id", flat=True))
+
+    if match == "any":
+        if not skill_ids:
+            return qs.none()
+        return qs.filter(
+            id__in=JobSkill.objects.filter(skill_id__in=skill_ids).values("job_id")
+        )
+
+    # all: an unknown skill can't be matched by any job
+    if len(skill_ids) < len(names):
+        return qs.none()
+    job_ids = (
+        JobSkill.objects.filter(skill_id__in=skill_ids)
+        .values("job_id")
+        .annotate(n=Count("skill_id"))
+        .filter(n=len(skill_ids))
+        .values("job_id")
+    )
+    return qs.filter(id__in=job_ids)
@@ -0,0 +1,246 @@
+# jobportal/jobs/tasks.py
+
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import BackgroundTask, Job, JobAlertNotification, JobTest
+from .alert_matching import match_alerts
+from . import conditional, notification_counters, recommendation_utils, test_utils
+
+logger = logging.getLogger(__name__)
+
+# A "running" task whose worker died is picked up again after this long.
+LOCK_TIMEOUT = timedelta(seconds=getattr(settings, "BACKGROUND_TASKS_LOCK_TIMEOUT", 600))
+
+FANOUT_CHUNK_SIZE = 1000
+
+_registry = {}
+
+
+def task(name):
+    """Register `fn(task, **payload)` as the handler for tasks called `name`."""
+    def decorator(fn):
+        _registry[name] = fn
+        return fn
+    return decorator
+
+
+def enqueue(name, payload=None, dedupe_key=None, run_after=None):
+    """
+    Queue a task. Call it inside the transaction that creates the data the
+    task needs – the row only becomes visible to workers on commit.
+
+    With a dedupe_key, enqueueing the same work twice returns the existing
+    task instead of creating a second one.
+    """
+    if name not in _registry:
+        raise ValueError(f"Unknown background task: {name}")
+
+    fields = {
+        "name": name,
+        "payload": payload or {},
+        "run_after": run_after or timezone.now(),
+    }
+    if dedupe_key:
+        try:
+            with transaction.atomic():
+                obj = BackgroundTask.objects.create(dedupe_key=dedupe_key, **fields)
+        except IntegrityError:
+            return BackgroundTask.objects.get(dedupe_key=dedupe_key)
+    else:
+        obj = BackgroundTask.objects.create(**fields)
+
+    # BACKGROUND_TASKS_EAGER: run right after commit, in-process
+    # (handy for tests / local dev without a worker)
+    if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+        transaction.on_commit(lambda: run_task(obj.pk, worker="eager"))
+    return obj
+
+
+def report_progress(task_obj, done, total=None):
+    """Persist progress so admins can follow long fan-outs."""
+    task_obj.progress_done = done
+    fields = ["progress_done"]
+    if total is not None:
+        task_obj.progress_total = total
+        fields.append("progress_total")
+    BackgroundTask.objects.filter(pk=task_obj.pk).update(
+        **{f: getattr(task_obj, f) for f in fields}
+    )
+
+
+# ===========================
+#   WORKER SIDE
+# ===========================
+
+def default_worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_next(worker):
+    """
+    Atomically move the oldest due pending task to "running" for `worker`.
+    The conditional UPDATE makes two workers never claim the same row.
+    """
+    now = timezone.now()
+
+    # release tasks whose worker vanished mid-run
+    BackgroundTask.objects.filter(
+        status="running", locked_at__lt=now - LOCK_TIMEOUT
+    ).update(status="pending", locked_by="", locked_at=None)
+
+    candidates = (
+        BackgroundTask.objects.filter(status="pending", run_after__lte=now)
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[:5]
+    )
+    for task_id in candidates:
+        claimed = BackgroundTask.objects.filter(id=task_id, status="pending").update(
+            status="running", locked_by=worker, locked_at=now
+        )
+        if claimed:
+            return BackgroundTask.objects.get(id=task_id)
+    return None
+
+
+def run_task(task_id, worker=None):
+    """Run one task by id (claiming it first). Returns the final status."""
+    worker = worker or default_worker_name()
+    claimed = BackgroundTask.objects.filter(id=task_id, status="pending").update(
+        status="running", locked_by=worker, locked_at=timezone.now()
+    )
+    if not claimed:
+        return None
+    return execute(BackgroundTask.objects.get(id=task_id))
+
+
+def execute(task_obj):
+    handler = _registry.get(task_obj.name)
+    task_obj.attempts += 1
+    try:
+        if handler is None:
+            raise ValueError(f"No handler registered for {task_obj.name}")
+        handler(task_obj, **task_obj.payload)
+    except Exception as e:
+        logger.warning("Task %s failed (attempt %s): %s", task_obj, task_obj.attempts, e)
+        task_obj.last_error = traceback.format_exc()
+        if task_obj.attempts < task_obj.max_attempts:
+            # exponential backoff: 10s, 20s, 40s, ...
+            delay = timedelta(seconds=10 * 2 ** (task_obj.attempts - 1))
+            task_obj.status = "pending"
+            task_obj.run_after = timezone.now() + delay
+        else:
+            task_obj.status = "failed"
+            task_obj.finished_at = timezone.now()
+    else:
+        task_obj.status = "done"
+        task_obj.finished_at = timezone.now()
+        task_obj.last_error = ""
+
+    task_obj.locked_by = ""
+    task_obj.locked_at = None
+    task_obj.save(update_fields=[
+        "status", "attempts", "run_after", "last_error",
+        "finished_at", "locked_by", "locked_at",
+    ])
+    return task_obj.status
+
+
+# ===========================
+#   HANDLERS
+# ===========================
+
+@task("job_alert_fanout")
+def job_alert_fanout(task_obj, job_id):
+    """
+    Create JobAlertNotification rows for every alert matching a new job.
+    Inserted in chunks; the (job, alert) unique constraint + ignore_conflicts
+    make a retried or duplicated run harmless.
+    """
+    job = Job.objects.filter(pk=job_id, is_active=True).first()
+    if job is None:
+        return  # deleted / deactivated before we got to it
+
+    matches = match_alerts(job)
+    report_progress(task_obj, 0, total=len(matches))
+
+    for start in range(0, len(matches), FANOUT_CHUNK_SIZE):
+        chunk = matches[start : start + FANOUT_CHUNK_SIZE]
+        # skip pairs a previous (retried) run already notified, so the
+        # unread counters only count new rows
+        done = set(
+            JobAlertNotification.objects.filter(
+                job_id=job.pk, alert_id__in=[alert_id for alert_id, _ in chunk]
+            ).values_list("alert_id", flat=True)
+        )
+        chunk_new = [(alert_id, candidate_id) for alert_id, candidate_id in chunk if alert_id not in done]
+        with transaction.atomic():
+            JobAlertNotification.objects.bulk_create(
+                [
+                    JobAlertNotification(candidate_id=candidate_id, job_id=job.pk, alert_id=alert_id)
+                    for alert_id, candidate_id in chunk_new
+                ],
+                ignore_conflicts=True,
+            )
+            # bulk_create sends no post_save: ETag version + unread counters here
+            conditional.bump(JobAlertNotification)
+            notification_counters.notifications_created(
+                JobAlertNotification, [candidate_id for _, candidate_id in chunk_new]
+            )
+        report_progress(task_obj, start + len(chunk))
+
+
+@task("index_new_skill_term")
+def index_new_skill_term(task_obj, term):
+    """Back-fill recommendation postings for a skill new to the vocabulary."""
+    added = recommendation_utils.index_new_term(term)
+    report_progress(task_obj, added, total=added)
+
+
+def queue_test_generation(application):
+    """
+    Create the application's pending JobTest and queue its question
+    generation. Returns the test.
+    """
+    test = test_utils.create_pending_test(application)
+    if test.generation_status == "pending":
+        enqueue("generate_test", {"test_id": test.pk}, dedupe_key=f"generate_test:{test.pk}")
+    return test
+
+
+def retry_test_generation(test):
+    """Re-queue a test whose generation failed (first caller wins)."""
+    retried = JobTest.objects.filter(pk=test.pk, generation_status="failed").update(
+        generation_status="pending"
+    )
+    if retried:
+        test.generation_status = "pending"
+        enqueue("generate_test", {"test_id": test.pk})
+    return test
+
+
+@task("generate_test")
+def generate_test(task_obj, test_id):
+    """Fill in the questions of a pending JobTest (Groq, local fallback)."""
+    test = (
+        JobTest.objects.select_related("application__job")
+        .filter(pk=test_id, generation_status="pending")
+        .first()
+    )
+    if test is None:
+        return  # already generated, or the application was withdrawn
+
+    try:
+        test_utils.fill_test_questions(test)
+    except Exception:
+        if task_obj.attempts >= task_obj.max_attempts:
+            JobTest.objects.filter(pk=test_id).update(generation_status="failed")
+        raise
+    report_progress(task_obj, 1, total=1)
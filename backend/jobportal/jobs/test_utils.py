@@ -1,10 +1,17 @@
 # jobportal/jobs/test_utils.py
 
-import requests
 import json
+import logging
 import re
+
+import requests
 from django.conf import settings
-from .models import JobTest, JobTestQuestion
+from django.db import transaction
+from django.utils import timezone
+from .models import JobTest, JobTestQuestion, JobTestAnswer
+from . import question_bank
+
+logger = logging.getLogger(__name__)
 
 # ✅ HARD-CODED FREE GROQ API URL
 GROOK_API_URL = "https://api.groq.com/openai/v1/chat/completions"
@@ -12,6 +19,13 @@ GROOK_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 # ✅ API KEY TAKEN FROM SETTINGS (you already load it)
 GROOK_API_KEY = getattr(settings, "GROOK_API_KEY", None)
 
+# Groq / fallback "correct_option" index -> stored option letter
+CORRECT_OPTION_MAP = {0: "A", 1: "B", 2: "C", 3: "D"}
+
+MARKS_PER_QUESTION = 2
+# 30 is the current pass threshold (60% of 50 marks)
+PASS_SCORE = 30
+
 
 def _generate_fallback_questions(skills_text, count=25):
     """
@@ -84,15 +98,25 @@ def _generate_fallback_questions(skills_text, count=25):
     return questions
 
 
-def create_test_for_application(application):
+def create_pending_test(application):
     """
-    1. Tries Groq API (llama-3.1-8b-instant) to generate 25 MCQs
-    2. If anything fails, falls back to local simple questions
-    3. Creates JobTest + JobTestQuestion entries
+    Create the (empty) JobTest of an application in "pending" state.
+    The questions are filled in by the "generate_test" background task,
+    so applying never waits on the Groq API.
     """
-    job = application.job
-    skills_text = getattr(job, "skills", "") or ""
+    test, _ = JobTest.objects.get_or_create(
+        application=application,
+        defaults={"generation_status": "pending"},
+    )
+    return test
 
+
+def generate_questions_with_groq(skills_text):
+    """
+    Asks Groq (llama-3.1-8b-instant) for 25 MCQs.
+    Returns the list of question dicts, or None if the key is missing or
+    anything fails. Slow (network) – only call it from a background task.
+    """
     questions_data = None
 
     # =========================
@@ -176,49 +200,105 @@ def create_test_for_application(application):
             data = json.loads(content)
             questions_data = data.get("questions", [])[:25]
         except Exception as e:
-            print("Groq API Error:", str(e))
+            logger.warning("Groq API error: %s", e)
             questions_data = None
 
-    # ===================================
-    # 2) Fallback to local questions if needed
-    # ===================================
-    if not questions_data:
-        print("Using fallback questions instead of Groq.")
-        questions_data = _generate_fallback_questions(skills_text, count=25)
-
-    if not questions_data:
-        print("No questions generated at all.")
-        return None
-
-    # =======================
-    # 3) Create Test & Questions
-    # =======================
-    # If a test already exists for this application, delete and recreate
-    existing = getattr(application, "test", None)
-    if existing:
-        existing.questions.all().delete()
-        existing.delete()
-
-    test = JobTest.objects.create(
-        application=application,
-        total_marks=len(questions_data) * 2,
-    )
+    return questions_data or None
 
-    correct_map = {0: "A", 1: "B", 2: "C", 3: "D"}
 
-    for q in questions_data:
-        opts = q.get("options", [])
-        if len(opts) != 4:
-            continue
+def fill_test_questions(test):
+    """
+    Pick the questions of a pending test and mark it ready:
+    1. Sample from the question bank of the job's skill set (only a missing
+       or low pool calls Groq)
+    2. Top up with local simple questions if the pool is still too small
+    Safe to re-run: existing questions are replaced.
+    """
+    skills_text = test.application.job.skills or ""
 
-        JobTestQuestion.objects.create(
+    picked = question_bank.sample_questions(skills_text, generate_questions_with_groq)
+    questions = [
+        JobTestQuestion(
             test=test,
-            text=q.get("question", "No question"),
-            option_a=opts[0],
-            option_b=opts[1],
-            option_c=opts[2],
-            option_d=opts[3],
-            correct_option=correct_map.get(q.get("correct_option", 0), "A"),
+            text=item.text,
+            option_a=item.option_a,
+            option_b=item.option_b,
+            option_c=item.option_c,
+            option_d=item.option_d,
+            correct_option=item.correct_option,
+        )
+        for item in picked
+    ]
+
+    missing = question_bank.TEST_SIZE - len(questions)
+    if missing > 0:
+        logger.warning("Using %s fallback questions for test %s instead of Groq.", missing, test.pk)
+        for q in _generate_fallback_questions(skills_text, count=missing):
+            opts = q["options"]
+            questions.append(JobTestQuestion(
+                test=test,
+                text=q["question"],
+                option_a=opts[0],
+                option_b=opts[1],
+                option_c=opts[2],
+                option_d=opts[3],
+                correct_option=CORRECT_OPTION_MAP[q["correct_option"]],
+            ))
+
+    with transaction.atomic():
+        test.questions.all().delete()
+        JobTestQuestion.objects.bulk_create(questions)
+        test.total_marks = len(questions) * 2
+        test.generation_status = "ready"
+        test.save(update_fields=["total_marks", "generation_status"])
+
+    return test
+
+
+def grade_submission(test, application, answers):
+    """
+    Grade a batch of validated answers
+    ([{"question_id": 1, "selected_option": "A"}, ...]) in one transaction:
+    1. Claim the JobTest with a conditional UPDATE on completed_at IS NULL,
+       so of two concurrent double submits only one grades (works on SQLite,
+       where select_for_update is a no-op)
+    2. Load the answer key in one query and score in memory
+       (unknown question ids are ignored, the last answer per question wins)
+    3. Upsert all answers with a single bulk INSERT ... ON CONFLICT
+    Returns the completed test, or None if it had already been completed.
+    """
+    with transaction.atomic():
+        completed_at = timezone.now()
+        claimed = JobTest.objects.filter(pk=test.pk, completed_at__isnull=True).update(
+            completed_at=completed_at
+        )
+        if not claimed:
+            return None
+
+        answer_key = dict(
+            JobTestQuestion.objects.filter(test_id=test.pk).values_list("id", "correct_option")
+        )
+        selected = {
+            ans["question_id"]: ans["selected_option"]
+            for ans in answers
+            if ans["question_id"] in answer_key
+        }
+
+        JobTestAnswer.objects.bulk_create(
+            [
+                JobTestAnswer(question_id=q_id, application=application, selected_option=opt)
+                for q_id, opt in selected.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["question", "application"],
+            update_fields=["selected_option"],
+        )
+
+        test.score = MARKS_PER_QUESTION * sum(
+            1 for q_id, opt in selected.items() if answer_key[q_id] == opt
         )
+        test.passed = test.score > PASS_SCORE
+        test.completed_at = completed_at
+        test.save(update_fields=["score", "passed", "completed_at"])
 
     return test
@@ -1,3 +1,1669 @@
-from django.test import TestCase
+import asyncio
+import base64
+import json
+import smtplib
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocMemEmailBackend
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import User, Company, CandidateProfile
+from .models import (
+    Job, Application, JobTest, JobTestQuestion, JobTestAnswer, JobAlert,
+    JobAlertNotification, ApplicationStatusNotification, BackgroundTask,
+    ArchivedJobAlertNotification, EmailOutbox, ApplicationDailyRollup, ApplicationPeriodRollup,
+    Skill, JobSkill, QuestionBank, QuestionBankItem,
+)
+from .tasks import job_alert_fanout
+from .email_utils import send_application_status_email
+from .pagination import KeysetPagination
+from .serializers import JobCardSerializer, parse_field_paths
+from .test_utils import grade_submission
+from . import (
+    alert_matching, analytics_utils, bulk_status, conditional, digests, events, notification_counters, outbox,
+    question_bank, recommendation_cache, response_cache, retention, skill_utils, tasks, test_utils,
+)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        cls.jobs = [
+            Job.objects.create(company=company, title=f"Job {i}", description="x", location="ABC"[i % 3])
+            for i in range(11)
+        ]
+        # ties on created_at: only the id tie-breaker separates these rows
+        now = timezone.now()
+        Job.objects.filter(pk__in=[job.pk for job in cls.jobs[:6]]).update(created_at=now)
+        Job.objects.filter(pk__in=[job.pk for job in cls.jobs[6:]]).update(created_at=now - timedelta(days=1))
+
+    def paginate(self, queryset, url="/api/jobs/?page_size=3"):
+        paginator = KeysetPagination()
+        request = Request(APIRequestFactory().get(url))
+        rows = paginator.paginate_queryset(queryset, request)
+        return [row.pk for row in rows], paginator.get_next_link(), paginator.get_previous_link()
+
+    def walk(self, queryset):
+        """Every page forwards, then every page back from the last one."""
+        pages, url = [], "/api/jobs/?page_size=3"
+        while url:
+            ids, url, previous = self.paginate(queryset, url)
+            pages.append(ids)
+        back, url = [ids], previous
+        while url:
+            ids, _, url = self.paginate(queryset, url)
+            back.insert(0, ids)
+        self.assertEqual(back, pages)
+        self.assertTrue(all(len(page) == 3 for page in pages[:-1]))
+        return [pk for page in pages for pk in page]
+
+    def test_descending_with_ties(self):
+        queryset = Job.objects.order_by("-created_at")
+        expected = list(Job.objects.order_by("-created_at", "-id").values_list("pk", flat=True))
+        self.assertEqual(self.walk(queryset), expected)
+
+    def test_ascending(self):
+        queryset = Job.objects.order_by("created_at", "id")
+        self.assertEqual(self.walk(queryset), list(queryset.values_list("pk", flat=True)))
+
+    def test_mixed_directions(self):
+        queryset = Job.objects.order_by("location", "-created_at")
+        expected = list(Job.objects.order_by("location", "-created_at", "id").values_list("pk", flat=True))
+        walked = self.walk(queryset)
+        self.assertEqual(walked, expected)
+        self.assertEqual(len(set(walked)), len(self.jobs))
+
+    def test_last_page_and_first_page_links(self):
+        ids, next_link, previous_link = self.paginate(Job.objects.order_by("-id"), "/api/jobs/?page_size=20")
+        self.assertEqual(len(ids), 11)
+        self.assertIsNone(next_link)
+        self.assertIsNone(previous_link)
+
+    def test_invalid_cursors_are_404(self):
+        client = APIClient()
+        valid = client.get("/api/jobs/?page_size=3").json()["next"]
+        self.assertEqual(client.get(valid).status_code, 200)
+
+        def cursor(data):
+            return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+        for value in (
+            "junk",
+            "%%%",
+            cursor(["n", 1]),
+            cursor({"d": "x", "v": []}),
+            cursor({"d": "n", "v": "abc"}),
+            cursor({"d": "n", "v": [1]}),  # wrong number of values
+            cursor({"d": "n", "v": ["not a date", 1]}),
+            cursor({"d": "n", "v": ["2026-01-01T00:00:00Z", "abc"]}),
+        ):
+            self.assertEqual(client.get(f"/api/jobs/?cursor={value}").status_code, 404, value)
+
+        # ordered by the search rank (an .extra() column)
+        ranked = client.get("/api/jobs/?search=job&page_size=3").json()["next"]
+        self.assertEqual(client.get(ranked).status_code, 200)
+        for rank in ([1], {"a": 1}, None, True, "abc"):
+            value = cursor({"d": "n", "v": [rank, "2026-01-01T00:00:00Z", 1]})
+            self.assertEqual(client.get(f"/api/jobs/?search=job&cursor={value}").status_code, 404, rank)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class JobSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        cls.company = Company.objects.create(user=recruiter, name="Acme")
+        cls.paris = Job.objects.create(
+            company=cls.company, title="Backend Engineer", description="python services",
+            location="Paris", job_type="Full-time",
+        )
+        cls.berlin = [
+            Job.objects.create(
+                company=cls.company, title=f"Python Developer {i}", description="django",
+                location="Berlin", job_type="Internship",
+            )
+            for i in range(5)
+        ]
+        cls.hidden = Job.objects.create(
+            company=cls.company, title="Python Lead", description="python", is_active=False
+        )
+
+    def search(self, query):
+        response = APIClient().get(f"/api/jobs/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return [job["id"] for job in response.json()["results"]]
+
+    def test_title_matches_rank_first(self):
+        ids = self.search("search=python")
+        self.assertEqual(ids[-1], self.paris.id)
+        self.assertEqual(set(ids), {self.paris.id} | {job.id for job in self.berlin})
+        self.assertNotIn(self.hidden.id, ids)
+
+    def test_prefix_terms_must_all_match(self):
+        self.assertEqual(self.search("search=pyth+serv"), [self.paris.id])
+        self.assertEqual(self.search("search=python+cobol"), [])
+
+    def test_operators_are_literal(self):
+        self.assertEqual(self.search('search=python+NOT+"django"'), [])
+        self.assertEqual(self.search("search=-:*"), [])
+
+    def test_every_match_is_filtered(self):
+        # an older match is not lost behind newer ones
+        self.assertEqual(self.search("search=python&location=Paris"), [self.paris.id])
+        self.assertEqual(self.search("search=python&job_type=full"), [self.paris.id])
+
+    def test_index_follows_job_and_company_saves(self):
+        self.paris.title = "Rust Engineer"
+        self.paris.save()
+        self.assertEqual(self.search("search=rust"), [self.paris.id])
+        self.company.name = "Globex"
+        self.company.save()
+        self.assertEqual(len(self.search("search=globex")), 6)
+        self.paris.delete()
+        self.assertEqual(self.search("search=rust"), [])
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class SkillIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        cls.company = Company.objects.create(user=recruiter, name="Acme")
+        cls.web = Job.objects.create(company=cls.company, title="Web", description="x", skills="React, Django")
+        cls.api = Job.objects.create(
+            company=cls.company, title="API", description="x", skills="django;REST  API\nnode.js"
+        )
+        cls.closed = Job.objects.create(
+            company=cls.company, title="Old", description="x", skills="react, django", is_active=False
+        )
+
+    def job_skills(self, job):
+        return set(JobSkill.objects.filter(job=job).values_list("skill__name", flat=True))
+
+    def filtered(self, query):
+        response = APIClient().get(f"/api/jobs/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(job["id"] for job in response.json()["results"])
+
+    def test_normalization(self):
+        self.assertEqual(skill_utils.parse_skills("React, django,\nREACT , REST  API, " + "x" * 101), [
+            "react", "django", "rest api",
+        ])
+        self.assertEqual(self.job_skills(self.api), {"django", "rest api", "node.js"})
+        self.assertEqual(Skill.objects.filter(name="django").count(), 1)
+
+    def test_job_and_candidate_skills_sync_on_save(self):
+        self.web.skills = "react, TypeScript"
+        # unchanged skills: one read, no writes
+        with self.assertNumQueries(1):
+            self.assertFalse(skill_utils.sync_job_skills(Job(pk=self.api.pk, skills="node.js, Django, rest api")))
+        self.web.save()
+        self.assertEqual(self.job_skills(self.web), {"react", "typescript"})
+        self.assertTrue(Skill.objects.filter(name="typescript").exists())
+
+        user = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=user, skills="Python, SQL")
+        self.assertEqual(skill_utils.candidate_skill_names(profile), ["python", "sql"])
+        profile.skills = "sql"
+        profile.save()
+        self.assertEqual(skill_utils.candidate_skill_names(profile), ["sql"])
+
+    def test_match_all(self):
+        self.assertEqual(self.filtered("skills=django"), [self.web.id, self.api.id])
+        self.assertEqual(self.filtered("skills=Django,%20React"), [self.web.id])
+        self.assertEqual(self.filtered("skills=django,cobol"), [])
+        self.assertEqual(self.filtered("skills=django,react&search=web"), [self.web.id])
+
+    def test_match_any(self):
+        self.assertEqual(self.filtered("skills=react,node.js&skills_match=any"), [self.web.id, self.api.id])
+        self.assertEqual(self.filtered("skills=react,cobol&skills_match=any"), [self.web.id])
+        self.assertEqual(self.filtered("skills=cobol&skills_match=any"), [])
+        self.assertEqual(len(self.filtered("skills=%20,%20")), 2)
+
+
+class JobAlertMatchingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        cls.company = Company.objects.create(user=recruiter, name="Acme")
+        candidate = User.objects.create(username="candidate", role="candidate")
+        cls.profile = CandidateProfile.objects.create(user=candidate)
+
+    def alert(self, keywords, **fields):
+        return JobAlert.objects.create(candidate=self.profile, keywords=keywords, **fields)
+
+    def job(self, title, description="", **fields):
+        return Job.objects.create(company=self.company, title=title, description=description, **fields)
+
+    def matched(self, job):
+        return sorted(alert_id for alert_id, _ in alert_matching.match_alerts(job))
+
+    def test_alert_terms(self):
+        self.assertEqual(alert_matching.alert_terms(JobAlert(keywords="React, REST  api,react")), ["react", "rest api"])
+        self.assertEqual(alert_matching.alert_terms(JobAlert(keywords=" , ")), [""])
+        long_phrase = "senior backend python django engineer remote"
+        self.assertEqual(alert_matching.alert_terms(JobAlert(keywords=long_phrase)), [])
+        self.assertEqual(alert_matching.alert_terms(JobAlert(keywords=f"{long_phrase}, go")), ["go"])
+
+    def test_whole_word_phrases_location_and_type(self):
+        react = self.alert("React, rest api")
+        paris = self.alert("django", location="Paris")
+        intern = self.alert("django", job_type="Internship")
+        everything = self.alert("")
+        inactive = self.alert("django", is_active=False)
+
+        job = self.job("Django + REST API developer", location="Paris, France", job_type="Internship")
+        self.assertEqual(self.matched(job), [react.pk, paris.pk, intern.pk, everything.pk])
+        self.assertNotIn(inactive.pk, self.matched(job))
+        # "reactive" does not contain the word "react"
+        job = self.job("Reactive systems", location="Berlin", job_type="Full-time")
+        self.assertEqual(self.matched(job), [everything.pk])
+
+        # edits re-index the alert
+        react.keywords = "reactive"
+        react.save()
+        self.assertEqual(self.matched(job), [react.pk, everything.pk])
+
+    def test_over_long_phrases_never_match_all(self):
+        alert = self.alert("senior backend python django engineer remote")
+        self.assertEqual(self.matched(self.job("Chef", "cooking food")), [])
+        self.assertFalse(alert.terms.exists())
+
+
+class BackgroundTaskQueueTests(TestCase):
+    def setUp(self):
+        self.calls = []
+        patcher = mock.patch.dict(tasks._registry, {"flaky": self.flaky})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def flaky(self, task_obj, fail=0):
+        self.calls.append(task_obj.pk)
+        if task_obj.attempts <= fail:
+            raise RuntimeError("boom")
+
+    def test_claims_oldest_due_task_once(self):
+        now = timezone.now()
+        later = BackgroundTask.objects.create(name="flaky", run_after=now - timedelta(seconds=1))
+        first = BackgroundTask.objects.create(name="flaky", run_after=now - timedelta(seconds=5))
+        BackgroundTask.objects.create(name="flaky", run_after=now + timedelta(minutes=5))
+
+        claimed = tasks.claim_next("w1")
+        self.assertEqual((claimed.pk, claimed.status, claimed.locked_by), (first.pk, "running", "w1"))
+        self.assertEqual(tasks.claim_next("w2").pk, later.pk)
+        self.assertIsNone(tasks.claim_next("w3"))  # the last one is not due yet
+        self.assertIsNone(tasks.run_task(first.pk))  # already claimed
+
+    def test_stale_locks_are_released(self):
+        task_obj = BackgroundTask.objects.create(
+            name="flaky", status="running", locked_by="dead",
+            locked_at=timezone.now() - tasks.LOCK_TIMEOUT - timedelta(seconds=1),
+        )
+        self.assertEqual(tasks.claim_next("w1").pk, task_obj.pk)
+
+    def test_retries_with_backoff_then_fails(self):
+        with self.assertLogs("jobs.tasks", "WARNING") as logs:
+            task_obj = tasks.enqueue("flaky", {"fail": 2})
+            self.assertEqual(tasks.execute(tasks.claim_next("w")), "pending")
+            task_obj.refresh_from_db()
+            self.assertEqual((task_obj.attempts, task_obj.locked_by), (1, ""))
+            self.assertIn("RuntimeError: boom", task_obj.last_error)
+            self.assertAlmostEqual((task_obj.run_after - timezone.now()).total_seconds(), 10, delta=2)
+            self.assertIsNone(tasks.claim_next("w"))  # backing off
+
+            BackgroundTask.objects.filter(pk=task_obj.pk).update(run_after=timezone.now())
+            self.assertEqual(tasks.execute(tasks.claim_next("w")), "pending")
+            task_obj.refresh_from_db()
+            self.assertAlmostEqual((task_obj.run_after - timezone.now()).total_seconds(), 20, delta=2)
+
+            BackgroundTask.objects.filter(pk=task_obj.pk).update(run_after=timezone.now())
+            self.assertEqual(tasks.execute(tasks.claim_next("w")), "done")
+            task_obj.refresh_from_db()
+            self.assertEqual((task_obj.attempts, task_obj.last_error), (3, ""))
+            self.assertIsNotNone(task_obj.finished_at)
+
+            failing = tasks.enqueue("flaky", {"fail": 99})
+            BackgroundTask.objects.filter(pk=failing.pk).update(max_attempts=1)
+            self.assertEqual(tasks.run_task(failing.pk), "failed")
+            failing.refresh_from_db()
+            self.assertIsNotNone(failing.finished_at)
+            self.assertIsNone(tasks.claim_next("w"))
+        self.assertEqual(len(logs.records), 3)
+
+    def test_enqueue_dedupes_and_rejects_unknown_names(self):
+        first = tasks.enqueue("flaky", dedupe_key="k")
+        self.assertEqual(tasks.enqueue("flaky", dedupe_key="k").pk, first.pk)
+        self.assertEqual(BackgroundTask.objects.count(), 1)
+        with self.assertRaises(ValueError):
+            tasks.enqueue("nope")
+
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_eager_tasks_run_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task_obj = tasks.enqueue("flaky")
+            self.assertEqual(self.calls, [])
+        self.assertEqual(self.calls, [task_obj.pk])
+        task_obj.refresh_from_db()
+        self.assertEqual((task_obj.status, task_obj.locked_by), ("done", ""))
+
+    def test_job_alert_fanout(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        alerts = []
+        for i, keywords in enumerate(["python", "django", "cooking"]):
+            profile = CandidateProfile.objects.create(user=User.objects.create(username=f"c{i}", role="candidate"))
+            alerts.append(JobAlert.objects.create(candidate=profile, keywords=keywords))
+
+        client = APIClient()
+        client.force_authenticate(recruiter)
+        with self.settings(BACKGROUND_TASKS_EAGER=True), self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                "/api/jobs/",
+                {"title": "Python Dev", "description": "django", "location": "Paris", "job_type": "Full-time"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        task_obj = BackgroundTask.objects.get(name="job_alert_fanout")
+        self.assertEqual((task_obj.status, task_obj.progress_done, task_obj.progress_total), ("done", 2, 2))
+        self.assertEqual(
+            sorted(JobAlertNotification.objects.values_list("alert_id", flat=True)), [alerts[0].pk, alerts[1].pk]
+        )
+
+        # a re-run notifies nobody twice, a deactivated job nobody at all
+        job_alert_fanout(task_obj, job_id=response.json()["id"])
+        self.assertEqual(JobAlertNotification.objects.count(), 2)
+        Job.objects.filter(pk=response.json()["id"]).update(is_active=False)
+        JobAlertNotification.objects.all().delete()
+        job_alert_fanout(task_obj, job_id=response.json()["id"])
+        self.assertFalse(JobAlertNotification.objects.exists())
+
+
+class RecommendedJobsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="candidate", role="candidate")
+        cls.profile = CandidateProfile.objects.create(user=cls.user, skills="Python, Django")
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        cls.both = Job.objects.create(
+            company=company, title="Django Developer", description="python and django", skills="python"
+        )
+        cls.python = Job.objects.create(
+            company=company, title="Data Engineer", description="python pipelines"
+        )
+        cls.applied = Job.objects.create(
+            company=company, title="Python Django Lead", description="django", skills="django, python"
+        )
+        Job.objects.create(company=company, title="Chef", description="cooking")
+        Application.objects.create(job=cls.applied, candidate=cls.profile)
+
+    def setUp(self):
+        recommendation_cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def recommended(self, query=""):
+        response = self.client.get(f"/api/jobs/recommended/{query}")
+        self.assertEqual(response.status_code, 200)
+        return [job["id"] for job in response.json()]
+
+    def test_ranked_by_skills_without_applied_jobs(self):
+        self.assertEqual(self.recommended(), [self.both.id, self.python.id])
+        self.assertEqual(self.recommended("?limit=1"), [self.both.id])
+
+    def test_limit_is_clamped(self):
+        self.assertEqual(self.recommended("?limit=-1"), [self.both.id])
+        self.assertEqual(self.recommended("?limit=0"), [self.both.id])
+        self.assertEqual(self.recommended("?limit=abc"), [self.both.id, self.python.id])
+
+    def test_cached_until_the_candidate_skills_change(self):
+        self.recommended()
+        with self.assertNumQueries(0):
+            self.recommended()
+        self.profile.skills = ""
+        self.profile.save()
+        # no skills: newest jobs first
+        self.assertEqual(len(self.recommended()), 3)
+
+    def test_job_edits_refresh_cached_lists(self):
+        self.recommended()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.python.salary_min = Decimal("90000.00")
+            self.python.location = "Remote"
+            self.python.save()
+        response = self.client.get("/api/jobs/recommended/")
+        self.assertEqual(response.json()[1]["salary_min"], "90000.00")
+        self.assertEqual(response.json()[1]["location"], "Remote")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.python.company.name = "Acme Inc"
+            self.python.company.save()
+        self.assertEqual(self.client.get("/api/jobs/recommended/").json()[0]["company_name"], "Acme Inc")
+
+    def test_other_roles_get_an_empty_list(self):
+        self.client.force_authenticate(User.objects.create(username="recruiter2", role="recruiter"))
+        self.assertEqual(self.recommended(), [])
+
+
+def generated_questions(skills_text):
+    return [
+        {"question": f"{skills_text} question {i}", "options": ["a", "b", "c", "d"], "correct_option": 1}
+        for i in range(30)
+    ]
+
+
+class QuestionBankTests(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.stats = question_bank.stats()
+
+    def generate(self, skills_text, count=30, start=0):
+        self.calls.append(skills_text)
+        return [
+            {"question": f"{skills_text} question {i}", "options": ["a", "b", "c", "d"], "correct_option": 2}
+            for i in range(start, start + count)
+        ]
+
+    def stats_delta(self):
+        now = question_bank.stats()
+        return {name: now[name] - self.stats[name] for name in ("hits", "misses", "generated")}
+
+    def test_skill_sets_share_a_bank(self):
+        self.assertEqual(question_bank.skill_key("Django, Python"), question_bank.skill_key("python,django"))
+        question_bank.sample_questions("Django, Python", self.generate)
+        question_bank.sample_questions("python,django", self.generate)
+        bank = QuestionBank.objects.get()
+        self.assertEqual(bank.skills, "django, python")
+
+    def test_generates_only_below_min_pool(self):
+        picked = question_bank.sample_questions("python", self.generate)
+        self.assertEqual(len(picked), question_bank.TEST_SIZE)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual({item.correct_option for item in picked}, {"C"})
+
+        # 30 < MIN_POOL: topped up again, the same texts are dropped
+        question_bank.sample_questions("python", self.generate)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(QuestionBankItem.objects.count(), 30)
+
+        question_bank.sample_questions("python", lambda skills: self.generate(skills, start=30))
+        self.assertEqual(QuestionBankItem.objects.count(), 60)
+        with self.assertNumQueries(3):
+            question_bank.sample_questions("python", self.generate)  # bank, pool, last_used_at
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(self.stats_delta(), {"hits": 1, "misses": 3, "generated": 3})
+
+    def test_pool_is_capped_and_malformed_questions_skipped(self):
+        generated = self.generate("go", count=question_bank.MAX_POOL + 50)
+        generated[0] = {"question": "no options"}
+        generated[1] = {"question": " ", "options": ["a", "b", "c", "d"]}
+        generated[2] = dict(generated[3])  # repeated text
+        question_bank.sample_questions("go", lambda skills: generated)
+        self.assertEqual(QuestionBankItem.objects.count(), question_bank.MAX_POOL)
+        self.assertEqual(QuestionBankItem.objects.values("text").distinct().count(), question_bank.MAX_POOL)
+
+    def test_expired_bank_is_regenerated(self):
+        question_bank.sample_questions("python", self.generate)
+        bank = QuestionBank.objects.get()
+        QuestionBank.objects.filter(pk=bank.pk).update(
+            refreshed_at=timezone.now() - question_bank.TTL - timedelta(days=1)
+        )
+        question_bank.sample_questions("python", lambda skills: self.generate(skills, start=100))
+        texts = set(QuestionBankItem.objects.values_list("text", flat=True))
+        self.assertEqual(texts, {f"python question {i}" for i in range(100, 130)})
+        bank.refresh_from_db()
+        self.assertGreater(bank.refreshed_at, timezone.now() - timedelta(minutes=1))
+
+        # a request still holding the expired row doesn't empty the bank again
+        stale = QuestionBank(pk=bank.pk, skill_key=bank.skill_key, refreshed_at=timezone.now() - question_bank.TTL * 2)
+        with mock.patch.object(QuestionBank.objects, "get_or_create", return_value=(stale, False)):
+            question_bank.get_bank("python")
+        self.assertEqual(QuestionBankItem.objects.count(), 30)
+
+    def test_concurrent_first_requests_share_the_bank(self):
+        question_bank.get_bank("python")
+        with mock.patch.object(QuestionBank.objects, "get_or_create", side_effect=IntegrityError):
+            bank = question_bank.get_bank("python")
+        self.assertEqual(bank.pk, QuestionBank.objects.get().pk)
+
+    @mock.patch.object(question_bank, "MAX_BANKS", 2)
+    def test_least_recently_used_bank_is_evicted(self):
+        for skills in ("a", "b"):
+            question_bank.sample_questions(skills, self.generate)
+        QuestionBank.objects.filter(skills="b").update(last_used_at=timezone.now() - timedelta(days=1))
+        question_bank.sample_questions("c", self.generate)
+        self.assertEqual(sorted(QuestionBank.objects.values_list("skills", flat=True)), ["a", "c"])
+
+    def test_fallback_questions_fill_the_test(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        job = Job.objects.create(
+            company=Company.objects.create(user=recruiter, name="Acme"), title="Dev", description="x", skills="rust"
+        )
+        profile = CandidateProfile.objects.create(user=User.objects.create(username="candidate", role="candidate"))
+        application = Application.objects.create(job=job, candidate=profile)
+        test = JobTest.objects.create(application=application)
+
+        with mock.patch("jobs.test_utils.generate_questions_with_groq", return_value=None), \
+                self.assertLogs("jobs.test_utils", "WARNING"):
+            test_utils.fill_test_questions(test)
+        test.refresh_from_db()
+        self.assertEqual(test.generation_status, "ready")
+        self.assertEqual(test.questions.count(), question_bank.TEST_SIZE)
+        self.assertEqual(test.total_marks, question_bank.TEST_SIZE * 2)
+
+
+@mock.patch("jobs.test_utils.generate_questions_with_groq", generated_questions)
+class TestGenerationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        cls.job = Job.objects.create(company=company, title="Dev", description="python", skills="python")
+        cls.candidate = User.objects.create(username="candidate", role="candidate")
+        CandidateProfile.objects.create(user=cls.candidate)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.candidate)
+        response = self.client.post(f"/api/jobs/{self.job.id}/apply/", {}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.application = Application.objects.get(pk=response.json()["id"])
+        self.test_url = f"/api/applications/{self.application.id}/test/"
+
+    def generation_tasks(self):
+        return BackgroundTask.objects.filter(name="generate_test", status="pending")
+
+    def run_generation(self):
+        for task_obj in self.generation_tasks():
+            tasks.run_task(task_obj.pk)
+
+    def test_pending_until_the_worker_generates_questions(self):
+        self.assertEqual(self.application.test.generation_status, "pending")
+        self.assertEqual(self.generation_tasks().count(), 1)
+
+        response = self.client.get(self.test_url)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["generation_status"], "pending")
+        submit = self.client.post(
+            f"/api/applications/{self.application.id}/submit-test/", {"answers": []}, format="json"
+        )
+        self.assertEqual(submit.status_code, 409)
+
+        self.run_generation()
+        response = self.client.get(self.test_url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data["generation_status"], data["total_marks"]), ("ready", 50))
+        self.assertEqual(len(data["questions"]), 25)
+        self.assertNotIn("correct_option", data["questions"][0])
+
+    def test_failed_generation_is_retried_on_the_next_read(self):
+        BackgroundTask.objects.filter(name="generate_test").update(max_attempts=1)
+        with mock.patch("jobs.test_utils.fill_test_questions", side_effect=RuntimeError("groq down")), \
+                self.assertLogs("jobs.tasks", "WARNING"):
+            self.run_generation()
+        test = JobTest.objects.get(application=self.application)
+        self.assertEqual(test.generation_status, "failed")
+
+        # the candidate's next read queues one retry
+        for _ in range(2):
+            response = self.client.get(self.test_url)
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json()["generation_status"], "pending")
+        self.assertEqual(self.generation_tasks().count(), 1)
+
+        self.run_generation()
+        self.assertEqual(self.client.get(self.test_url).json()["generation_status"], "ready")
+
+    def test_missing_test_is_queued_on_read(self):
+        JobTest.objects.filter(application=self.application).delete()
+        BackgroundTask.objects.all().delete()
+        response = self.client.get(self.test_url)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.generation_tasks().count(), 1)
+
+
+class SubmitTestGradingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        job = Job.objects.create(company=company, title="Dev", description="python")
+        cls.candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=cls.candidate)
+        cls.application = Application.objects.create(job=job, candidate=profile)
+        cls.test = JobTest.objects.create(application=cls.application, generation_status="ready", total_marks=50)
+        cls.questions = JobTestQuestion.objects.bulk_create(
+            [
+                JobTestQuestion(
+                    test=cls.test, text=f"Q{i}", option_a="a", option_b="b",
+                    option_c="c", option_d="d", correct_option="A",
+                )
+                for i in range(25)
+            ]
+        )
+
+    def answers(self, option, count=25):
+        return [{"question_id": q.id, "selected_option": option} for q in self.questions[:count]]
+
+    def submit(self, answers):
+        client = APIClient()
+        client.force_authenticate(self.candidate)
+        return client.post(
+            f"/api/applications/{self.application.id}/submit-test/", {"answers": answers}, format="json"
+        )
+
+    def test_grades_in_one_batch(self):
+        # a repeated answer counts once, the last one wins
+        answers = self.answers("A", 20) + [{"question_id": self.questions[0].id, "selected_option": "C"}]
+        response = self.submit(answers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"score": 38, "total": 50, "passed": True, "application_status": "shortlisted"}
+        )
+        self.assertEqual(JobTestAnswer.objects.filter(application=self.application).count(), 20)
+
+    def test_double_submit_grades_once(self):
+        self.assertEqual(self.submit(self.answers("A")).status_code, 200)
+        response = self.submit(self.answers("B"))
+        self.assertEqual(response.status_code, 400)
+        self.test.refresh_from_db()
+        self.assertEqual(self.test.score, 50)
+        self.assertFalse(JobTestAnswer.objects.filter(selected_option="B").exists())
+
+    def test_concurrent_submit_loses_the_claim(self):
+        # both requests read completed_at=None before either one graded
+        stale = JobTest.objects.get(pk=self.test.pk)
+        self.assertIsNotNone(grade_submission(self.test, self.application, self.answers("A")))
+        self.assertIsNone(grade_submission(stale, self.application, self.answers("B")))
+        self.test.refresh_from_db()
+        self.assertEqual(self.test.score, 50)
+        self.assertFalse(JobTestAnswer.objects.filter(selected_option="B").exists())
+
+
+class ApplicationListQueryBudgetTests(TestCase):
+    """
+    Application listings must cost a constant number of queries, no matter
+    how many applications (with tests and questions) are on the page.
+    """
+
+    QUERY_BUDGET = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            username="recruiter", password="x", role="recruiter"
+        )
+        cls.company = Company.objects.create(user=cls.recruiter, name="Acme")
+        cls.job = Job.objects.create(
+            company=cls.company, title="Python Developer", description="python", skills="python"
+        )
+        cls.candidate_user = User.objects.create_user(
+            username="candidate", password="x", role="candidate"
+        )
+        cls.n = 0
+
+    def add_applications(self, count):
+        for _ in range(count):
+            type(self).n += 1
+            user = User.objects.create(username=f"applicant{self.n}", role="candidate")
+            profile = CandidateProfile.objects.create(user=user)
+            application = Application.objects.create(job=self.job, candidate=profile)
+            test = JobTest.objects.create(application=application, generation_status="ready")
+            JobTestQuestion.objects.bulk_create(
+                [
+                    JobTestQuestion(
+                        test=test, text=f"Q{i}", option_a="a", option_b="b",
+                        option_c="c", option_d="d", correct_option="A",
+                    )
+                    for i in range(25)
+                ]
+            )
+
+    def count_queries(self, user, url):
+        client = APIClient()
+        client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def assert_constant_queries(self, user, url):
+        self.add_applications(2)
+        small, _ = self.count_queries(user, url)
+        self.add_applications(10)
+        large, data = self.count_queries(user, url)
+
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, self.QUERY_BUDGET)
+        return data
+
+    def test_recruiter_applications(self):
+        data = self.assert_constant_queries(self.recruiter, "/api/recruiter/applications/")
+        first = data["results"][0]
+        self.assertEqual(first["job"]["company_name"], "Acme")
+        self.assertTrue(first["candidate_username"].startswith("applicant"))
+        self.assertEqual(first["test"]["generation_status"], "ready")
+        self.assertNotIn("questions", first["test"])
+
+    def test_job_applications(self):
+        data = self.assert_constant_queries(
+            self.recruiter, f"/api/jobs/{self.job.id}/applications/"
+        )
+        self.assertEqual(len(data), 12)
+        self.assertNotIn("questions", data[0]["test"])
+
+    def test_application_list(self):
+        data = self.assert_constant_queries(self.candidate_user, "/api/applications/")
+        self.assertEqual(data["results"][0]["job"]["company_name"], "Acme")
+        self.assertNotIn("questions", data["results"][0]["test"])
+
+
+class TestResultsQueryTests(TestCase):
+    def test_results_use_two_queries_for_questions_and_answers(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        job = Job.objects.create(company=company, title="Dev", description="python")
+        candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=candidate)
+        application = Application.objects.create(job=job, candidate=profile)
+        test = JobTest.objects.create(application=application, generation_status="ready")
+        questions = JobTestQuestion.objects.bulk_create(
+            [
+                JobTestQuestion(
+                    test=test, text=f"Q{i}", option_a="a", option_b="b",
+                    option_c="c", option_d="d", correct_option="A",
+                )
+                for i in range(25)
+            ]
+        )
+        JobTestAnswer.objects.bulk_create(
+            [
+                JobTestAnswer(question=q, application=application, selected_option="B")
+                for q in questions[:10]
+            ]
+        )
+
+        client = APIClient()
+        client.force_authenticate(recruiter)
+        # application (+ job, company, test) / questions / answers
+        with self.assertNumQueries(3):
+            response = client.get(f"/api/applications/{application.id}/test-results/")
+
+        self.assertEqual(response.status_code, 200)
+        answers = {q["id"]: q["candidate_answer"] for q in response.json()["questions"]}
+        self.assertEqual(len(answers), 25)
+        self.assertEqual(sum(1 for a in answers.values() if a == "B"), 10)
+        self.assertIsNone(answers[questions[-1].id])
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class SparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        cls.job = Job.objects.create(
+            company=company, title="Dev", description="Build   REST APIs\n" + "word " * 400, location="Paris"
+        )
+        cls.candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=cls.candidate)
+        cls.application = Application.objects.create(job=cls.job, candidate=profile)
+
+    def job_list(self, query=""):
+        with override_settings(FAST_JSON_RENDERING=False), CaptureQueriesContext(connection) as ctx:
+            response = APIClient().get(f"/api/jobs/{query}")
+        self.assertEqual(response.status_code, 200)
+        sql = next(q["sql"] for q in ctx.captured_queries if 'FROM "jobs_job"' in q["sql"])
+        return response.json()["results"][0], sql
+
+    def test_job_list_returns_cards(self):
+        card, sql = self.job_list()
+        self.assertEqual(list(card), JobCardSerializer.Meta.fields)
+        self.assertEqual(card["company_name"], "Acme")
+        self.assertTrue(card["description_excerpt"].startswith("Build REST APIs"))
+        self.assertLessEqual(len(card["description_excerpt"]), 200)
+        self.assertNotIn('"jobs_job"."description"', sql)
+
+    def test_job_list_fields_pick_from_the_full_job(self):
+        job, sql = self.job_list("?fields=title,description,company_name,nope")
+        self.assertEqual(set(job), {"title", "description", "company_name"})
+        self.assertIn('"jobs_job"."description"', sql)
+        self.assertNotIn('"jobs_job"."location"', sql)
+
+        job, sql = self.job_list("?fields=id,title")
+        self.assertEqual(job, {"id": self.job.id, "title": "Dev"})
+        self.assertNotIn('"accounts_company"', sql)
+
+    def test_nested_fields_and_omit(self):
+        client = APIClient()
+        client.force_authenticate(self.candidate)
+        response = client.get("/api/applications/?fields=id,status,job.title,job.company_name")
+        self.assertEqual(
+            response.json()["results"][0],
+            {"id": self.application.id, "status": "applied", "job": {"title": "Dev", "company_name": "Acme"}},
+        )
+        response = client.get("/api/applications/?omit=job,test")
+        self.assertNotIn("job", response.json()["results"][0])
+        self.assertIn("status", response.json()["results"][0])
+
+    def test_writes_ignore_sparse_params(self):
+        client = APIClient()
+        client.force_authenticate(self.job.company.user)
+        response = client.patch(f"/api/jobs/{self.job.id}/?fields=id", {"title": "Senior Dev"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("description", response.json())
+
+    def test_parse_field_paths(self):
+        self.assertEqual(
+            parse_field_paths("id, job.title,job.company_name,,test"),
+            {"id": {}, "job": {"title": {}, "company_name": {}}, "test": {}},
+        )
+        self.assertEqual(parse_field_paths("job.title,job"), {"job": {}})
+        self.assertEqual(parse_field_paths("job,job.title"), {"job": {}})
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class FastJobRenderingTests(TestCase):
+    """The .values() + orjson path must return the serializer's exact bytes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Zürich AG")
+        cls.job = Job.objects.create(
+            company=company,
+            title="Dev \u2028 line \u2029 para \U0001F600",
+            description="<b>python</b> \"quoted\" \\ backslash",
+            salary_min=Decimal("50000.50"),
+        )
+        Job.objects.create(company=company, title="Other", description="java")
+
+    def assert_same_bytes(self, url):
+        client = APIClient()
+        fast = client.get(url)
+        with override_settings(FAST_JSON_RENDERING=False):
+            slow = client.get(url)
+        self.assertEqual(fast.status_code, slow.status_code)
+        self.assertEqual(fast.content, slow.content)
+        return fast
+
+    def test_list(self):
+        response = self.assert_same_bytes("/api/jobs/")
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.assert_same_bytes("/api/jobs/?fields=id,title,salary_min,company_name")
+
+    def test_detail(self):
+        response = self.assert_same_bytes(f"/api/jobs/{self.job.id}/")
+        self.assertIn(b"\\u2028", response.content)
+        self.assert_same_bytes("/api/jobs/0/")
+        self.assert_same_bytes("/api/jobs/abc/")
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        cls.company = Company.objects.create(user=recruiter, name="Acme")
+        cls.job = Job.objects.create(company=cls.company, title="Dev", description="python")
+        cls.candidate = User.objects.create(username="candidate", role="candidate")
+        cls.profile = CandidateProfile.objects.create(user=cls.candidate)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.candidate)
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code
+
+    def test_job_list_and_detail(self):
+        for url in ("/api/jobs/", f"/api/jobs/{self.job.id}/"):
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertIn("Last-Modified", first)
+            # version lookup only: no job query, no serializer
+            with self.assertNumQueries(1):
+                self.assertEqual(self.revalidate(url, first["ETag"]), 304)
+
+        etag = self.client.get("/api/jobs/")["ETag"]
+        self.assertEqual(self.revalidate("/api/jobs/?search=python", etag), 200)
+        self.company.name = "Acme Inc"
+        self.company.save()
+        self.assertEqual(self.revalidate("/api/jobs/", etag), 200)
+
+    def test_job_alert_notifications(self):
+        url = "/api/alerts/notifications/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.revalidate(url, etag), 304)
+
+        alert = JobAlert.objects.create(candidate=self.profile, keywords="python")
+        job = Job.objects.create(company=self.company, title="Python Dev", description="python")
+        etag = self.client.get(url)["ETag"]
+        # bulk_create path, no post_save
+        job_alert_fanout(BackgroundTask.objects.create(name="job_alert_fanout"), job_id=job.id)
+        self.assertTrue(JobAlertNotification.objects.filter(alert=alert).exists())
+        self.assertEqual(self.revalidate(url, etag), 200)
+
+        # another candidate never gets this candidate's ETag validated
+        other = User.objects.create(username="other", role="candidate")
+        client = APIClient()
+        client.force_authenticate(other)
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_application_status_notifications(self):
+        url = "/api/alerts/application-status/"
+        application = Application.objects.create(job=self.job, candidate=self.profile)
+        etag = self.client.get(url)["ETag"]
+        ApplicationStatusNotification.objects.create(
+            application=application, status="shortlisted", message=""
+        )
+        self.assertEqual(self.revalidate(url, etag), 200)
+
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.revalidate(url, etag), 304)
+        self.job.delete()  # cascades to the notification
+        self.assertEqual(self.revalidate(url, etag), 200)
+
+
+class AnonymousResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        cls.company = Company.objects.create(user=recruiter, name="Acme")
+        cls.job = Job.objects.create(company=cls.company, title="Dev", description="python")
+
+    def setUp(self):
+        response_cache.clear()
+        self.client = APIClient()
+
+    def test_hits_after_first_request(self):
+        url = f"/api/jobs/{self.job.id}/"
+        self.assertEqual(self.client.get(url)["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_normalized_params_share_an_entry(self):
+        self.client.get("/api/jobs/?search=Python")
+        response = self.client.get("/api/jobs/?search=%20python%20&_=123")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_folded_skills_match_is_case_insensitive(self):
+        Job.objects.create(company=self.company, title="Web", description="x", skills="react")
+        self.assertEqual(len(self.client.get("/api/jobs/?skills=python,react&skills_match=ANY").json()["results"]), 1)
+        response = self.client.get("/api/jobs/?skills=python,react&skills_match=any")
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(len(response.json()["results"]), 1)
+        response_cache.clear()
+        self.assertEqual(len(self.client.get("/api/jobs/?skills=python,react&skills_match=any").json()["results"]), 1)
+        self.assertEqual(len(self.client.get("/api/jobs/?skills=python,react").json()["results"]), 0)
+
+    def test_job_and_company_saves_invalidate(self):
+        url = f"/api/jobs/{self.job.id}/"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(url)
+            self.client.get("/api/jobs/")
+            self.job.title = "Senior Dev"
+            self.job.save()
+        self.assertEqual(self.client.get(url).json()["title"], "Senior Dev")
+        self.assertEqual(self.client.get("/api/jobs/")["X-Cache"], "MISS")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company.name = "Acme Inc"
+            self.company.save()
+        self.assertEqual(self.client.get(url).json()["company_name"], "Acme Inc")
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        self.client.get("/api/jobs/")
+        lookups = response_cache.stats()
+        self.client.force_authenticate(User.objects.create(username="candidate", role="candidate"))
+        response = self.client.get("/api/jobs/")
+        self.assertNotIn("X-Cache", response)
+        self.assertEqual(response_cache.stats(), lookups)
+
+
+class RecruiterAnalyticsRollupTests(TestCase):
+    def test_rollups_follow_creates_status_changes_and_deletes(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        jobs = [
+            Job.objects.create(company=company, title=f"Job {i}", description="x", is_active=i == 0)
+            for i in range(2)
+        ]
+        applications = []
+        for i in range(6):
+            user = User.objects.create(username=f"applicant{i}", role="candidate")
+            profile = CandidateProfile.objects.create(user=user)
+            applications.append(Application.objects.create(job=jobs[i % 2], candidate=profile))
+        # one old application, outside today / the last 7 days
+        Application.objects.filter(pk=applications[5].pk).update(
+            applied_at=timezone.now() - timedelta(days=30)
+        )
+        analytics_utils.rebuild()
+
+        applications[0].status = "shortlisted"
+        applications[0].save()
+        applications[1].status = "rejected"
+        applications[1].save(update_fields=["status"])
+        applications[2].delete()
+
+        client = APIClient()
+        client.force_authenticate(recruiter)
+        with self.assertNumQueries(2):
+            data = client.get("/api/recruiter/analytics/").json()
+
+        self.assertEqual(data["total_jobs"], 2)
+        self.assertEqual(data["active_jobs"], 1)
+        self.assertEqual(data["total_applications"], 5)
+        self.assertEqual(data["applications_today"], 4)
+        self.assertEqual(data["applications_last_7_days"], 4)
+        self.assertEqual(
+            data["applications_by_status"], {"applied": 3, "shortlisted": 1, "rejected": 1}
+        )
+        self.assertEqual(
+            [(row["job_title"], row["applications_count"]) for row in data["applications_per_job"]],
+            [("Job 1", 3), ("Job 0", 2)],
+        )
+
+        # incremental updates agree with a full recount
+        def rollups():
+            return (
+                sorted(ApplicationDailyRollup.objects.filter(count__gt=0).values_list(
+                    "job_id", "day", "status", "count"
+                )),
+                sorted(ApplicationPeriodRollup.objects.filter(count__gt=0).values_list(
+                    "job_id", "interval", "period_start", "status", "count"
+                )),
+            )
+
+        before = rollups()
+        analytics_utils.rebuild()
+        self.assertEqual(before, rollups())
+
+    def test_series(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        jobs = [
+            Job.objects.create(company=company, title=f"Job {i}", description="x") for i in range(2)
+        ]
+        today = timezone.localdate()
+        for i, days_ago in enumerate([0, 0, 1, 40]):
+            user = User.objects.create(username=f"applicant{i}", role="candidate")
+            profile = CandidateProfile.objects.create(user=user)
+            application = Application.objects.create(
+                job=jobs[i % 2], candidate=profile, status="rejected" if i == 1 else "applied"
+            )
+            Application.objects.filter(pk=application.pk).update(
+                applied_at=timezone.now() - timedelta(days=days_ago)
+            )
+        analytics_utils.rebuild()
+
+        client = APIClient()
+        client.force_authenticate(recruiter)
+        url = "/api/recruiter/analytics/series/"
+
+        data = client.get(url, {"start": today - timedelta(days=1), "end": today}).json()
+        self.assertEqual(data["interval"], "day")
+        self.assertEqual(data["buckets"], [str(today - timedelta(days=1)), str(today)])
+        self.assertEqual(data["total"], [1, 2])
+        self.assertEqual(data["by_status"], {"applied": [1, 1], "rejected": [0, 1]})
+        self.assertEqual(
+            [(job["job_title"], job["counts"]) for job in data["by_job"]],
+            [("Job 0", [1, 1]), ("Job 1", [0, 1])],
+        )
+
+        for interval in ("week", "month"):
+            data = client.get(url, {"interval": interval, "start": today - timedelta(days=60)}).json()
+            expected = {}
+            for days_ago in [0, 0, 1, 40]:
+                bucket = str(analytics_utils.bucket_start(today - timedelta(days=days_ago), interval))
+                expected[bucket] = expected.get(bucket, 0) + 1
+            counts = dict(zip(data["buckets"], data["total"]))
+            self.assertEqual({b: n for b, n in counts.items() if n}, expected)
+            self.assertEqual(data["buckets"][-1], str(analytics_utils.bucket_start(today, interval)))
+
+        data = client.get(url, {"interval": "month", "job": jobs[1].id, "status": "rejected"}).json()
+        self.assertEqual(sum(data["total"]), 1)
+        self.assertEqual(client.get(url, {"interval": "year"}).status_code, 400)
+
+
+class UnreadNotificationCounterTests(TestCase):
+    def test_counters_follow_creates_reads_and_deletes(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=candidate)
+        JobAlert.objects.create(candidate=profile, keywords="python")
+        client = APIClient()
+        client.force_authenticate(candidate)
+
+        def counts():
+            with self.assertNumQueries(1):
+                return client.get("/api/alerts/unread-count/").json()
+
+        self.assertEqual(counts(), {"job_alerts": 0, "application_status": 0, "total": 0})
+
+        jobs = [
+            Job.objects.create(company=company, title=f"Python Dev {i}", description="python")
+            for i in range(2)
+        ]
+        for job in jobs:
+            task = BackgroundTask.objects.create(name="job_alert_fanout")
+            job_alert_fanout(task, job_id=job.id)
+            job_alert_fanout(task, job_id=job.id)  # retried: no double count
+        application = Application.objects.create(job=jobs[0], candidate=profile)
+        ApplicationStatusNotification.objects.create(
+            application=application, status="shortlisted", message=""
+        )
+        self.assertEqual(counts(), {"job_alerts": 2, "application_status": 1, "total": 3})
+
+        notification = JobAlertNotification.objects.get(job=jobs[1])
+        for _ in range(2):
+            client.patch(f"/api/alerts/notifications/{notification.id}/read/")
+        self.assertEqual(counts()["job_alerts"], 1)
+
+        jobs[0].delete()  # cascades to its alert notification, application, status update
+        self.assertEqual(counts(), {"job_alerts": 0, "application_status": 0, "total": 0})
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        # no poller thread: events are published by hand
+        old_interval, events.broker.poll_interval = events.broker.poll_interval, 0
+        self.addCleanup(setattr, events.broker, "poll_interval", old_interval)
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        self.candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=self.candidate)
+        job = Job.objects.create(company=company, title="Python Dev", description="python")
+        self.application = Application.objects.create(job=job, candidate=profile)
+        self.recruiter = recruiter
+
+    def test_requires_candidate_token(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        self.assertEqual(self.client.get("/api/alerts/stream/").status_code, 401)
+        self.assertEqual(self.client.get("/api/alerts/stream/?token=junk").status_code, 401)
+        token = AccessToken.for_user(self.recruiter)
+        self.assertEqual(self.client.get(f"/api/alerts/stream/?token={token}").status_code, 403)
+
+    async def test_replays_missed_notifications_then_follows_broker(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        create = sync_to_async(ApplicationStatusNotification.objects.create)
+        first = await create(application=self.application, status="shortlisted", message="")
+        second = await create(application=self.application, status="rejected", message="")
+        token = await sync_to_async(AccessToken.for_user)(self.candidate)
+
+        response = await self.async_client.get(
+            f"/api/alerts/stream/?token={token}", headers={"Last-Event-ID": "0-0"}
+        )
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunks = aiter(response.streaming_content)
+        messages = []
+        while not messages or "event: ready" not in messages[-1]:
+            messages.append((await anext(chunks)).decode())
+
+        self.assertTrue(messages[0].startswith("retry:"))
+        replayed = messages[1:-1]
+        self.assertEqual(len(replayed), 2)
+        self.assertIn(f"id: 0-{first.pk}\n", replayed[0])
+        self.assertIn(f"id: 0-{second.pk}\n", replayed[1])
+        self.assertIn('"total":2', messages[-1])
+        self.assertEqual(events.broker.connections(), 1)
+
+        # what the poller would publish: duplicates of replayed rows are dropped
+        replay = sync_to_async(events.replay)
+        third = await create(application=self.application, status="hired", message="")
+        for event in await replay(self.candidate.pk, {"job_alert": 0, "application_status": 0}):
+            events.broker.publish(self.candidate.pk, event)
+        self.assertIn(f"id: 0-{third.pk}\n", (await anext(chunks)).decode())
+        # client goes away while the stream waits: ASGI cancels the read
+        reader = asyncio.ensure_future(anext(chunks))
+        await asyncio.sleep(0)
+        reader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await reader
+        self.assertEqual(events.broker.connections(), 0)
+
+    async def test_slow_client_overflow_ends_stream(self):
+        subscription = events.broker.subscribe(self.candidate.pk)
+        try:
+            for i in range(events.QUEUE_SIZE + 5):
+                subscription.offer({"kind": "job_alert", "id": i})
+            self.assertTrue(subscription.overflowed)
+            self.assertEqual(subscription.queue.qsize(), events.QUEUE_SIZE)
+            items = [subscription.queue.get_nowait() for _ in range(events.QUEUE_SIZE)]
+            self.assertIs(items[-1], events.OVERFLOW)
+        finally:
+            events.broker.unsubscribe(subscription)
+
+    async def test_poller_starts_from_the_cursor_new_streams_start_from(self):
+        create = sync_to_async(ApplicationStatusNotification.objects.create)
+        before = await create(application=self.application, status="shortlisted", message="")
+        broker = events.Broker(poll_interval=60)
+
+        with mock.patch.object(events.threading, "Thread") as thread:
+            subscription = await sync_to_async(broker.subscribe)(self.candidate.pk, asyncio.get_running_loop())
+        # read synchronously in subscribe(), not later in the thread
+        (start,) = thread.call_args.kwargs["args"]
+        self.assertEqual(start, {"job_alert": 0, "application_status": before.pk})
+        self.assertEqual(broker.published_cursor(), start)
+
+        # committed after subscribe, before the first poll: published once
+        after = await create(application=self.application, status="rejected", message="")
+        await sync_to_async(broker.poll_once)(start, {self.candidate.pk})
+        await asyncio.sleep(0)
+        self.assertEqual(subscription.queue.get_nowait()["id"], after.pk)
+        self.assertEqual(broker.published_cursor(), {"job_alert": 0, "application_status": after.pk})
+
+        # the poller exits with its last subscriber and forgets its cursor
+        broker.unsubscribe(subscription)
+        await sync_to_async(broker._poll)(start)
+        self.assertIsNone(broker.published_cursor())
+
+
+class NotificationInboxTests(TestCase):
+    def setUp(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        self.candidate = User.objects.create(username="candidate", role="candidate")
+        profile = CandidateProfile.objects.create(user=self.candidate)
+        other = CandidateProfile.objects.create(
+            user=User.objects.create(username="other", role="candidate")
+        )
+        alert = JobAlert.objects.create(candidate=profile, keywords="python")
+        other_alert = JobAlert.objects.create(candidate=other, keywords="python")
+
+        # interleaved in time, with a tie between the two tables
+        base = timezone.now()
+        self.expected = []
+        for i in range(6):
+            job = Job.objects.create(company=company, title=f"Job {i}", description="python")
+            application = Application.objects.create(job=job, candidate=profile)
+            n = JobAlertNotification.objects.create(candidate=profile, job=job, alert=alert)
+            s = ApplicationStatusNotification.objects.create(
+                application=application, status="shortlisted", message=""
+            )
+            JobAlertNotification.objects.create(candidate=other, job=job, alert=other_alert)
+            JobAlertNotification.objects.filter(pk=n.pk).update(created_at=base + timedelta(minutes=2 * i))
+            minutes = 2 * i if i == 3 else 2 * i + 1
+            ApplicationStatusNotification.objects.filter(pk=s.pk).update(created_at=base + timedelta(minutes=minutes))
+            self.expected += [("job_alert", n.pk, 2 * i, 0), ("application_status", s.pk, minutes, 1)]
+        self.expected.sort(key=lambda e: (e[2], e[3], e[1]), reverse=True)
+        notification_counters.recount()
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.candidate)
+
+    def pages(self, url):
+        items = []
+        while url:
+            # versions + positions from each table (archive included) + loading the
+            # winners of each table; archived rows cost one query more
+            with CaptureQueriesContext(connection) as queries:
+                data = self.client.get(url).json()
+            self.assertLessEqual(len(queries), 7)
+            items += [(item["kind"], item["id"]) for item in data["results"]]
+            url = data["next"]
+        return items
+
+    def test_merges_both_tables_newest_first(self):
+        with self.assertNumQueries(6):
+            self.client.get("/api/alerts/inbox/")
+        self.assertEqual(
+            self.pages("/api/alerts/inbox/?page_size=5"),
+            [(kind, pk) for kind, pk, _, _ in self.expected],
+        )
+        first = self.client.get("/api/alerts/inbox/?page_size=1").json()["results"][0]
+        self.assertEqual(first["job_title"], "Job 5")
+        self.assertEqual(self.client.get("/api/alerts/inbox/?cursor=junk").status_code, 404)
+        self.assertEqual(self.client.get("/api/alerts/inbox/?kind=email").status_code, 400)
+        only_alerts = self.client.get("/api/alerts/inbox/?kind=job_alert&page_size=50").json()
+        self.assertEqual({item["kind"] for item in only_alerts["results"]}, {"job_alert"})
+        self.assertEqual(len(only_alerts["results"]), 6)
+
+    def test_bulk_mark_read(self):
+        first, second = self.expected[0], self.expected[1]
+        response = self.client.post(
+            "/api/alerts/inbox/read/",
+            {"items": [{"kind": first[0], "id": first[1]}, {"kind": second[0], "id": second[1]}]},
+            format="json",
+        )
+        self.assertEqual(response.json()["marked"], 2)
+        self.assertEqual(response.json()["unread"]["total"], 10)
+
+        # the tie: the status update at minute 6 sorts before the job alert at minute 6
+        tied = next(e for e in self.expected if e[0] == "application_status" and e[2] == 6)
+        response = self.client.post(
+            "/api/alerts/inbox/read/", {"up_to": {"kind": tied[0], "id": tied[1]}}, format="json"
+        )
+        older = self.expected[self.expected.index(tied):]
+        self.assertEqual(response.json()["marked"], len(older))
+        unread = self.pages("/api/alerts/inbox/?unread=1&page_size=50")
+        self.assertEqual(unread, [(kind, pk) for kind, pk, _, _ in self.expected[2:self.expected.index(tied)]])
+        self.assertEqual(notification_counters.unread_counts(self.candidate.id)["total"], len(unread))
+
+        # other users' notifications are out of reach
+        foreign = JobAlertNotification.objects.exclude(candidate__user=self.candidate).first()
+        response = self.client.post(
+            "/api/alerts/inbox/read/", {"up_to": {"kind": "job_alert", "id": foreign.pk}}, format="json"
+        )
+        self.assertEqual(response.status_code, 404)
+        response = self.client.post(
+            "/api/alerts/inbox/read/", {"items": [{"kind": "job_alert", "id": foreign.pk}]}, format="json"
+        )
+        self.assertEqual(response.json()["marked"], 0)
+        self.assertFalse(JobAlertNotification.objects.get(pk=foreign.pk).is_read)
+        self.assertEqual(self.client.post("/api/alerts/inbox/read/", {}, format="json").status_code, 400)
+
+    def test_archived_notifications_stay_in_the_inbox(self):
+        alerts = JobAlertNotification.objects.filter(candidate__user=self.candidate).order_by("created_at")
+        old = timezone.now() - timedelta(days=retention.MAX_AGE_DAYS + 1)
+        # oldest two: read and past READ_RETENTION_DAYS; third: unread but past MAX_AGE_DAYS;
+        # fourth: read but recent
+        read_old, read_old_2, unread_ancient, read_recent = [n.pk for n in alerts[:4]]
+        JobAlertNotification.objects.filter(pk__in=[read_old, read_old_2, read_recent]).update(is_read=True)
+        JobAlertNotification.objects.filter(pk__in=[read_old, read_old_2, unread_ancient]).update(
+            created_at=old
+        )
+        notification_counters.recount()
+        before = self.pages("/api/alerts/inbox/?page_size=5")
+        unread_before = notification_counters.unread_counts(self.candidate.id)["job_alerts"]
+
+        out = StringIO()
+        call_command("archive_notifications", "--batch-size=2", stdout=out)
+        self.assertIn("Archived 3 notifications.", out.getvalue())
+        self.assertEqual(retention.archive(), 0)
+        self.assertEqual(
+            set(ArchivedJobAlertNotification.objects.values_list("pk", flat=True)),
+            {read_old, read_old_2, unread_ancient},
+        )
+        self.assertFalse(JobAlertNotification.objects.filter(pk__in=[read_old, unread_ancient]).exists())
+        self.assertEqual(
+            notification_counters.unread_counts(self.candidate.id)["job_alerts"], unread_before - 1
+        )
+
+        # same feed, same order; archived ones are read
+        self.assertEqual(self.pages("/api/alerts/inbox/?page_size=5"), before)
+        results = self.client.get("/api/alerts/inbox/?kind=job_alert&page_size=50").json()["results"]
+        archived = [item for item in results if item["id"] in (read_old, unread_ancient)]
+        self.assertEqual([item["is_read"] for item in archived], [True, True])
+        self.assertEqual(archived[-1]["job_title"], "Job 0")
+        unread = self.client.get("/api/alerts/inbox/?unread=1&page_size=50").json()["results"]
+        self.assertNotIn(unread_ancient, [item["id"] for item in unread if item["kind"] == "job_alert"])
+
+        # an archived notification is a valid up_to
+        response = self.client.post(
+            "/api/alerts/inbox/read/", {"up_to": {"kind": "job_alert", "id": read_old_2}}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class RefusingEmailBackend(LocMemEmailBackend):
+    """locmem backend whose server rejects some recipients."""
+    refused = {"bounce@example.com"}
+
+    def send_messages(self, messages):
+        for message in messages:
+            if set(message.to) & self.refused:
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b"No such user")})
+        return super().send_messages(messages)
+
+
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter", email="r@example.com")
+        company = Company.objects.create(user=recruiter, name="Acme")
+        self.job = Job.objects.create(company=company, title="Python Dev", description="python")
+        self.candidate = User.objects.create(username="candidate", role="candidate", email="c@example.com")
+        CandidateProfile.objects.create(user=self.candidate)
+        self.recruiter = recruiter
+
+    def test_status_emails_are_queued_then_sent_in_batches(self):
+        client = APIClient()
+        client.force_authenticate(self.candidate)
+        self.assertEqual(client.post(f"/api/jobs/{self.job.id}/apply/", {}).status_code, 201)
+        application = Application.objects.get()
+
+        client.force_authenticate(self.recruiter)
+        response = client.patch(f"/api/applications/{application.id}/", {"status": "shortlisted"})
+        self.assertEqual(response.status_code, 200)
+
+        # nothing sent during the requests
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(list(EmailOutbox.objects.values_list("to", "status")), [("c@example.com", "pending")] * 2)
+        self.assertEqual(ApplicationStatusNotification.objects.count(), 2)
+
+        result = outbox.drain("test", batch_size=10)
+        self.assertEqual((result["sent"], result["batches"]), (2, 1))
+        self.assertEqual(
+            [m.subject for m in mail.outbox], ["Update on your application for Python Dev"] * 2
+        )
+        self.assertIn("Status: Shortlisted.", mail.outbox[1].body)
+        self.assertFalse(EmailOutbox.objects.exclude(status="sent").exists())
+        self.assertEqual(outbox.drain("test")["batches"], 0)
+
+    def test_failures_retry_with_backoff_then_dead_letter(self):
+        outbox.enqueue_many([
+            ("a@example.com", "A", "a"),
+            ("bounce@example.com", "B", "b"),
+            ("c@example.com", "C", "c"),
+        ])
+        backend = RefusingEmailBackend()
+        with self.assertLogs("jobs.outbox", "WARNING"):
+            result = outbox.drain("test", connection=backend)
+        self.assertEqual((result["sent"], result["retried"], result["dead"]), (2, 1, 0))
+        self.assertEqual([m.to for m in mail.outbox], [["a@example.com"], ["c@example.com"]])
+
+        bounced = EmailOutbox.objects.get(to="bounce@example.com")
+        self.assertEqual((bounced.status, bounced.attempts), ("pending", 1))
+        self.assertIn("SMTPRecipientsRefused", bounced.last_error)
+        self.assertGreater(bounced.send_after, timezone.now())
+        self.assertEqual(outbox.drain("test", connection=backend)["batches"], 0)  # not due yet
+
+        for attempt in range(2, outbox.MAX_ATTEMPTS + 1):
+            EmailOutbox.objects.filter(pk=bounced.pk).update(send_after=timezone.now())
+            with self.assertLogs("jobs.outbox", "WARNING"):
+                outbox.drain("test", connection=backend)
+        bounced.refresh_from_db()
+        self.assertEqual((bounced.status, bounced.attempts), ("dead", outbox.MAX_ATTEMPTS))
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(outbox.stats()["queue"], {"pending": 0, "sending": 0, "sent": 2, "dead": 1})
+
+        # a sender that died mid-batch: its claim expires and the email is sent again
+        email = outbox.enqueue("d@example.com", "D", "d")
+        self.assertEqual(len(outbox.claim_batch("crashed")), 1)
+        self.assertEqual(outbox.claim_batch("other"), [])
+        EmailOutbox.objects.filter(pk=email.pk).update(locked_at=timezone.now() - outbox.LOCK_TIMEOUT * 2)
+        self.assertEqual(outbox.drain("other", connection=backend)["sent"], 1)
+
+
+class NotificationDigestTests(TestCase):
+    def setUp(self):
+        recruiter = User.objects.create(username="recruiter", role="recruiter")
+        self.company = Company.objects.create(user=recruiter, name="Acme")
+        self.candidate = User.objects.create(username="candidate", role="candidate", email="c@example.com")
+        self.profile = CandidateProfile.objects.create(user=self.candidate)
+        JobAlert.objects.create(candidate=self.profile, keywords="python")
+        self.other = CandidateProfile.objects.create(
+            user=User.objects.create(username="other", role="candidate", email="o@example.com")
+        )
+
+        client = APIClient()
+        client.force_authenticate(self.candidate)
+        response = client.patch("/api/candidate/profile/", {"email_frequency": "daily"})
+        self.assertEqual(response.json()["email_frequency"], "daily")
+        self.profile.refresh_from_db()
+        self.assertIsNotNone(self.profile.digest_sent_at)
+
+    def test_one_digest_instead_of_many_emails(self):
+        jobs = []
+        for i in range(25):
+            job = Job.objects.create(company=self.company, title=f"Python Dev {i}", description="python")
+            job_alert_fanout(BackgroundTask.objects.create(name="job_alert_fanout"), job_id=job.id)
+            jobs.append(job)
+        application = Application.objects.create(job=jobs[0], candidate=self.profile)
+        for status in ("shortlisted", "selected"):
+            application.status = status
+            application.save()
+            send_application_status_email(application)
+        other_app = Application.objects.create(job=jobs[1], candidate=self.other)
+        send_application_status_email(other_app)
+
+        # only the immediate subscriber got an email right away
+        self.assertEqual(list(EmailOutbox.objects.values_list("to", flat=True)), ["o@example.com"])
+        self.assertEqual(ApplicationStatusNotification.objects.filter(application=application).count(), 2)
+        JobAlertNotification.objects.filter(job=jobs[24]).update(is_read=True)  # seen in the app already
+
+        # not due yet
+        self.assertEqual(digests.send_digests("daily")["emails"], 0)
+
+        later = timezone.now() + timedelta(days=1)
+        # lock, 2 notification reads, INSERT, stamp (+ the chunk's savepoint in tests)
+        with self.assertNumQueries(7):
+            totals = digests.send_digests("daily", now=later)
+        self.assertEqual(totals, {"candidates": 1, "emails": 1, "notifications": 25})
+        digest = EmailOutbox.objects.get(to="c@example.com")
+        self.assertEqual(
+            digest.subject,
+            "Your daily JobPortal digest: 1 application update, 24 new jobs for your alerts",
+        )
+        self.assertIn("Python Dev 0 at Acme: Selected", digest.body)
+        self.assertNotIn("Shortlisted", digest.body)
+        self.assertIn("... and 4 more.", digest.body)
+
+        # stamped: the next run has nothing to send
+        self.assertEqual(digests.send_digests("daily", now=later)["emails"], 0)
+        out = StringIO()
+        call_command("send_digests", stdout=out)
+        self.assertIn("daily: 0 digests", out.getvalue())
+
+
+class BulkApplicationStatusTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create(username="recruiter", role="recruiter")
+        company = Company.objects.create(user=self.recruiter, name="Acme")
+        self.jobs = [
+            Job.objects.create(company=company, title=f"Job {i}", description="x") for i in range(2)
+        ]
+        other = User.objects.create(username="other", role="recruiter")
+        other_job = Job.objects.create(
+            company=Company.objects.create(user=other, name="Other"), title="Other", description="x"
+        )
+
+        self.applications = []
+        for i, frequency in enumerate(["immediate", "immediate", "daily", "immediate", "immediate"]):
+            user = User.objects.create(
+                username=f"applicant{i}", role="candidate", email=f"a{i}@example.com" if i != 3 else ""
+            )
+            profile = CandidateProfile.objects.create(user=user, email_frequency=frequency)
+            self.applications.append(Application.objects.create(job=self.jobs[i % 2], candidate=profile))
+        Application.objects.filter(pk=self.applications[0].pk).update(
+            applied_at=timezone.now() - timedelta(days=40)
+        )
+        self.foreign = Application.objects.create(job=other_job, candidate=profile)
+        analytics_utils.rebuild()
+        conditional.bump(ApplicationStatusNotification)  # version row exists, as in production
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def rollups(self):
+        return (
+            sorted(ApplicationDailyRollup.objects.filter(count__gt=0).values_list(
+                "job_id", "day", "status", "count"
+            )),
+            sorted(ApplicationPeriodRollup.objects.filter(count__gt=0).values_list(
+                "job_id", "interval", "period_start", "status", "count"
+            )),
+        )
+
+    def test_ids_move_owned_applications_in_a_fixed_number_of_queries(self):
+        Application.objects.filter(pk=self.applications[4].pk).update(status="shortlisted")
+        analytics_utils.rebuild()
+        ids = [application.pk for application in self.applications] + [self.foreign.pk]
+
+        with self.assertNumQueries(14):
+            response = self.client.post(
+                "/api/applications/bulk-status/", {"status": "shortlisted", "ids": ids}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        moved = [application.pk for application in self.applications[:4]]
+        self.assertEqual(response.json(), {"status": "shortlisted", "updated": 4, "ids": moved, "more": False})
+
+        # other recruiters' applications are untouched
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, "applied")
+        self.assertEqual(
+            set(Application.objects.filter(status="shortlisted").values_list("pk", flat=True)),
+            set(moved) | {self.applications[4].pk},
+        )
+
+        # what a PATCH per application does: notifications (not without an
+        # email address), emails for immediate subscribers, counters, rollups
+        self.assertEqual(
+            sorted(ApplicationStatusNotification.objects.values_list("application_id", flat=True)),
+            [self.applications[i].pk for i in (0, 1, 2)],
+        )
+        self.assertEqual(
+            sorted(EmailOutbox.objects.values_list("to", flat=True)), ["a0@example.com", "a1@example.com"]
+        )
+        self.assertEqual(
+            notification_counters.unread_counts(self.applications[2].candidate.user_id)["application_status"], 1
+        )
+        before = self.rollups()
+        analytics_utils.rebuild()
+        self.assertEqual(before, self.rollups())
+
+        # a repeat moves nothing
+        response = self.client.post(
+            "/api/applications/bulk-status/", {"status": "shortlisted", "ids": ids}, format="json"
+        )
+        self.assertEqual(response.json()["updated"], 0)
+        self.assertEqual(ApplicationStatusNotification.objects.count(), 3)
+
+    def test_filter_in_rounds(self):
+        url = "/api/applications/bulk-status/"
+        body = {"status": "rejected", "filter": {"job": [self.jobs[0].pk], "status": ["applied"]}}
+        response = self.client.post(url, body, format="json")
+        self.assertEqual(response.json()["ids"], [self.applications[i].pk for i in (0, 2, 4)])
+
+        queryset = bulk_status.matching(self.recruiter, statuses=["rejected", "applied"])
+        self.assertEqual(bulk_status.change_status(queryset, "selected", limit=3)[1], True)
+        ids, more = bulk_status.change_status(queryset, "selected", limit=3)
+        self.assertEqual((len(ids), more), (2, False))
+        before = self.rollups()
+        analytics_utils.rebuild()
+        self.assertEqual(before, self.rollups())
+
+    def test_validation_and_permissions(self):
+        url = "/api/applications/bulk-status/"
+        for body in (
+            {"status": "shortlisted"},
+            {"status": "shortlisted", "ids": [1], "filter": {}},
+            {"status": "hired", "ids": [1]},
+        ):
+            self.assertEqual(self.client.post(url, body, format="json").status_code, 400)
+
+        self.client.force_authenticate(self.applications[0].candidate.user)
+        response = self.client.post(url, {"status": "selected", "ids": [self.applications[0].pk]}, format="json")
+        self.assertEqual(response.status_code, 403)
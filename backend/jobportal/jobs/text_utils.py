@@ -0,0 +1,68 @@
+# jobportal/jobs/text_utils.py
+
+import re
+
+# Comma / newline / semicolon separated lists, e.g. "React, Django\nREST API"
+_LIST_SPLIT_RE = re.compile(r"[,\n;]")
+
+# Words keep the characters that matter in tech terms: c++, c#, node.js
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text):
+    """
+    Lowercase word tokens of `text`.
+        "Senior Node.js / C++ dev." -> ["senior", "node.js", "c++", "dev"]
+    """
+    return [tok.rstrip(".") for tok in _TOKEN_RE.findall((text or "").lower())]
+
+
+def normalize_term(text):
+    """
+    Canonical form of a skill / keyword: its tokens joined by one space.
+        "  REST   API " -> "rest api"
+    """
+    return " ".join(tokenize(text))
+
+
+def split_terms(text):
+    """
+    Split a free-text comma list into unique normalized terms, keeping
+    the original order.
+        "React, django,\nREACT , REST  API" -> ["react", "django", "rest api"]
+    """
+    terms = []
+    seen = set()
+    for part in _LIST_SPLIT_RE.split(text or ""):
+        term = normalize_term(part)
+        if term and term not in seen:
+            seen.add(term)
+            terms.append(term)
+    return terms
+
+
+def ngrams(tokens, max_n):
+    """
+    Every phrase of 1..max_n consecutive tokens, in order (with repeats).
+        ["rest", "api", "dev"], 2 -> rest, rest api, api, api dev, dev
+    """
+    for i in range(len(tokens)):
+        for n in range(1, max_n + 1):
+            if i + n > len(tokens):
+                break
+            yield " ".join(tokens[i : i + n])
+
+
+def excerpt(text, length):
+    """
+    Plain one-line preview of `text`, at most `length` characters, cut at a
+    word boundary.
+        "Build   REST APIs\nin Django", 12 -> "Build REST…"
+    """
+    text = " ".join((text or "").split())
+    if len(text) <= length:
+        return text
+    cut = text[: length - 1]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
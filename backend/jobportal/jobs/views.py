@@ -1,20 +1,31 @@
+import logging
+
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.utils.urls import replace_query_param
 
 from accounts.models import Company, CandidateProfile
 
-import re
-from django.db.models import Q, Count
-from django.http import FileResponse, Http404
-
-from datetime import timedelta
-from django.utils import timezone
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
 
 from .email_utils import send_application_status_email
-from .test_utils import create_test_for_application
+from .search_utils import apply_search
+from .pagination import KeysetPagination
+from .fast_render import FastReadMixin
+from .conditional import ConditionalGetMixin
+from .response_cache import AnonymousResponseCacheMixin
+from .skill_utils import filter_jobs_by_skills, candidate_skill_names
+from .tasks import enqueue, queue_test_generation, retry_test_generation
+from .test_utils import grade_submission
+from .analytics_utils import recruiter_summary, application_series
+from .recommendation_utils import recommend_job_ids, DEFAULT_TOP_K, MAX_TOP_K
+from . import bulk_status, events, inbox, notification_counters, outbox, question_bank, recommendation_cache, response_cache
 
 from .models import (
     Job,
@@ -31,6 +42,11 @@ from .models import (
 from .serializers import (
     JobSerializer,
     ApplicationSerializer,
+    ApplicationListSerializer,
+    APPLICATION_LIST_RELATED,
+    JobCardSerializer,
+    JOB_CARD_ONLY,
+    parse_field_paths,
     SavedJobSerializer,
     JobAlertSerializer,
     JobAlertNotificationSerializer,
@@ -39,8 +55,13 @@ from .serializers import (
     JobTestAnswerInputSerializer,
     JobTestResultSerializer,
     ApplicationStatusNotificationSerializer,  # 🔹 NEW
+    AnalyticsSeriesQuerySerializer,
+    InboxReadSerializer,
+    BulkStatusSerializer,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class IsRecruiter(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -60,10 +81,21 @@ class IsCandidate(permissions.BasePermission):
         )
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(
+    AnonymousResponseCacheMixin, ConditionalGetMixin, FastReadMixin, viewsets.ModelViewSet
+):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+    # 🔹 ETag / 304 on list + retrieve (company name is bumped as Job too)
+    conditional_models = (Job,)
+
+    def get_serializer_class(self):
+        # list: compact cards, unless ?fields= picks from the full job
+        if self.action == "list" and not self.request.query_params.get("fields"):
+            return JobCardSerializer
+        return JobSerializer
 
     def get_permissions(self):
         if self.action in [
@@ -88,7 +120,7 @@ class JobViewSet(viewsets.ModelViewSet):
           all jobs owned by that recruiter (active + inactive)
         """
         user = self.request.user
-        base_qs = Job.objects.all().order_by("-created_at")
+        base_qs = Job.objects.all().order_by("-created_at", "-id")
 
         # 🔹 For recruiter-only actions: see ALL their jobs (active + inactive)
         if self.action in [
@@ -103,22 +135,26 @@ class JobViewSet(viewsets.ModelViewSet):
             return Job.objects.none()
 
         # 🔹 Default: public – only active jobs
-        qs = base_qs.filter(is_active=True)
+        qs = base_qs.filter(is_active=True).select_related("company")
 
         # Only apply filters for the list endpoint
         if self.action == "list":
             params = self.request.query_params
+
+            # read only the columns the response needs
+            columns = self._list_columns(params.get("fields"))
+            if "company__name" not in columns:
+                qs = qs.select_related(None)
+            qs = qs.only(*columns)
             search = params.get("search")  # keyword
             location = params.get("location")
             job_type = params.get("job_type")
+            skills = params.get("skills")  # e.g. "react,django"
+            skills_match = params.get("skills_match", "all").strip().lower()  # all | any
 
             if search:
-                search = search.strip()
-                qs = qs.filter(
-                    Q(title__icontains=search)
-                    | Q(description__icontains=search)
-                    | Q(company__name__icontains=search)
-                )
+                # FTS5 index lookup, ranked by relevance (see search_utils)
+                qs = apply_search(qs, search)
 
             if location:
                 qs = qs.filter(location__icontains=location.strip())
@@ -126,8 +162,23 @@ class JobViewSet(viewsets.ModelViewSet):
             if job_type:
                 qs = qs.filter(job_type__icontains=job_type.strip())
 
+            if skills:
+                # indexed JobSkill posting lists (see skill_utils)
+                qs = filter_jobs_by_skills(qs, skills, match=skills_match)
+
         return qs
 
+    def _list_columns(self, fields_param):
+        if not fields_param:
+            return JOB_CARD_ONLY
+        requested = parse_field_paths(fields_param)
+        concrete = {f.name for f in Job._meta.concrete_fields}
+        # id / created_at: ordering + keyset cursor
+        columns = {"id", "created_at"} | (set(requested) & concrete)
+        if "company_name" in requested:
+            columns |= {"company", "company__name"}
+        return sorted(columns)
+
     def perform_create(self, serializer):
         user = self.request.user
 
@@ -146,53 +197,14 @@ class JobViewSet(viewsets.ModelViewSet):
 
         job = serializer.save(company=company)
 
-        # 🔔 Job alert matching logic
-        text = f"{job.title} {job.description}".lower()
-        job_location = (job.location or "").lower()
-        job_type = (job.job_type or "").lower()
-
-        alerts = JobAlert.objects.filter(is_active=True).select_related(
-            "candidate__user"
+        # 🔔 Job alert matching + notifications run in the background worker
+        # (tasks.job_alert_fanout), so the recruiter gets the 201 right away
+        enqueue(
+            "job_alert_fanout",
+            {"job_id": job.id},
+            dedupe_key=f"job_alert_fanout:{job.id}",
         )
 
-        notifications_to_create = []
-
-        for alert in alerts:
-            alert_location = (alert.location or "").lower()
-            alert_job_type = (alert.job_type or "").lower()
-
-            # Match keywords
-            keywords_text = alert.keywords or ""
-            keywords = [
-                k.strip().lower()
-                for k in re.split(r"[,\n]", keywords_text)
-                if k.strip()
-            ]
-
-            if keywords:
-                matched = False
-                for kw in keywords:
-                    if kw and kw in text:
-                        matched = True
-                        break
-                if not matched:
-                    continue
-
-            # Optional: match location
-            if alert_location and alert_location not in job_location:
-                continue
-
-            # Optional: match job type
-            if alert_job_type and alert_job_type != job_type:
-                continue
-
-            notifications_to_create.append(
-                JobAlertNotification(candidate=alert.candidate, job=job, alert=alert)
-            )
-
-        if notifications_to_create:
-            JobAlertNotification.objects.bulk_create(notifications_to_create)
-
     @action(detail=False, methods=["get"], url_path="my-jobs")
     def my_jobs(self, request):
         user = request.user
@@ -203,15 +215,19 @@ class JobViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="applications")
     def applications(self, request, pk=None):
         job = self.get_object()
-        apps = job.applications.select_related("candidate__user")
-        serializer = ApplicationSerializer(apps, many=True)
+        apps = (
+            job.applications.select_related(*APPLICATION_LIST_RELATED)
+            .defer("job__description")
+            .order_by("-applied_at", "-id")
+        )
+        serializer = ApplicationListSerializer(apps, many=True)
         return Response(serializer.data)
 
     @action(detail=True, methods=["post"], url_path="apply")
     def apply(self, request, pk=None):
         """
         Old-style apply endpoint: POST /api/jobs/<id>/apply/
-        Still supported. Also creates test + sends email.
+        Still supported. Also queues the test + sends email.
         """
         job = self.get_object()
         user = request.user
@@ -232,23 +248,20 @@ class JobViewSet(viewsets.ModelViewSet):
 
         cover_letter = request.data.get("cover_letter", "")
 
-        application = Application.objects.create(
-            job=job,
-            candidate=candidate_profile,
-            cover_letter=cover_letter,
-        )
-
-        # 🔹 Create test as well
-        try:
-            create_test_for_application(application)
-        except Exception as e:
-            print("Error creating test from JobViewSet.apply:", e)
+        # 🔔 application + its email / notification commit together
+        with transaction.atomic():
+            application = Application.objects.create(
+                job=job,
+                candidate=candidate_profile,
+                cover_letter=cover_letter,
+            )
+            send_application_status_email(application)
 
-        # 🔔 Send email
+        # 🔹 Queue test generation (questions are filled in by a worker)
         try:
-            send_application_status_email(application)
-        except Exception as e:
-            print("Error sending status email from JobViewSet.apply:", e)
+            queue_test_generation(application)
+        except Exception:
+            logger.exception("Error queueing test from JobViewSet.apply")
 
         serializer = ApplicationSerializer(application)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -271,57 +284,73 @@ class JobViewSet(viewsets.ModelViewSet):
         if getattr(user, "role", None) != "candidate":
             return Response([], status=200)
 
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", DEFAULT_TOP_K)), MAX_TOP_K))
+        except ValueError:
+            limit = DEFAULT_TOP_K
+
+        # ⚡ warm path: one cache read, no queries
+        cached = recommendation_cache.get(user.id, limit)
+        if cached is not None:
+            return Response(cached)
+
         # Ensure candidate profile exists
         profile, _ = CandidateProfile.objects.get_or_create(user=user)
 
-        skills_text = profile.skills or ""
-        # split on comma or newline
-        skills = [
-            s.strip().lower()
-            for s in re.split(r"[,\n]", skills_text)
-            if s.strip()
-        ]
+        # normalized skills from the CandidateSkill index
+        skills = candidate_skill_names(profile)
 
         # If no skills yet, just return latest active jobs
-        base_qs = Job.objects.filter(is_active=True).order_by("-created_at")
-
-        # Exclude jobs already applied by this candidate
-        applied_job_ids = Application.objects.filter(
-            candidate__user=user
-        ).values_list("job_id", flat=True)
-
-        base_qs = base_qs.exclude(id__in=applied_job_ids)
-
+        # (not cached: every new job changes this list)
         if not skills:
-            jobs = base_qs[:10]
+            applied_job_ids = Application.objects.filter(
+                candidate=profile
+            ).values_list("job_id", flat=True)
+            jobs = (
+                Job.objects.filter(is_active=True)
+                .exclude(id__in=applied_job_ids)
+                .order_by("-created_at")[:limit]
+            )
             serializer = JobSerializer(jobs, many=True)
             return Response(serializer.data)
 
-        # Score jobs by skill overlap
-        scored = []
-        for job in base_qs:
-            text = f"{job.title} {job.description}".lower()
-            score = 0
-            for skill in skills:
-                if skill and skill in text:
-                    score += 1
-
-            if score > 0:
-                scored.append((score, job))
-
-        # Sort by score (desc) then newest first
-        scored.sort(key=lambda x: (-x[0], -x[1].created_at.timestamp()))
+        # Top-k by TF-IDF score over the precomputed job vectors
+        ranked = recommend_job_ids(profile, k=limit)
+        jobs_by_id = Job.objects.select_related("company").in_bulk(
+            [job_id for job_id, _ in ranked]
+        )
 
-        # Top 10 recommended
-        jobs = [j for _, j in scored[:10]]
-        serializer = JobSerializer(jobs, many=True)
-        return Response(serializer.data)
+        data = []
+        for job_id, score in ranked:
+            job = jobs_by_id.get(job_id)
+            if job is None:
+                continue
+            item = JobSerializer(job).data
+            item["recommendation_score"] = round(score, 4)
+            data.append(item)
+        recommendation_cache.store(user.id, limit, data)
+        return Response(data)
 
 
 class ApplicationViewSet(viewsets.ModelViewSet):
-    queryset = Application.objects.all().order_by("-applied_at")
+    queryset = Application.objects.select_related(*APPLICATION_LIST_RELATED).order_by(
+        "-applied_at", "-id"
+    )
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.defer("job__description")  # cards use the excerpt
+        return qs
+
+    def get_serializer_class(self):
+        # lists leave out the test questions and the full job description
+        if self.action == "list":
+            return ApplicationListSerializer
+        return ApplicationSerializer
 
     @action(detail=True, methods=["get"], url_path="download-resume")
     def download_resume(self, request, pk=None):
@@ -407,7 +436,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         1. Ensure user is a candidate profile
         2. Check duplicate application for same job
         3. Save application with candidate
-        4. Create test via Groq
+        4. Queue test generation (Groq, in the background)
         5. Send 'applied' email
         """
         user = self.request.user
@@ -423,20 +452,17 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         if Application.objects.filter(job=job, candidate=candidate).exists():
             raise ValidationError({"detail": "You have already applied for this job."})
 
-        # 3) Save application with candidate attached
-        application = serializer.save(candidate=candidate)
-
-        # 4) Create test via Groq – don't block on errors
-        try:
-            create_test_for_application(application)
-        except Exception as e:
-            print("Error creating test:", e)
+        # 3) Save application with candidate attached + queue its status
+        #    email / notification in the same transaction
+        with transaction.atomic():
+            application = serializer.save(candidate=candidate)
+            send_application_status_email(application)
 
-        # 5) Send status email – don't block on errors
+        # 4) Queue test generation – don't block on errors
         try:
-            send_application_status_email(application)
-        except Exception as e:
-            print("Error sending application email:", e)
+            queue_test_generation(application)
+        except Exception:
+            logger.exception("Error queueing test")
 
     @action(
         detail=True,
@@ -448,6 +474,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         """
         Candidate: GET /api/applications/<id>/test/
         Returns test + questions (without correct options).
+        202 { "generation_status": "pending" } while questions are generated.
         """
         application = self.get_object()
 
@@ -463,13 +490,18 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
         test = getattr(application, "test", None)
         if not test:
-            # Try to (re)create if missing
-            test = create_test_for_application(application)
+            # Queue it if missing (e.g. applications from before tests existed)
+            test = queue_test_generation(application)
+        elif test.generation_status == "failed":
+            test = retry_test_generation(test)
 
-        if not test:
+        if test.generation_status != "ready":
             return Response(
-                {"detail": "Test not available for this application."},
-                status=status.HTTP_404_NOT_FOUND,
+                {
+                    "detail": "Your test is being prepared. Please try again shortly.",
+                    "generation_status": test.generation_status,
+                },
+                status=status.HTTP_202_ACCEPTED,
             )
 
         serializer = JobTestSerializer(test)
@@ -505,6 +537,12 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        if test.generation_status != "ready":
+            return Response(
+                {"detail": "Test is not ready yet."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
         # 🚫 Block if already completed once (no re-attempt)
         if test.completed_at is not None:
             return Response(
@@ -519,60 +557,29 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        total_score = 0
-
-        for ans in answers_data:
-            ser = JobTestAnswerInputSerializer(data=ans)
-            ser.is_valid(raise_exception=True)
-
-            q_id = ser.validated_data["question_id"]
-            selected = ser.validated_data["selected_option"]
+        # validate the whole batch at once, then grade it in one transaction
+        ser = JobTestAnswerInputSerializer(data=answers_data, many=True)
+        ser.is_valid(raise_exception=True)
 
-            try:
-                question = JobTestQuestion.objects.get(id=q_id, test=test)
-            except JobTestQuestion.DoesNotExist:
-                continue
-
-            JobTestAnswer.objects.update_or_create(
-                question=question,
-                application=application,
-                defaults={"selected_option": selected},
+        test = grade_submission(test, application, ser.validated_data)
+        if test is None:
+            # a concurrent submit got there first
+            return Response(
+                {"detail": "You have already completed this test."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-
-            if question.correct_option == selected:
-                total_score += 2  # 2 marks per correct
-
-        # ✅ Update test
-        test.score = total_score
-        # 30 is your current pass threshold (60% of 50 marks)
-        passed = total_score > 30
-        test.passed = passed
-        test.completed_at = timezone.now()
-        test.save()
-
-        # ✅ Update application status based on result
-        if passed:
-            # If score > 30 => shortlist
-            if application.status != "shortlisted":
-                application.status = "shortlisted"
-                application.save(update_fields=["status"])
-
-                # Optional: send email that candidate is shortlisted
-                try:
-                    send_application_status_email(application)
-                except Exception as e:
-                    print("Error sending status email:", e)
-        else:
-            # ❌ Failed => mark as rejected
-            if application.status != "rejected":
-                application.status = "rejected"
+        total_score = test.score
+        passed = test.passed
+
+        # ✅ Update application status based on result:
+        # shortlist if passed (score > 30), otherwise ❌ reject
+        new_status = "shortlisted" if passed else "rejected"
+        if application.status != new_status:
+            # status + email to the candidate (outbox) in one transaction
+            with transaction.atomic():
+                application.status = new_status
                 application.save(update_fields=["status"])
-
-                # Optional: send email that candidate is rejected
-                try:
-                    send_application_status_email(application)
-                except Exception as e:
-                    print("Error sending status email:", e)
+                send_application_status_email(application)
 
         return Response(
             {
@@ -601,7 +608,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # Only recruiter who owns the job's company
         if (
             getattr(user, "role", None) != "recruiter"
-            or application.job.company.user != user
+            or application.job.company.user_id != user.id
         ):
             return Response(
                 {"detail": "Only the job's recruiter can view test results."},
@@ -631,15 +638,49 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         old_status = instance.status
 
-        # Save updates
-        application = serializer.save()
+        with transaction.atomic():
+            # Save updates
+            application = serializer.save()
 
-        # If status changed, trigger email + notification
-        if application.status != old_status:
-            try:
+            # If status changed, queue email + notification (same transaction)
+            if application.status != old_status:
                 send_application_status_email(application)
-            except Exception as e:
-                print("Error sending application status email on update:", e)
+
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_update_status(self, request):
+        """
+        Recruiter: POST /api/applications/bulk-status/
+        body: { "status": "shortlisted", "ids": [12, 15] }
+           or { "status": "rejected", "filter": { "job": [3], "status": ["applied"], "passed": false } }
+        Moves the recruiter's matching applications in one transaction, with
+        the notifications / emails a status PATCH sends. At most
+        BULK_STATUS_MAX_APPLICATIONS per request: "more" says a filter
+        matched further applications (post it again).
+        """
+        if getattr(request.user, "role", None) != "recruiter":
+            return Response(
+                {"detail": "Only recruiters can change application status."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = BulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        # ✅ ownership: other recruiters' applications never match
+        if "ids" in data:
+            queryset = bulk_status.matching(request.user, ids=data["ids"])
+        else:
+            f = data["filter"]
+            queryset = bulk_status.matching(
+                request.user, jobs=f.get("job"), statuses=f.get("status"), passed=f.get("passed")
+            )
+
+        ids, more = bulk_status.change_status(queryset, data["status"])
+        return Response(
+            {"status": data["status"], "updated": len(ids), "ids": ids, "more": more},
+            status=status.HTTP_200_OK,
+        )
 
 
 class SaveJobView(generics.CreateAPIView):
@@ -678,10 +719,16 @@ class UnsaveJobView(generics.DestroyAPIView):
 class SavedJobListView(generics.ListAPIView):
     serializer_class = SavedJobSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         profile, _ = CandidateProfile.objects.get_or_create(user=self.request.user)
-        return SavedJob.objects.filter(candidate=profile).order_by("-saved_at")
+        return (
+            SavedJob.objects.filter(candidate=profile)
+            .select_related("job__company")
+            .only("id", "candidate", "saved_at", *[f"job__{c}" for c in JOB_CARD_ONLY])
+            .order_by("-saved_at", "-id")
+        )
 
 
 class CandidateJobAlertListCreateView(generics.ListCreateAPIView):
@@ -706,13 +753,19 @@ class CandidateJobAlertDetailView(generics.RetrieveUpdateDestroyAPIView):
         return JobAlert.objects.filter(candidate=profile)
 
 
-class CandidateNotificationListView(generics.ListAPIView):
+class CandidateNotificationListView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = JobAlertNotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    # job title / company name are part of each row
+    conditional_models = (JobAlertNotification, Job)
+    conditional_per_user = True
 
     def get_queryset(self):
         profile, _ = CandidateProfile.objects.get_or_create(user=self.request.user)
-        return JobAlertNotification.objects.filter(candidate=profile)
+        return JobAlertNotification.objects.filter(candidate=profile).order_by(
+            "-created_at", "-id"
+        )
 
 
 class MarkNotificationReadView(generics.UpdateAPIView):
@@ -728,10 +781,9 @@ class MarkNotificationReadView(generics.UpdateAPIView):
         return JobAlertNotification.objects.filter(candidate=profile)
 
     def patch(self, request, *args, **kwargs):
-        # mark as read
+        # mark as read (+ unread counter, once)
         instance = self.get_object()
-        instance.is_read = True
-        instance.save()
+        notification_counters.mark_read(instance, request.user.id)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -739,18 +791,21 @@ class MarkNotificationReadView(generics.UpdateAPIView):
 # 🔹 NEW: application status notifications (emails mirrored into DB)
 
 
-class CandidateApplicationStatusNotificationListView(generics.ListAPIView):
+class CandidateApplicationStatusNotificationListView(ConditionalGetMixin, generics.ListAPIView):
     """
     List application status updates for the logged-in candidate.
     """
     serializer_class = ApplicationStatusNotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    conditional_models = (ApplicationStatusNotification, Job)
+    conditional_per_user = True
 
     def get_queryset(self):
         profile, _ = CandidateProfile.objects.get_or_create(user=self.request.user)
         return ApplicationStatusNotification.objects.filter(
             application__candidate=profile
-        ).order_by("-created_at")
+        ).order_by("-created_at", "-id")
 
 
 class MarkApplicationStatusNotificationReadView(generics.UpdateAPIView):
@@ -769,15 +824,126 @@ class MarkApplicationStatusNotificationReadView(generics.UpdateAPIView):
 
     def patch(self, request, *args, **kwargs):
         instance = self.get_object()
-        instance.is_read = True
-        instance.save()
+        notification_counters.mark_read(instance, request.user.id)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
 
+class UnreadNotificationCountView(generics.GenericAPIView):
+    """
+    GET /api/alerts/unread-count/
+    Unread job alert + application status notifications of the logged-in
+    candidate, from the denormalized NotificationCounter row (navbar badge).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        return Response(notification_counters.unread_counts(request.user.id))
+
+
+class NotificationInboxView(ConditionalGetMixin, generics.GenericAPIView):
+    """
+    GET /api/alerts/inbox/?cursor=&page_size=&kind=job_alert&unread=1
+
+    Job alert and application status notifications of the logged-in
+    candidate in one feed, newest first, keyset-paginated (see inbox.page):
+        { "next": url|null, "results": [{"kind": ..., <notification>}, ...] }
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    conditional_models = (JobAlertNotification, ApplicationStatusNotification, Job)
+    conditional_per_user = True
+
+    def get(self, request, *args, **kwargs):
+        return self._conditional(self._inbox, request)
+
+    def _inbox(self, request):
+        params = request.query_params
+        kinds = events.KINDS
+        if params.get("kind"):
+            kinds = [k.strip() for k in params["kind"].split(",") if k.strip()]
+            unknown = set(kinds) - set(events.KINDS)
+            if unknown:
+                raise ValidationError({"kind": f"Unknown kind: {', '.join(sorted(unknown))}."})
+        cursor = None
+        if params.get("cursor"):
+            try:
+                cursor = inbox.decode_cursor(params["cursor"])
+            except inbox.InvalidCursor:
+                raise NotFound(KeysetPagination.invalid_cursor_message)
+
+        items, next_position = inbox.page(
+            request.user.id,
+            cursor=cursor,
+            limit=KeysetPagination().get_page_size(request),
+            kinds=[k for k in events.KINDS if k in kinds],
+            unread_only=params.get("unread") in ("1", "true"),
+        )
+        next_url = None
+        if next_position is not None:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", inbox.encode_cursor(next_position)
+            )
+        return Response({"next": next_url, "results": items})
+
+
+class InboxMarkReadView(generics.GenericAPIView):
+    """
+    POST /api/alerts/inbox/read/
+    Bulk mark-read (see InboxReadSerializer): one UPDATE per notification
+    table. Returns how many were marked and the new unread counts.
+    """
+    serializer_class = InboxReadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        if "up_to" in data:
+            marked = inbox.mark_read(request.user.id, up_to=(data["up_to"]["kind"], data["up_to"]["id"]))
+            if marked is None:
+                raise NotFound("No such notification.")
+        else:
+            marked = inbox.mark_read(request.user.id, items=[(i["kind"], i["id"]) for i in data["items"]])
+        return Response(
+            {"marked": marked, "unread": notification_counters.unread_counts(request.user.id)}
+        )
+
+
+async def notification_stream(request):
+    """
+    GET /api/alerts/stream/?token=<JWT access token>
+
+    Server-Sent Events with the logged-in candidate's new job alert and
+    application status notifications (see events.stream). EventSource
+    can't set headers, hence the token in the query string; it sends
+    Last-Event-ID by itself when it reconnects.
+    Needs an ASGI server (uvicorn / daphne on jobportal.asgi) to hold
+    many idle connections per worker.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+    user = await sync_to_async(events.authenticate)(request.GET.get("token"))
+    if user is None:
+        return JsonResponse({"detail": "Invalid or missing token."}, status=401)
+    if getattr(user, "role", None) != "candidate":
+        return JsonResponse({"detail": "Only candidates have notification streams."}, status=403)
+
+    cursor = events.parse_cursor(
+        request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    )
+    response = StreamingHttpResponse(
+        events.stream(user.pk, cursor), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: don't buffer the stream
+    return response
+
+
 class RecruiterApplicationsView(generics.ListAPIView):
-    serializer_class = ApplicationSerializer
+    serializer_class = ApplicationListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -786,9 +952,11 @@ class RecruiterApplicationsView(generics.ListAPIView):
         if getattr(user, "role", None) != "recruiter":
             return Application.objects.none()
 
-        qs = Application.objects.select_related(
-            "job", "candidate__user"
-        ).filter(job__company__user=user)
+        qs = (
+            Application.objects.select_related(*APPLICATION_LIST_RELATED)
+            .defer("job__description")
+            .filter(job__company__user=user)
+        )
 
         params = self.request.query_params
         search = params.get("search")  # candidate name or email
@@ -810,13 +978,14 @@ class RecruiterApplicationsView(generics.ListAPIView):
         if status_param:
             qs = qs.filter(status=status_param)
 
-        return qs.order_by("-applied_at")
+        return qs.order_by("-applied_at", "-id")
 
 
 class InterviewViewSet(viewsets.ModelViewSet):
-    queryset = Interview.objects.all().order_by("-scheduled_at")
+    queryset = Interview.objects.all().order_by("-scheduled_at", "-id")
     serializer_class = InterviewSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -857,62 +1026,63 @@ class RecruiterAnalyticsView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated, IsRecruiter]
 
     def get(self, request, *args, **kwargs):
-        user = request.user
+        # 📊 precomputed per-day counters (ApplicationDailyRollup), not a
+        # scan of every application
+        data = recruiter_summary(request.user)
+        return Response(data, status=status.HTTP_200_OK)
+
 
-        # All jobs created by this recruiter
-        jobs_qs = Job.objects.filter(company__user=user)
+class RecruiterAnalyticsSeriesView(generics.GenericAPIView):
+    """
+    GET /api/recruiter/analytics/series/?interval=week&start=2025-01-01&end=2025-12-31
 
-        # All applications for those jobs
-        applications_qs = Application.objects.filter(job__in=jobs_qs)
+    Applications per day / week / month over a date range, for charts:
+    - buckets: start date of every bucket (empty ones included)
+    - total, by_status[status], by_job[].counts: counts aligned with buckets
+    Optional filters: job=<id,id>, status=<status,status>.
+    Defaults: interval=day, range = last 30 days / 12 weeks / 12 months.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsRecruiter]
 
-        now = timezone.now()
-        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        last_7_days = now - timedelta(days=7)
+    def get(self, request, *args, **kwargs):
+        params = AnalyticsSeriesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+
+        # 📈 summed from ApplicationDailyRollup, never from Application
+        data = application_series(
+            request.user,
+            query["interval"],
+            query["start"],
+            query["end"],
+            job_ids=query.get("job"),
+            statuses=query.get("status"),
+        )
+        return Response(data, status=status.HTTP_200_OK)
 
-        total_jobs = jobs_qs.count()
-        active_jobs = jobs_qs.filter(is_active=True).count()
 
-        total_applications = applications_qs.count()
-        applications_today = applications_qs.filter(
-            applied_at__gte=start_of_today
-        ).count()
-        applications_last_7_days = applications_qs.filter(
-            applied_at__gte=last_7_days
-        ).count()
+class EmailOutboxStatsView(generics.GenericAPIView):
+    """
+    GET /api/admin/email-outbox/
+    Outbox depth per status, age of the oldest due email, and the send
+    counters of this process (see outbox.stats).
+    """
+    permission_classes = [permissions.IsAdminUser]
 
-        # Applications grouped by status
-        status_counts_qs = (
-            applications_qs.values("status")
-            .annotate(count=Count("id"))
-            .order_by()
-        )
-        applications_by_status = {
-            row["status"]: row["count"] for row in status_counts_qs
-        }
-
-        # Applications per job (top jobs first)
-        apps_per_job_qs = (
-            applications_qs.values("job_id", "job__title")
-            .annotate(applications_count=Count("id"))
-            .order_by("-applications_count")
-        )
-        applications_per_job = [
-            {
-                "job_id": row["job_id"],
-                "job_title": row["job__title"],
-                "applications_count": row["applications_count"],
-            }
-            for row in apps_per_job_qs
-        ]
-
-        data = {
-            "total_jobs": total_jobs,
-            "active_jobs": active_jobs,
-            "total_applications": total_applications,
-            "applications_today": applications_today,
-            "applications_last_7_days": applications_last_7_days,
-            "applications_by_status": applications_by_status,
-            "applications_per_job": applications_per_job,
-        }
+    def get(self, request, *args, **kwargs):
+        return Response(outbox.stats())
 
-        return Response(data, status=status.HTTP_200_OK)
+
+class CacheStatsView(generics.GenericAPIView):
+    """
+    GET /api/admin/cache-stats/
+    Hit ratios of the in-process caches (this worker only).
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response({
+            "responses": response_cache.stats(),
+            "recommendations": recommendation_cache.stats(),
+            "question_bank": question_bank.stats(),
+        })
@@ -21,7 +21,7 @@ export const deleteAlert = (id) =>
 // ------------------------
 
 export const fetchJobNotifications = () =>
-  axiosClient.get("/alerts/notifications/");
+  axiosClient.get("/alerts/notifications/", { params: { page_size: 100 } });
 
 export const markJobNotificationRead = (id) =>
   axiosClient.patch(`/alerts/notifications/${id}/read/`, {});
@@ -32,7 +32,39 @@ export const markJobNotificationRead = (id) =>
 // ------------------------
 
 export const fetchApplicationStatusNotifications = () =>
-  axiosClient.get("/alerts/application-status/");
+  axiosClient.get("/alerts/application-status/", { params: { page_size: 100 } });
 
 export const markApplicationStatusNotificationRead = (id) =>
   axiosClient.patch(`/alerts/application-status/${id}/read/`, {});
+
+// ------------------------
+// INBOX (both kinds merged, newest first, cursor-paginated)
+// items: { kind: "job_alert" | "application_status", ...notification }
+// ------------------------
+
+export const fetchInbox = (params = {}) =>
+  axiosClient.get("/alerts/inbox/", { params });
+
+// { items: [{ kind, id }, ...] }  or  { up_to: { kind, id } } (that one + all older)
+export const markInboxRead = (data) =>
+  axiosClient.post("/alerts/inbox/read/", data);
+
+// ------------------------
+// UNREAD COUNTS (navbar badge)
+// ------------------------
+
+export const fetchUnreadCount = () => axiosClient.get("/alerts/unread-count/");
+
+// ------------------------
+// LIVE NOTIFICATIONS (Server-Sent Events)
+// EventSource can't send headers: the access token goes in the query string.
+// It reconnects by itself, sending Last-Event-ID so missed events are replayed.
+// ------------------------
+
+export const openNotificationStream = () => {
+  const token = localStorage.getItem("accessToken");
+  if (!token || typeof EventSource === "undefined") return null;
+  return new EventSource(
+    `${axiosClient.defaults.baseURL}alerts/stream/?token=${encodeURIComponent(token)}`
+  );
+};
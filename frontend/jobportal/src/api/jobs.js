@@ -8,6 +8,13 @@ export const unsaveJob = (job_id) => {
     return axiosClient.delete(`saved/remove/${job_id}/`);
 };
 
+// list endpoints are cursor-paginated: { next, previous, results }
 export const getSavedJobs = () => {
-    return axiosClient.get("saved/");
+    return axiosClient.get("saved/", { params: { page_size: 100 } });
+};
+
+// recruiter: move many applications at once; body { status, ids } or { status, filter }
+// -> { status, updated, ids, more }
+export const bulkUpdateApplicationStatus = (status, ids) => {
+    return axiosClient.post("applications/bulk-status/", { status, ids });
 };
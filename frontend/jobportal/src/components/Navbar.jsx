@@ -1,6 +1,7 @@
-import { useState } from "react";
-import { Link } from "react-router-dom";
+import { useEffect, useState } from "react";
+import { Link, useLocation } from "react-router-dom";
 import { useAuth } from "../context/AuthContext";
+import { fetchUnreadCount, openNotificationStream } from "../api/alerts";
 import logo from "../assets/Logo.png";
 
 // Icons
@@ -156,13 +157,67 @@ const iconLabel = (IconComp, label) => (
   </span>
 );
 
+// Unread notifications badge (Job Alerts link)
+const unreadBadgeStyle = {
+  minWidth: 18,
+  height: 18,
+  padding: "0 5px",
+  borderRadius: "999px",
+  backgroundColor: "#ef4444",
+  color: "#ffffff",
+  fontSize: 11,
+  fontWeight: 600,
+  display: "inline-flex",
+  alignItems: "center",
+  justifyContent: "center",
+  marginLeft: 6,
+};
+
+const unreadBadge = (count) =>
+  count > 0 ? (
+    <span style={unreadBadgeStyle}>{count > 99 ? "99+" : count}</span>
+  ) : null;
+
 // --- Component Definition ---
 
 const Navbar = () => {
   const { isAuthenticated, logout, user } = useAuth();
   const [isMobileMenuOpen, setIsMobileMenuOpen] = useState(false);
+  const [unreadCount, setUnreadCount] = useState(0);
+  const location = useLocation();
 
   const role = user?.role; // "candidate" or "recruiter"
+
+  // Unread badge: one counter row read (/alerts/unread-count/) per navigation
+  useEffect(() => {
+    if (!isAuthenticated || role !== "candidate") {
+      setUnreadCount(0);
+      return;
+    }
+    let cancelled = false;
+    fetchUnreadCount()
+      .then((res) => {
+        if (!cancelled) setUnreadCount(res.data.total);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+    };
+  }, [isAuthenticated, role, location.pathname]);
+
+  // Live badge: new notifications pushed over /alerts/stream/
+  useEffect(() => {
+    if (!isAuthenticated || role !== "candidate") return;
+    const source = openNotificationStream();
+    if (!source) return;
+    source.addEventListener("ready", (e) => {
+      setUnreadCount(JSON.parse(e.data).total);
+    });
+    source.addEventListener("notification", () => {
+      setUnreadCount((count) => count + 1);
+    });
+    return () => source.close();
+  }, [isAuthenticated, role]);
   const profilePath =
     role === "candidate"
       ? "/candidate/profile"
@@ -183,6 +238,7 @@ const Navbar = () => {
       </Link>
       <Link to="/candidate/alerts" style={navLinkStyle}>
         {iconLabel(FiBell, "Job Alerts")}
+        {unreadBadge(unreadCount)}
       </Link>
       <Link to="/candidate/saved-jobs" style={navLinkStyle}>
         {iconLabel(FiHeart, "Saved")}
@@ -400,6 +456,7 @@ const Navbar = () => {
                       onClick={closeMobile}
                     >
                       {iconLabel(FiBell, "Job Alerts")}
+                      {unreadBadge(unreadCount)}
                     </Link>
                     <Link
                       to="/candidate/saved-jobs"
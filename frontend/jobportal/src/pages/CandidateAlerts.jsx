@@ -6,9 +6,9 @@ import {
   createAlert,
   updateAlert,
   deleteAlert,
-  fetchJobNotifications,
+  fetchInbox,
+  markInboxRead,
   markJobNotificationRead,
-  fetchApplicationStatusNotifications,
   markApplicationStatusNotificationRead,
 } from "../api/alerts";
 
@@ -63,6 +63,7 @@ const CandidateAlerts = () => {
   const [alerts, setAlerts] = useState([]);
   const [notifications, setNotifications] = useState([]);
   const [appNotifications, setAppNotifications] = useState([]);
+  const [inboxHead, setInboxHead] = useState(null); // newest notification, either kind
 
   const [form, setForm] = useState({
     keywords: "",
@@ -80,15 +81,16 @@ const CandidateAlerts = () => {
     setLoading(true);
     setError("");
     try {
-      const [alertsRes, notifRes, appNotifRes] = await Promise.all([
+      const [alertsRes, inboxRes] = await Promise.all([
         fetchAlerts(),
-        fetchJobNotifications(),
-        fetchApplicationStatusNotifications(),
+        fetchInbox({ page_size: 100 }),
       ]);
 
+      const items = inboxRes.data?.results || [];
       setAlerts(alertsRes.data || []);
-      setNotifications(notifRes.data || []);
-      setAppNotifications(appNotifRes.data || []);
+      setNotifications(items.filter((n) => n.kind === "job_alert"));
+      setAppNotifications(items.filter((n) => n.kind === "application_status"));
+      setInboxHead(items[0] || null);
     } catch (err) {
       console.error("Error loading alerts/notifications:", err);
       setError("Could not load alerts and notifications.");
@@ -206,6 +208,18 @@ const CandidateAlerts = () => {
     }
   };
 
+  // newest of both lists and everything older, in one request
+  const handleMarkAllRead = async () => {
+    if (!inboxHead) return;
+    try {
+      await markInboxRead({ up_to: { kind: inboxHead.kind, id: inboxHead.id } });
+      setNotifications((prev) => prev.map((n) => ({ ...n, is_read: true })));
+      setAppNotifications((prev) => prev.map((n) => ({ ...n, is_read: true })));
+    } catch (err) {
+      console.error("Error marking notifications read:", err);
+    }
+  };
+
   // ------------- RENDER -------------
 
   const unreadJobs = notifications.filter((n) => !n.is_read).length;
@@ -282,6 +296,25 @@ const CandidateAlerts = () => {
             >
               Stay updated · No spam
             </span>
+            {unreadJobs + unreadApps > 0 && (
+              <button
+                type="button"
+                onClick={handleMarkAllRead}
+                style={{
+                  fontSize: 11,
+                  padding: "4px 10px",
+                  borderRadius: 999,
+                  border: `1px solid ${COLORS.primary}`,
+                  background: "#ffffff",
+                  color: COLORS.primary,
+                  fontWeight: 500,
+                  cursor: "pointer",
+                  whiteSpace: "nowrap",
+                }}
+              >
+                Mark all as read
+              </button>
+            )}
             {loading && (
               <span
                 style={{
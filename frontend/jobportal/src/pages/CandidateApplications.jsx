@@ -27,14 +27,17 @@ const CandidateApplications = () => {
     useEffect(() => {
         const fetchApplications = async () => {
             try {
-                const res = await axiosClient.get("applications/");
-                setApplications(res.data);
+                const res = await axiosClient.get("applications/", {
+                    params: { page_size: 100 },
+                });
+                const apps = Array.isArray(res.data) ? res.data : res.data.results || [];
+                setApplications(apps);
                 setPage(1);
 
                 // 🔹 On load, check which tests were already started earlier
                 //    If a timer exists in localStorage for that application, we lock the test.
                 const locked = {};
-                res.data.forEach((app) => {
+                apps.forEach((app) => {
                     const key = `test_timer_${app.id}`;
                     const stored = localStorage.getItem(key);
                     if (stored) {
@@ -369,8 +372,16 @@ const CandidateApplications = () => {
                         >
                             {currentApplications.map((app) => {
                                 const isLocked = !!testLocked[app.id];
+                                // questions are generated in the background after applying
+                                const isPreparing =
+                                    !!app.test &&
+                                    app.test.generation_status !== undefined &&
+                                    app.test.generation_status !== "ready";
                                 const isDisabled =
-                                    !app.test || app.test.completed_at || isLocked;
+                                    !app.test ||
+                                    app.test.completed_at ||
+                                    isLocked ||
+                                    isPreparing;
 
                                 return (
                                     <li
@@ -503,7 +514,7 @@ const CandidateApplications = () => {
                                                         backgroundColor:
                                                             app.test?.completed_at
                                                                 ? "#9ca3af"
-                                                                : isLocked
+                                                                : isLocked || isPreparing
                                                                     ? "#9ca3af"
                                                                     : "#2563eb",
                                                         color: "white",
@@ -514,7 +525,9 @@ const CandidateApplications = () => {
                                                         ? "Test Completed"
                                                         : isLocked
                                                             ? "Test Expired"
-                                                            : "Take Test"}
+                                                            : isPreparing
+                                                                ? "Preparing Test..."
+                                                                : "Take Test"}
                                                 </button>
 
                                                 {/* Withdraw button */}
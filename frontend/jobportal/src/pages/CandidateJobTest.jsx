@@ -71,10 +71,21 @@ const CandidateJobTest = () => {
                 const initialSeconds = Math.floor(diffMs / 1000);
                 setRemainingSeconds(initialSeconds);
 
-                // 🔹 Load test questions
-                const res = await axiosClient.get(
+                // 🔹 Load test questions (202 = still being generated, poll)
+                let res = await axiosClient.get(
                     `/applications/${applicationId}/test/`
                 );
+                for (let i = 0; res.status === 202 && i < 40; i++) {
+                    await new Promise((resolve) => setTimeout(resolve, 3000));
+                    res = await axiosClient.get(
+                        `/applications/${applicationId}/test/`
+                    );
+                }
+                if (res.status === 202) {
+                    setError("Your test is still being prepared. Please try again shortly.");
+                    setTest(null);
+                    return;
+                }
                 setTest(res.data);
 
                 const initial = {};
@@ -135,9 +146,12 @@ const CandidateJobTest = () => {
             localStorage.removeItem(timerKey);
         } catch (err) {
             console.error(err);
+            // 409: questions are still being generated
             setError(
-                err.response?.data?.detail ||
-                    "Could not submit test. Please try again."
+                err.response?.status === 409
+                    ? "Your test is still being prepared. Please try again shortly."
+                    : err.response?.data?.detail ||
+                          "Could not submit test. Please try again."
             );
         } finally {
             setSubmitting(false);
@@ -172,8 +186,10 @@ const CandidateJobTest = () => {
             } catch (err) {
                 console.error(err);
                 setError(
-                    err.response?.data?.detail ||
-                        "Could not auto-submit your test. Please contact support."
+                    err.response?.status === 409
+                        ? "Your test is still being prepared. Please try again shortly."
+                        : err.response?.data?.detail ||
+                              "Could not auto-submit your test. Please contact support."
                 );
             } finally {
                 setSubmitting(false);
@@ -8,6 +8,7 @@ const CandidateProfile = () => {
         bio: "",
         skills: "",
         experience: "",
+        email_frequency: "immediate",
     });
     const [resumeFile, setResumeFile] = useState(null);
     const [existingResumeUrl, setExistingResumeUrl] = useState("");
@@ -32,6 +33,7 @@ const CandidateProfile = () => {
                         data.experience !== null && data.experience !== undefined
                             ? String(data.experience)
                             : "",
+                    email_frequency: data.email_frequency || "immediate",
                 });
 
                 if (data.resume) {
@@ -79,6 +81,8 @@ const CandidateProfile = () => {
                 fd.append("experience", Number(form.experience));
             }
 
+            fd.append("email_frequency", form.email_frequency);
+
             if (resumeFile) {
                 fd.append("resume", resumeFile);
             }
@@ -726,6 +730,40 @@ const CandidateProfile = () => {
                                         />
                                     </div>
 
+                                    <div className="form-group" style={{ marginBottom: "10px" }}>
+                                        <label
+                                            style={{
+                                                display: "block",
+                                                fontSize: "13px",
+                                                fontWeight: 500,
+                                                color: "#374151",
+                                                marginBottom: "4px",
+                                            }}
+                                        >
+                                            Notification emails
+                                        </label>
+                                        <select
+                                            className="input"
+                                            name="email_frequency"
+                                            value={form.email_frequency}
+                                            onChange={handleChange}
+                                            style={{
+                                                width: "100%",
+                                                borderRadius: "10px",
+                                                border:
+                                                    "1px solid rgba(209, 213, 219, 0.9)",
+                                                padding: "8px 10px",
+                                                fontSize: "14px",
+                                                outline: "none",
+                                                background: "#ffffff",
+                                            }}
+                                        >
+                                            <option value="immediate">For every update</option>
+                                            <option value="daily">Daily digest</option>
+                                            <option value="weekly">Weekly digest</option>
+                                        </select>
+                                    </div>
+
                                     <div className="form-group">
                                         <label
                                             style={{
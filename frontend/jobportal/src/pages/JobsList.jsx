@@ -9,6 +9,8 @@ import PaginationControls from "../components/PaginationControls";
 const JobsList = () => {
     const { isAuthenticated, user } = useAuth();
     const [jobs, setJobs] = useState([]);
+    const [nextUrl, setNextUrl] = useState(null); // cursor for the next server page
+    const [loadingMore, setLoadingMore] = useState(false);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState("");
 
@@ -34,28 +36,12 @@ const JobsList = () => {
             if (filters.location.trim()) params.location = filters.location.trim();
             if (filters.jobType.trim()) params.job_type = filters.jobType.trim();
 
-            // 1) Get all jobs
+            // 1) Get the first page of jobs
             const jobsRes = await axiosClient.get("jobs/", { params });
-            let jobsData = jobsRes.data;
-
-            // 2) If candidate logged in, mark already-saved jobs
-            const isCandidate = isAuthenticated && user?.role === "candidate";
-
-            if (isCandidate) {
-                const savedRes = await getSavedJobs();
-                const savedJobIds = new Set(
-                    savedRes.data
-                        .map((item) => item.job?.id)
-                        .filter((id) => id !== undefined && id !== null)
-                );
-
-                jobsData = jobsData.map((job) => ({
-                    ...job,
-                    is_saved: savedJobIds.has(job.id),
-                }));
-            }
+            const jobsData = await markSaved(jobsRes.data.results || []);
 
             setJobs(jobsData);
+            setNextUrl(jobsRes.data.next);
             setPage(1); // reset to first page whenever jobs are re-fetched
         } catch (err) {
             console.error("Error loading jobs:", err.response?.data || err);
@@ -65,6 +51,41 @@ const JobsList = () => {
         }
     };
 
+    // 2) If candidate logged in, mark already-saved jobs
+    const markSaved = async (jobsData) => {
+        const isCandidate = isAuthenticated && user?.role === "candidate";
+        if (!isCandidate) return jobsData;
+
+        const savedRes = await getSavedJobs();
+        const savedJobIds = new Set(
+            (savedRes.data.results || [])
+                .map((item) => item.job?.id)
+                .filter((id) => id !== undefined && id !== null)
+        );
+
+        return jobsData.map((job) => ({
+            ...job,
+            is_saved: savedJobIds.has(job.id),
+        }));
+    };
+
+    // Append the next server page (cursor link from the previous response)
+    const loadMore = async () => {
+        if (!nextUrl) return;
+        setLoadingMore(true);
+        try {
+            const res = await axiosClient.get(nextUrl);
+            const more = await markSaved(res.data.results || []);
+            setJobs((prev) => [...prev, ...more]);
+            setNextUrl(res.data.next);
+        } catch (err) {
+            console.error("Error loading more jobs:", err.response?.data || err);
+            setError("Could not load more jobs.");
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     useEffect(() => {
         fetchJobs();
         // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -183,6 +204,18 @@ const JobsList = () => {
                                 onPageChange={setPage}
                             />
                         )}
+
+                        {nextUrl && page === totalPages && (
+                            <button
+                                className="btn btn-outline"
+                                type="button"
+                                onClick={loadMore}
+                                disabled={loadingMore}
+                                style={{ marginTop: 8 }}
+                            >
+                                {loadingMore ? "Loading..." : "Load more jobs"}
+                            </button>
+                        )}
                     </>
                 )}
             </div>
@@ -1,5 +1,6 @@
 import { useEffect, useState } from "react";
 import axiosClient from "../api/axiosClient";
+import { bulkUpdateApplicationStatus } from "../api/jobs";
 import PaginationControls from "../components/PaginationControls";
 import RecruiterTestResult from "../components/RecruiterTestResult"; // ✅
 
@@ -32,6 +33,10 @@ const RecruiterDashboard = () => {
     // ✅ NEW: Test performance modal state
     const [performanceModalAppId, setPerformanceModalAppId] = useState(null);
 
+    // Bulk status change for the listed applications
+    const [bulkStatus, setBulkStatus] = useState("");
+    const [bulkUpdating, setBulkUpdating] = useState(false);
+
     // Pagination for applications
     const [page, setPage] = useState(1);
     const APPS_PER_PAGE = 4;
@@ -41,14 +46,14 @@ const RecruiterDashboard = () => {
         setError("");
 
         try {
-            const params = {};
+            const params = { page_size: 100 };
 
             if (filters.search.trim()) params.search = filters.search.trim();
             if (filters.job.trim()) params.job = filters.job.trim();
             if (filters.status.trim()) params.status = filters.status.trim();
 
             const res = await axiosClient.get("recruiter/applications/", { params });
-            setApplications(res.data);
+            setApplications(Array.isArray(res.data) ? res.data : res.data.results || []);
             setPage(1); // reset to first page whenever we refetch
         } catch (err) {
             console.error("Error loading applications:", err.response?.data || err);
@@ -168,6 +173,42 @@ const RecruiterDashboard = () => {
         }
     };
 
+    const handleBulkStatusChange = async () => {
+        if (!bulkStatus || applications.length === 0) return;
+        if (
+            !window.confirm(
+                `Move all ${applications.length} listed application(s) to "${bulkStatus}"?`
+            )
+        ) {
+            return;
+        }
+
+        setBulkUpdating(true);
+        try {
+            const res = await bulkUpdateApplicationStatus(
+                bulkStatus,
+                applications.map((app) => app.id)
+            );
+            const moved = new Set(res.data.ids);
+
+            setApplications((prev) =>
+                prev.map((app) =>
+                    moved.has(app.id) ? { ...app, status: bulkStatus } : app
+                )
+            );
+
+            if (activeProfile && moved.has(activeProfile.application_id)) {
+                setActiveProfile({ ...activeProfile, status: bulkStatus });
+            }
+            setBulkStatus("");
+        } catch (err) {
+            console.error("Error updating statuses:", err.response?.data || err);
+            alert("Could not update application statuses.");
+        } finally {
+            setBulkUpdating(false);
+        }
+    };
+
     const handleDownloadResume = async (applicationId) => {
         if (!applicationId) {
             alert("Cannot download resume right now.");
@@ -504,6 +545,44 @@ const RecruiterDashboard = () => {
                     </div>
                 </form>
 
+                {/* Bulk status change */}
+                {applications.length > 0 && (
+                    <div
+                        style={{
+                            display: "flex",
+                            gap: 8,
+                            alignItems: "center",
+                            justifyContent: "flex-end",
+                            marginBottom: 12,
+                            fontSize: 12,
+                            color: "#374151",
+                        }}
+                    >
+                        <span>Move all listed to</span>
+                        <select
+                            className="input"
+                            value={bulkStatus}
+                            onChange={(e) => setBulkStatus(e.target.value)}
+                            style={{ fontSize: 12, padding: "2px 6px", height: 28, width: 140 }}
+                        >
+                            <option value="">Choose status</option>
+                            <option value="applied">Applied</option>
+                            <option value="shortlisted">Shortlisted</option>
+                            <option value="selected">Selected</option>
+                            <option value="rejected">Rejected</option>
+                        </select>
+                        <button
+                            type="button"
+                            className="btn btn-outline"
+                            onClick={handleBulkStatusChange}
+                            disabled={!bulkStatus || bulkUpdating}
+                            style={{ fontSize: 12 }}
+                        >
+                            {bulkUpdating ? "Updating..." : "Update"}
+                        </button>
+                    </div>
+                )}
+
                 {error && (
                     <p style={{ color: "#b91c1c", fontSize: 13, marginBottom: 8 }}>
                         {error}
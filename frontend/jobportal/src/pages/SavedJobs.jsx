@@ -12,7 +12,7 @@ const SavedJobs = () => {
             try {
                 setError("");
                 const res = await getSavedJobs();
-                setSaved(res.data);
+                setSaved(Array.isArray(res.data) ? res.data : res.data.results || []);
             } catch (err) {
                 console.error(
                     "Error loading saved jobs:",